@@ -22,23 +22,54 @@
 6. 상세한 디버깅 로그 - 터미널 출력으로 흐름 추적
 """
 
+import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import logging
 import uuid
 import json
 import traceback
+import hashlib
+import inspect
+import functools
+from itertools import islice
+import threading
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterator, List, NamedTuple, Optional, Any, Union
 
-from config import API_CONFIG, TEST_CONFIG, get_index_system_prompt, get_index_config, get_index_rag_name
+from config import API_CONFIG, get_index_system_prompt, get_index_config, get_index_rag_name
+from cache_manager import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# JSON 직렬화 백엔드 선택 (orjson이 설치되어 있으면 사용, 없으면 표준 json)
+try:
+    import orjson  # 선택적 의존성: 요청 페이로드 인코딩/응답 디코딩 가속
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    def _dumps_sorted(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+
+    _loads = orjson.loads  # str/bytes 모두 입력 가능, 실패 시 json.JSONDecodeError 하위 예외
+except ImportError:
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+    def _dumps_sorted(data: Any) -> bytes:
+        return json.dumps(data, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+
+    _loads = json.loads
+
 # ========================================
 # 디버깅 설정
 # ========================================
 DEBUG_MODE = True  # False로 설정하면 상세 로그 비활성화
+WARMUP_ON_IMPORT = True  # 모듈 로드 시 백그라운드로 커넥션/토크나이저 예열
 
 def debug_print(message: str, data: Any = None, level: str = "INFO"):
     """
@@ -68,6 +99,119 @@ def debug_print(message: str, data: Any = None, level: str = "INFO"):
         print(f"{'='*80}\n")
 
 
+# ========================================
+# HTTP 세션 (keep-alive 커넥션 재사용)
+# ========================================
+def _create_session() -> requests.Session:
+    """
+    커넥션 풀과 재시도 정책이 적용된 requests.Session 생성
+
+    allowed_methods는 기본값(멱등 메서드)을 유지하므로 LLM/RAG POST 요청은 연결 실패
+    (요청 전송 전)에만 재시도됩니다. 읽기 타임아웃이나 502/503/504 응답에는 재시도하지 않아
+    오래 걸리는 생성 요청이 백엔드로 중복 전송되지 않습니다.
+    """
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False                 # 최종 응답은 기존 상태코드 처리 로직으로 전달
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+# RAG / LLM 서버가 서로 다른 호스트이므로 세션을 분리
+_LLM_SESSION = _create_session()
+_RAG_SESSION = _create_session()
+
+
+def _request_timeout(api_config: dict, default: float = 30) -> tuple:
+    """(연결, 읽기) 타임아웃 - 응답 없는 호스트에 스크립트 스레드가 읽기 제한 시간 전체만큼 묶이지 않도록 분리"""
+    return (api_config.get("connect_timeout", 5), api_config.get("timeout", default))
+
+
+# ========================================
+# 동일 요청 캐시 (exact-match)
+# ========================================
+# 새로고침/재클릭 등으로 완전히 같은 페이로드가 다시 들어오면 네트워크 호출 없이 반환
+_LLM_CACHE = TTLCache(maxsize=2048, ttl=300)
+_RAG_CACHE = TTLCache(maxsize=2048, ttl=300)
+
+
+def _request_cache_key(*parts) -> str:
+    """요청 구성요소를 정렬된 JSON으로 직렬화한 뒤 SHA-256 해시로 캐시 키 생성"""
+    return hashlib.sha256(_dumps_sorted(parts)).hexdigest()
+
+
+def _llm_cache_key(user_message, retrieve_data, chat_history=None, source_data=None, user_id=None,
+                   custom_system_prompt=None, chatbot_type="ae_wiki") -> str:
+    """LLM 요청 캐시 키 (call_llm_api / call_llm_api_stream 공통, 시간 정보는 제외)"""
+    history = chat_history or []
+    return _request_cache_key(
+        chatbot_type, user_message, custom_system_prompt,
+        retrieve_data, source_data, history[-20:]
+    )
+
+
+def _rag_cache_key(user_message, chatbot_type) -> str:
+    """RAG 요청 캐시 키"""
+    return _request_cache_key(chatbot_type, user_message)
+
+
+# ========================================
+# 동시 요청 병합 (single-flight)
+# ========================================
+# 여러 사용자가 같은 질문을 거의 동시에 보내면 첫 요청만 서버로 보내고 나머지는 그 결과를 공유
+_INFLIGHT: Dict[str, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _single_flight(key_fn):
+    """key_fn(호출 인자) 기준으로 진행 중인 동일 요청이 있으면 그 결과를 기다려 반환하는 데코레이터"""
+    def decorator(fn):
+        sig = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = key_fn(**bound.arguments)
+
+            with _INFLIGHT_LOCK:
+                future = _INFLIGHT.get(key)
+                is_leader = future is None
+                if is_leader:
+                    future = Future()
+                    _INFLIGHT[key] = future
+
+            if not is_leader:
+                debug_print("⏳ 동일 요청 진행 중 - 결과 공유 대기", {"function": fn.__name__})
+                return future.result()
+
+            try:
+                result = fn(*args, **kwargs)
+                future.set_result(result)
+                return result
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with _INFLIGHT_LOCK:
+                    _INFLIGHT.pop(key, None)
+
+        return wrapper
+    return decorator
+
+
+def cache_info() -> Dict[str, Dict[str, Any]]:
+    """LLM/RAG 요청 캐시 통계 반환 (관리/디버깅용)"""
+    return {"llm": _LLM_CACHE.info(), "rag": _RAG_CACHE.info()}
+
+
 def safe_get_nested(data, *path, default=None):
     """
     dict/list 모두 지원하는 안전한 중첩 데이터 추출 함수
@@ -138,7 +282,7 @@ def _extract_hits_from_rag_response(response, *, debug=False):
     반환: List[dict] (ES hit 객체 리스트)
     """
     try:
-        data = response.json()
+        data = _loads(response.content)
     except Exception:
         try:
             data = json.loads(response.text)
@@ -157,7 +301,7 @@ def _extract_hits_from_rag_response(response, *, debug=False):
     if isinstance(data, dict) and "message" in data:
         msg = data["message"]
         try:
-            inner = json.loads(msg) if isinstance(msg, str) else msg
+            inner = _loads(msg) if isinstance(msg, str) else msg
         except Exception:
             if debug:
                 print("[RAG] message 재파싱 실패:", type(msg), str(msg)[:300])
@@ -294,9 +438,288 @@ def _extract_llm_text(result, *, debug=False) -> str:
 # 주석: 이 함수는 하단의 통합된 format_source_citations 함수로 대체되었습니다.
 
 
+# ========================================
+# 토큰 수 추정 / 대화 기록 예산 패킹
+# ========================================
+_TOKEN_ENCODING = None
+_TOKEN_ENCODING_LOADED = False
+
+
+def _get_token_encoding():
+    """tiktoken 인코딩 지연 로드 (미설치/로드 실패 시 None → 문자 수 기반 근사치 사용)"""
+    global _TOKEN_ENCODING, _TOKEN_ENCODING_LOADED
+    if not _TOKEN_ENCODING_LOADED:
+        try:
+            import tiktoken
+            _TOKEN_ENCODING = tiktoken.get_encoding("o200k_base")
+        except Exception:
+            _TOKEN_ENCODING = None
+        _TOKEN_ENCODING_LOADED = True
+    return _TOKEN_ENCODING
+
+_LLM_MAX_TOKENS = API_CONFIG.get("llm_api", {}).get("max_tokens", 6000)
+_LLM_CONTEXT_WINDOW = API_CONFIG.get("llm_api", {}).get("context_window", 32768)
+_MESSAGE_OVERHEAD_TOKENS = 4  # role/구분자 등 메시지당 부가 토큰
+
+
+@functools.lru_cache(maxsize=4096)
+def _count_tokens(text: str) -> int:
+    """텍스트 토큰 수 (같은 메시지는 매 턴 다시 토큰화하지 않도록 캐시)"""
+    if not text:
+        return 0
+    encoding = _get_token_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    # 근사치: 한글은 대략 1자당 1토큰, 영문은 4자당 1토큰 수준 → 보수적으로 2자당 1토큰
+    return len(text) // 2 + 1
+
+
+def _message_tokens(message: dict) -> int:
+    content = message.get("content", "")
+    return _count_tokens(content if isinstance(content, str) else str(content)) + _MESSAGE_OVERHEAD_TOKENS
+
+
+# 대화 기록 role → LLM API role 매핑 (그 외 role은 전달하지 않음)
+ROLE_MAP = {"user": "user", "assistant": "assistant", "bot": "assistant"}
+
+
+def _pack_history(chat_history: list, budget: int, max_messages: int = 20) -> list:
+    """최신 대화부터 토큰 예산 안에 들어가는 메시지만 골라 시간순으로 반환 (role/content만 전달)"""
+    packed = []
+    used = 0
+    # 슬라이스 복사 없이 최신 메시지부터 최대 max_messages개만 순회
+    for message in islice(reversed(chat_history), max_messages):
+        role = ROLE_MAP.get(message.get("role"))
+        if role is None:
+            continue
+        cost = _message_tokens(message)
+        if used + cost > budget:
+            break
+        packed.append({"role": role, "content": message.get("content", "")})
+        used += cost
+    packed.reverse()
+    return packed
+
+
+# ========================================
+# RAG 문서 압축 (중복 제거 / 공통 머리말·꼬리말 제거 / 토큰 상한)
+# ========================================
+_COMPRESS_MIN_CHARS = 2048       # 이보다 짧으면 압축 생략
+_NEAR_DUP_THRESHOLD = 0.85       # 단어 3-gram Jaccard 유사도 기준
+_RETRIEVE_TOKEN_BUDGET = 4000    # LLM에 넘길 검색 문서 전체 토큰 상한
+_MIN_AFFIX_CHARS = 40            # 이보다 짧은 공통 접두/접미는 보일러플레이트로 보지 않음
+
+
+def _shingles(text: str) -> set:
+    words = text.split()
+    if len(words) < 3:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + 3]) for i in range(len(words) - 2)}
+
+
+def _strip_common_affixes(docs: List[str]) -> List[str]:
+    """모든 문서에 공통인 머리말/꼬리말(Confluence 헤더, 규격 서문 등)을 공백 경계 기준으로 제거"""
+    if len(docs) < 2:
+        return docs
+    prefix = os.path.commonprefix(docs)
+    prefix = prefix[:prefix.rfind(" ") + 1] if len(prefix) >= _MIN_AFFIX_CHARS else ""
+    suffix = os.path.commonprefix([d[::-1] for d in docs])[::-1]
+    suffix = suffix[suffix.find(" "):] if len(suffix) >= _MIN_AFFIX_CHARS and " " in suffix else ""
+    if not prefix and not suffix:
+        return docs
+    stripped = [d[len(prefix):len(d) - len(suffix)] for d in docs]
+    # 공통 부분을 빼고 나면 비는 문서가 있으면(문서 전체가 동일) 원본 유지
+    return stripped if all(x.strip() for x in stripped) else docs
+
+
+def _compress_documents(docs: List[str]) -> List[str]:
+    """LLM 입력용 검색 문서 압축 - 근접 중복 제거 후 토큰 예산 안으로 잘라냄"""
+    if sum(len(d) for d in docs) < _COMPRESS_MIN_CHARS:
+        return docs
+
+    docs = _strip_common_affixes(docs)
+
+    # 근접 중복 제거 (앞선 문서가 검색 점수가 높으므로 먼저 온 문서를 유지)
+    kept: List[str] = []
+    kept_shingles: List[set] = []
+    for doc in docs:
+        sh = _shingles(doc)
+        if any(len(sh & other) / (len(sh | other) or 1) >= _NEAR_DUP_THRESHOLD for other in kept_shingles):
+            continue
+        kept.append(doc)
+        kept_shingles.append(sh)
+
+    # 토큰 상한 (예산을 넘는 문서는 남은 예산만큼 문자 단위로 잘라냄)
+    packed: List[str] = []
+    remaining = _RETRIEVE_TOKEN_BUDGET
+    for doc in kept:
+        cost = _count_tokens(doc)
+        if cost <= remaining:
+            packed.append(doc)
+            remaining -= cost
+            continue
+        if remaining > 0:
+            packed.append(doc[:int(len(doc) * remaining / cost)])
+        break
+    return packed
+
+
+# ========================================
+# LLM 요청 구성 헬퍼
+# ========================================
+# 한국 시간대 (KST) - 요청마다 pytz 임포트/시간대 조회를 반복하지 않도록 한 번만 생성
+try:
+    import pytz
+    _KST = pytz.timezone('Asia/Seoul')
+except ImportError:
+    _KST = None
+
+
+def _build_llm_messages(
+    user_message: str,
+    retrieve_data: List[str],
+    chat_history: list = None,
+    source_data: List[dict] = None,
+    custom_system_prompt: str = None,
+    chatbot_type: str = "ae_wiki"
+) -> List[dict]:
+    """LLM 요청용 messages 배열 구성 (시스템 프롬프트 + 대화 기록 + RAG 문서/출처 포함 질문)"""
+    # 한국 시간 정보 생성
+    if _KST is not None:
+        current_time_kst = datetime.now(_KST)
+        korea_time_str = current_time_kst.strftime("%Y년 %m월 %d일 %H:%M:%S (한국시간)")
+        korea_date_str = current_time_kst.strftime("%Y년 %m월 %d일")
+    else:
+        # pytz가 없는 경우 기본 시간 사용
+        current_time = datetime.now()
+        korea_time_str = current_time.strftime("%Y년 %m월 %d일 %H:%M:%S")
+        korea_date_str = current_time.strftime("%Y년 %m월 %d일")
+
+    # STEP 1: 시스템 프롬프트 설정 (한국 시간 정보 추가)
+    system_prompt = custom_system_prompt or get_index_system_prompt(chatbot_type)
+
+    # 시스템 프롬프트에 한국 시간 정보 추가
+    system_prompt_with_time = f"""현재 시간: {korea_time_str}
+오늘 날짜: {korea_date_str}
+
+사용자가 "최근", "최신", "가장 최근" 등의 시간 관련 질문을 하면, 위의 현재 시간을 기준으로 판단하세요.
+
+{system_prompt}"""
+
+    debug_print("📝 시스템 프롬프트 로드 (한국 시간 포함)", {
+        "korea_time": korea_time_str,
+        "prompt_length": len(system_prompt_with_time),
+        "prompt_preview": system_prompt_with_time[:200] + "..."
+    })
+
+    # STEP 2: 검색된 문서들을 하나의 컨텍스트로 결합 (중복/보일러플레이트 제거 후)
+    if retrieve_data:
+        retrieve_data = _compress_documents(retrieve_data)
+        combined_context = "\n\n".join([f"문서 {i+1}:\n{doc}" for i, doc in enumerate(retrieve_data)])
+        debug_print("📚 검색 문서 결합 완료", {
+            "document_count": len(retrieve_data),
+            "total_length": len(combined_context)
+        })
+    else:
+        combined_context = "관련 문서를 찾을 수 없습니다."
+        debug_print("⚠️ 검색된 문서 없음", level="WARNING")
+
+    # STEP 3: 출처 정보를 포맷팅 (문제 3 해결 - source_data를 LLM에 반영)
+    source_citations = ""
+    if source_data:
+        source_citations = format_source_citations(source_data, chatbot_type)
+        debug_print("🔗 출처 정보 포맷팅 완료", {
+            "source_count": len(source_data),
+            "citations_length": len(source_citations)
+        })
+
+    # STEP 4: messages 배열 구성
+    messages = []
+
+    # 시스템 프롬프트 추가 (한국 시간 정보 포함)
+    messages.append({
+        "role": "system",
+        "content": system_prompt_with_time
+    })
+
+    # 현재 질문 구성 (RAG 문서 + 출처 정보 포함)
+    current_user_message = f"""[검색된 관련 문서]
+{combined_context}
+
+[현재 질문]
+{user_message}
+
+위의 검색된 문서를 참고하여 질문에 답변해주세요."""
+
+    # 출처 정보가 있으면 프롬프트에 추가 (문제 3 해결)
+    if source_citations:
+        current_user_message += f"\n\n{source_citations}"
+
+    # 이전 대화 기록 추가 (고정 비용 + 답변 예약분을 뺀 토큰 예산 안에서 최신순으로 채움)
+    if chat_history:
+        fixed_tokens = (_count_tokens(system_prompt_with_time) + _count_tokens(current_user_message)
+                        + 2 * _MESSAGE_OVERHEAD_TOKENS + _LLM_MAX_TOKENS)
+        recent_history = _pack_history(chat_history, _LLM_CONTEXT_WINDOW - fixed_tokens)
+        messages.extend(recent_history)
+        debug_print("💬 대화 기록 추가", {
+            "history_messages": len(recent_history),
+            "dropped_messages": min(len(chat_history), 20) - len(recent_history)
+        })
+
+    messages.append({
+        "role": "user",
+        "content": current_user_message
+    })
+
+    debug_print("📨 Messages 배열 구성 완료", {
+        "total_messages": len(messages),
+        "user_message_length": len(current_user_message)
+    })
+
+    return messages
+
+
+def _make_static_llm_headers(api_config: dict) -> dict:
+    """요청마다 변하지 않는 LLM 헤더 (모듈 로드 시 한 번만 구성)"""
+    headers_config = api_config.get("headers", {})
+    return {
+        "x-dep-ticket": api_config.get("credential_key", ""),
+        "Send-System-Name": headers_config.get("Send-System-Name", ""),
+        "User-Id": headers_config.get("User-Id", ""),
+        "User-Type": headers_config.get("User-Type", "AD_ID"),
+        "Content-Type": "application/json"
+    }
+
+
+_LLM_STATIC_HEADERS = _make_static_llm_headers(API_CONFIG.get("llm_api", {}))
+
+
+def _build_llm_headers(user_id: str = None, accept: str = "application/json") -> dict:
+    """LLM API 요청 헤더 구성 (고정 헤더 + 요청별 사용자/메시지 ID)"""
+    headers = dict(_LLM_STATIC_HEADERS)
+    if user_id:
+        headers["User-Id"] = user_id
+    # 요청당 UUID 하나만 생성하고 완료 메시지 ID는 접미사로 구분
+    msg_id = uuid.uuid4().hex
+    headers["Prompt-Msg-Id"] = msg_id
+    headers["Completion-Msg-Id"] = msg_id + "-c"
+    headers["Accept"] = accept
+    return headers
+
+
+def _citations_footer(source_data: List[dict], chatbot_type: str) -> str:
+    """답변 하단에 붙일 출처 섹션 (출처가 없으면 빈 문자열)"""
+    try:
+        citations_md = format_source_citations(source_data or [], chatbot_type)
+    except Exception:
+        citations_md = ""
+    return "\n\n---\n**출처**\n" + citations_md if citations_md else ""
+
+
 # ========================================
 # LLM API 호출 함수 (개선 버전)
 # ========================================
+@_single_flight(_llm_cache_key)
 def call_llm_api(
     user_message: str,
     retrieve_data: List[str],
@@ -339,97 +762,20 @@ def call_llm_api(
         "chat_history_count": len(chat_history) if chat_history else 0
     })
 
-    try:
-        # 한국 시간 정보 생성
-        from datetime import datetime
-        import pytz
-
-        try:
-            # 한국 시간대 (KST)
-            kst = pytz.timezone('Asia/Seoul')
-            current_time_kst = datetime.now(kst)
-            korea_time_str = current_time_kst.strftime("%Y년 %m월 %d일 %H:%M:%S (한국시간)")
-            korea_date_str = current_time_kst.strftime("%Y년 %m월 %d일")
-        except:
-            # pytz가 없는 경우 기본 시간 사용
-            current_time = datetime.now()
-            korea_time_str = current_time.strftime("%Y년 %m월 %d일 %H:%M:%S")
-            korea_date_str = current_time.strftime("%Y년 %m월 %d일")
-
-        # STEP 1: 시스템 프롬프트 설정 (한국 시간 정보 추가)
-        system_prompt = custom_system_prompt or get_index_system_prompt(chatbot_type)
-
-        # 시스템 프롬프트에 한국 시간 정보 추가
-        system_prompt_with_time = f"""현재 시간: {korea_time_str}
-오늘 날짜: {korea_date_str}
-
-사용자가 "최근", "최신", "가장 최근" 등의 시간 관련 질문을 하면, 위의 현재 시간을 기준으로 판단하세요.
-
-{system_prompt}"""
-
-        debug_print("📝 시스템 프롬프트 로드 (한국 시간 포함)", {
-            "korea_time": korea_time_str,
-            "prompt_length": len(system_prompt_with_time),
-            "prompt_preview": system_prompt_with_time[:200] + "..."
-        })
-
-        # STEP 2: 검색된 문서들을 하나의 컨텍스트로 결합
-        if retrieve_data:
-            combined_context = "\n\n".join([f"문서 {i+1}:\n{doc}" for i, doc in enumerate(retrieve_data)])
-            debug_print("📚 검색 문서 결합 완료", {
-                "document_count": len(retrieve_data),
-                "total_length": len(combined_context)
-            })
-        else:
-            combined_context = "관련 문서를 찾을 수 없습니다."
-            debug_print("⚠️ 검색된 문서 없음", level="WARNING")
-
-        # STEP 3: 출처 정보를 포맷팅 (문제 3 해결 - source_data를 LLM에 반영)
-        source_citations = ""
-        if source_data:
-            source_citations = format_source_citations(source_data, chatbot_type)
-            debug_print("🔗 출처 정보 포맷팅 완료", {
-                "source_count": len(source_data),
-                "citations_length": len(source_citations)
-            })
-
-        # STEP 4: messages 배열 구성
-        messages = []
-
-        # 시스템 프롬프트 추가 (한국 시간 정보 포함)
-        messages.append({
-            "role": "system",
-            "content": system_prompt_with_time
-        })
-
-        # 이전 대화 기록 추가
-        if chat_history:
-            recent_history = chat_history[-20:] if len(chat_history) > 20 else chat_history
-            messages.extend(recent_history)
-            debug_print("💬 대화 기록 추가", {"history_messages": len(recent_history)})
-
-        # 현재 질문 구성 (RAG 문서 + 출처 정보 포함)
-        current_user_message = f"""[검색된 관련 문서]
-{combined_context}
-
-[현재 질문]
-{user_message}
-
-위의 검색된 문서를 참고하여 질문에 답변해주세요."""
+    # 동일 요청 캐시 조회 (시간 정보는 키에서 제외)
+    cache_key = _llm_cache_key(user_message, retrieve_data, chat_history, source_data,
+                               custom_system_prompt=custom_system_prompt, chatbot_type=chatbot_type)
+    cached = _LLM_CACHE.get(cache_key)
+    if cached is not None:
+        debug_print("♻️ LLM 응답 캐시 적중", {"chatbot_type": chatbot_type})
+        return cached
 
-        # 출처 정보가 있으면 프롬프트에 추가 (문제 3 해결)
-        if source_citations:
-            current_user_message += f"\n\n{source_citations}"
-
-        messages.append({
-            "role": "user",
-            "content": current_user_message
-        })
-
-        debug_print("📨 Messages 배열 구성 완료", {
-            "total_messages": len(messages),
-            "user_message_length": len(current_user_message)
-        })
+    try:
+        # STEP 1~4: 시스템 프롬프트(한국 시간 포함), RAG 문서, 출처, 대화 기록으로 messages 구성
+        messages = _build_llm_messages(
+            user_message, retrieve_data, chat_history, source_data,
+            custom_system_prompt, chatbot_type
+        )
 
         # STEP 5: API 호출 설정
         api_config = API_CONFIG.get("llm_api", {})
@@ -440,28 +786,14 @@ def call_llm_api(
         if not base_url:
             raise ValueError("LLM API base_url이 설정되지 않았습니다.")
 
-        # 헤더 구성
-        headers_config = api_config.get("headers", {})
-
-        # 문제 2 해결: 스트리밍 비활성화 시 Accept를 application/json으로 변경
-        accept_header = "application/json"  # stream=False이므로 JSON으로 변경
-
-        headers = {
-            "x-dep-ticket": api_config.get("credential_key", ""),
-            "Send-System-Name": headers_config.get("Send-System-Name", ""),
-            "User-Id": user_id or headers_config.get("User-Id", ""),
-            "User-Type": headers_config.get("User-Type", "AD_ID"),
-            "Prompt-Msg-Id": str(uuid.uuid4()),
-            "Completion-Msg-Id": str(uuid.uuid4()),
-            "Accept": accept_header,  # 문제 2 해결
-            "Content-Type": "application/json"
-        }
+        # 헤더 구성 (문제 2 해결: 스트리밍 비활성화 시 Accept를 application/json으로 사용)
+        headers = _build_llm_headers(user_id, accept="application/json")
 
         payload = {
             "model": api_config.get("model", "openai/gpt-oss-120b"),
             "messages": messages,
             "temperature": 0.1,
-            "max_tokens": 6000,
+            "max_tokens": _LLM_MAX_TOKENS,
             "stream": False
         }
 
@@ -477,23 +809,23 @@ def call_llm_api(
         # STEP 6: API 호출 실행
         debug_print("🌐 LLM API 호출 중...")
 
-        response = requests.post(
+        response = _LLM_SESSION.post(
             base_url,
             headers=headers,
-            json=payload,
-            timeout=30
+            data=_dumps(payload),
+            timeout=_request_timeout(api_config)
         )
 
         debug_print("📥 LLM API 응답 수신", {
             "status_code": response.status_code,
             "headers": dict(response.headers),
-            "response_length": len(response.text) if response.text else 0
+            "response_length": len(response.content) if response.content else 0  # 본문 전체를 str로 재디코딩하지 않음
         })
 
         # STEP 7: 응답 처리 (범용 파서 사용)
         if response.status_code == 200:
             try:
-                result = response.json()
+                result = _loads(response.content)
 
                 # 관찰용: choices[0] 구조
                 try:
@@ -512,16 +844,9 @@ def call_llm_api(
                         "content_preview": content[:200] + "..." if len(content) > 200 else content
                     })
 
-                    # 출처 데이터 추가
-                    citations_source = source_data or []
-
                     # 하단 출처 섹션 생성 및 붙이기
-                    try:
-                        citations_md = format_source_citations(citations_source, chatbot_type)
-                    except Exception:
-                        citations_md = ""
-
-                    final_answer = content + ("\n\n---\n**출처**\n" + citations_md if citations_md else "")
+                    final_answer = content + _citations_footer(source_data, chatbot_type)
+                    _LLM_CACHE.set(cache_key, final_answer)
                     return final_answer
 
                 # content 못 찾은 경우: 폴백 처리
@@ -554,13 +879,7 @@ def call_llm_api(
                     content = f"(LLM 응답 요약: {hint})"
 
                     # 출처 붙이기
-                    citations_source = source_data or []
-                    try:
-                        citations_md = format_source_citations(citations_source, chatbot_type)
-                    except Exception:
-                        citations_md = ""
-
-                    final_answer = content + ("\n\n---\n**출처**\n" + citations_md if citations_md else "")
+                    final_answer = content + _citations_footer(source_data, chatbot_type)
                     return final_answer
 
                 except Exception:
@@ -599,9 +918,146 @@ def call_llm_api(
         raise Exception(f"LLM API 예상치 못한 예외 [{type(e).__name__}]: {str(e)}")
 
 
+# ========================================
+# LLM API 스트리밍 호출 함수 (SSE)
+# ========================================
+def call_llm_api_stream(
+    user_message: str,
+    retrieve_data: List[str],
+    chat_history: list = None,
+    source_data: List[dict] = None,
+    user_id: str = None,
+    custom_system_prompt: str = None,
+    chatbot_type: str = "ae_wiki"
+) -> Iterator[str]:
+    """
+    🎯 목적: call_llm_api의 스트리밍 버전 - 토큰이 도착하는 대로 텍스트 조각을 yield
+
+    📊 입력: call_llm_api와 동일
+
+    📤 출력:
+    - Iterator[str]: 답변 텍스트 조각 (마지막 조각은 출처 섹션)
+
+    ⚡ 특징:
+    - stream=True + SSE(data: ...) 라인 단위 파싱으로 첫 토큰까지의 대기 시간 단축
+    - 완성된 답변은 call_llm_api와 같은 요청 캐시에 저장되어 재요청 시 한 번에 반환
+    """
+    cache_key = _llm_cache_key(user_message, retrieve_data, chat_history, source_data,
+                               custom_system_prompt=custom_system_prompt, chatbot_type=chatbot_type)
+    cached = _LLM_CACHE.get(cache_key)
+    if cached is not None:
+        debug_print("♻️ LLM 응답 캐시 적중 (스트리밍)", {"chatbot_type": chatbot_type})
+        yield cached
+        return
+
+    messages = _build_llm_messages(
+        user_message, retrieve_data, chat_history, source_data,
+        custom_system_prompt, chatbot_type
+    )
+
+    api_config = API_CONFIG.get("llm_api", {})
+    if not api_config:
+        raise ValueError("API_CONFIG에 'llm_api' 설정이 없습니다.")
+    base_url = api_config.get("base_url")
+    if not base_url:
+        raise ValueError("LLM API base_url이 설정되지 않았습니다.")
+
+    headers = _build_llm_headers(user_id, accept="text/event-stream")
+    payload = {
+        "model": api_config.get("model", "openai/gpt-oss-120b"),
+        "messages": messages,
+        "temperature": 0.1,
+        "max_tokens": _LLM_MAX_TOKENS,
+        "stream": True
+    }
+
+    debug_print("🌐 LLM API 스트리밍 호출 중...", {"url": base_url, "model": payload["model"]})
+
+    chunks: List[str] = []
+    try:
+        with _LLM_SESSION.post(base_url, headers=headers, data=_dumps(payload),
+                               timeout=_request_timeout(api_config), stream=True) as response:
+            if response.status_code != 200:
+                error_msg = f"❌ LLM API 스트리밍 호출 실패\n\nHTTP Status: {response.status_code}\nReason: {response.reason}\n\n응답 본문:\n{response.text[:1000]}"
+                debug_print(error_msg, level="ERROR")
+                logger.error(error_msg)
+                raise requests.HTTPError(f"LLM API 호출 실패 - Status: {response.status_code}, Reason: {response.reason}, Body: {response.text[:500]}")
+
+            # text/event-stream은 charset이 없으면 ISO-8859-1로 추정되므로 한글 깨짐 방지
+            response.encoding = "utf-8"
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                try:
+                    event = _loads(data)
+                except ValueError:
+                    continue
+                delta = safe_get_nested(event, "choices", 0, "delta", "content")
+                if isinstance(delta, str) and delta:
+                    chunks.append(delta)
+                    yield delta
+
+    except requests.Timeout as e:
+        error_msg = f"❌ LLM API 스트리밍 타임아웃\n\n예외: {str(e)}"
+        debug_print(error_msg, level="ERROR")
+        logger.error(error_msg)
+        raise TimeoutError(f"LLM API 타임아웃: {str(e)}")
+
+    footer = _citations_footer(source_data, chatbot_type)
+    if footer:
+        yield footer
+
+    if chunks:
+        _LLM_CACHE.set(cache_key, "".join(chunks) + footer)
+    debug_print("✅ LLM 스트리밍 완료", {"chunk_count": len(chunks)})
+
+
+# ========================================
+# RAG 출처 정보 레코드
+# ========================================
+class SourceInfo(NamedTuple):
+    """RAG 검색 결과 1건의 출처 정보 (고정 필드 - dict보다 가볍고 속성 접근이 빠름)"""
+    title: str
+    doc_id: str
+    score: float
+    index: str
+    source_url: str = ""
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """dict 형태 출처를 기대하는 기존 호출부 호환용"""
+        return getattr(self, key, default) if key in self._fields else default
+
+
+# RAG 응답에서 URL/ID 키는 절대 제외하지 않도록 필터링
+_RAG_PROTECTED_FIELDS = frozenset({"source_url", "url", "doc_url", "link", "doc_id", "_id"})
+
+
+def _make_static_rag_headers(api_config: dict) -> dict:
+    """요청마다 변하지 않는 RAG 헤더 (모듈 로드 시 한 번만 구성)"""
+    return {
+        "Content-Type": "application/json",
+        "x-dep-ticket": api_config.get("credential_key", ""),
+        "api-key": api_config.get("api-key", "")
+    }
+
+
+def _make_rag_fields_exclude(api_config: dict) -> List[str]:
+    """페이로드의 fields_exclude 목록 (보호 필드 제외, 모듈 로드 시 한 번만 구성)"""
+    raw_exclude = api_config.get("fields_exclude", ["v_merge_title_content"])
+    return [k for k in raw_exclude if k not in _RAG_PROTECTED_FIELDS]
+
+
+_RAG_STATIC_HEADERS = _make_static_rag_headers(API_CONFIG.get("rag_api_common", {}))
+_RAG_FIELDS_EXCLUDE = _make_rag_fields_exclude(API_CONFIG.get("rag_api_common", {}))
+
+
 # ========================================
 # RAG API 호출 함수 (개선 버전)
 # ========================================
+@_single_flight(_rag_cache_key)
 def call_rag_api_with_chatbot_type(user_message: str, chatbot_type: str) -> dict:
     """
     🎯 목적: 챗봇 타입별 RAG API 호출하여 관련 문서 검색
@@ -624,6 +1080,12 @@ def call_rag_api_with_chatbot_type(user_message: str, chatbot_type: str) -> dict
         "chatbot_type": chatbot_type
     })
 
+    cache_key = _rag_cache_key(user_message, chatbot_type)
+    cached = _RAG_CACHE.get(cache_key)
+    if cached is not None:
+        debug_print("♻️ RAG 결과 캐시 적중", {"chatbot_type": chatbot_type})
+        return cached
+
     try:
         # STEP 1: 챗봇별 인덱스명 매핑
         index_name = get_index_rag_name(chatbot_type)
@@ -650,9 +1112,8 @@ def call_rag_api_with_chatbot_type(user_message: str, chatbot_type: str) -> dict
         # 페이로드 구성 (스펙 준수)
         index_name = (index_name or "").strip()
 
-        # URL/ID 키는 절대 제외하지 않도록 필터링
-        _raw_exclude = api_config.get("fields_exclude", ["v_merge_title_content"])
-        fields_exclude = [k for k in _raw_exclude if k not in {"source_url", "url", "doc_url", "link", "doc_id", "_id"}]
+        # URL/ID 키를 걸러낸 fields_exclude (모듈 로드 시 구성한 목록 재사용)
+        fields_exclude = _RAG_FIELDS_EXCLUDE
 
         payload = {
             "index_name": index_name,
@@ -667,12 +1128,8 @@ def call_rag_api_with_chatbot_type(user_message: str, chatbot_type: str) -> dict
         print(f"[RAG] permission_groups={api_config.get('auth_list', [])}")
         print(f"[RAG] fields_exclude={fields_exclude}")
 
-        # 헤더 구성
-        headers = {
-            "Content-Type": "application/json",
-            "x-dep-ticket": api_config.get("credential_key", ""),
-            "api-key": api_config.get("api-key", "")
-        }
+        # 헤더 구성 (고정 헤더 - 요청 간 변경 없음)
+        headers = _RAG_STATIC_HEADERS
 
         debug_print("📤 RAG API 요청 준비", {
             "url": base_url,
@@ -685,17 +1142,17 @@ def call_rag_api_with_chatbot_type(user_message: str, chatbot_type: str) -> dict
         # STEP 3: API 호출 실행
         debug_print("🌐 RAG API 호출 중...")
 
-        response = requests.post(
+        response = _RAG_SESSION.post(
             base_url,
             headers=headers,
-            json=payload,
-            timeout=api_config.get("timeout", 30)
+            data=_dumps(payload),
+            timeout=_request_timeout(api_config)
         )
 
         debug_print("📥 RAG API 응답 수신", {
             "status_code": response.status_code,
             "headers": dict(response.headers),
-            "response_length": len(response.text) if response.text else 0
+            "response_length": len(response.content) if response.content else 0  # 본문 전체를 str로 재디코딩하지 않음
         })
 
         # STEP 4: 응답 처리 (범용 파서 사용)
@@ -703,10 +1160,12 @@ def call_rag_api_with_chatbot_type(user_message: str, chatbot_type: str) -> dict
             try:
                 # 포맷 변화에 안전한 파서
                 hits = _extract_hits_from_rag_response(response, debug=True)
+                # 서버가 요청보다 많은 후보를 돌려줘도 상위 num_result_doc개만 처리
+                hits = hits[:payload["num_result_doc"]]
                 debug_print("📄 검색 결과 파싱", {"hit_count": len(hits)})
 
                 documents: List[str] = []
-                source_info: List[dict] = []
+                source_info: List[SourceInfo] = []
 
                 # 콘텐츠/제목/URL 후보 키
                 CONTENT_KEYS = ["content", "merge_title_content", "v_merge_title_content", "body", "text"]
@@ -737,18 +1196,18 @@ def call_rag_api_with_chatbot_type(user_message: str, chatbot_type: str) -> dict
 
                     documents.append(content)
 
-                    si = {
-                        "title": title,
-                        "doc_id": doc_id,
-                        "score": hit.get("_score", 0),
-                        "index": index_name,
-                        "source_url": url
-                    }
+                    si = SourceInfo(
+                        title=title,
+                        doc_id=doc_id,
+                        score=hit.get("_score", 0),
+                        index=index_name,
+                        source_url=url
+                    )
                     source_info.append(si)
 
                     # 디버그 로그
                     try:
-                        print(f"[RAG][{i}] source_info =", json.dumps(si, ensure_ascii=False))
+                        print(f"[RAG][{i}] source_info =", json.dumps(si._asdict(), ensure_ascii=False))
                     except Exception as _e:
                         print(f"[RAG][{i}] source_info(print 실패):", repr(_e))
 
@@ -757,10 +1216,13 @@ def call_rag_api_with_chatbot_type(user_message: str, chatbot_type: str) -> dict
                     "sources_count": len(source_info)
                 })
 
-                return {
+                result = {
                     "documents": documents if documents else ["관련 문서를 찾을 수 없습니다."],
                     "source_info": source_info
                 }
+                if documents:
+                    _RAG_CACHE.set(cache_key, result)
+                return result
 
             except json.JSONDecodeError as e:
                 error_msg = f"❌ JSON 파싱 실패: {str(e)}\n\n원본 응답 텍스트:\n{response.text[:1000]}"
@@ -796,7 +1258,43 @@ def call_rag_api_with_chatbot_type(user_message: str, chatbot_type: str) -> dict
 # ========================================
 # 출처 정보 포맷팅 함수
 # ========================================
-def format_source_citations(source_data: List[dict], chatbot_type: str = "ae_wiki") -> str:
+# URL 후보 필드 (우선순위 순)
+_CITATION_URL_KEYS = ("source_url", "url", "confluence_url", "doc_url", "link")
+
+
+def _format_citation(i: int, source: Union[SourceInfo, dict]) -> str:
+    """출처 1건을 마크다운 한 줄로 변환 (URL이 있으면 클릭 가능한 링크)"""
+    # RAG 검색 결과(SourceInfo)는 필드가 고정이므로 속성으로 바로 접근
+    if isinstance(source, SourceInfo):
+        url = source.source_url or (f"{CONFLUENCE_BASE}{source.doc_id}" if source.doc_id else "")
+        return f"{i}. [{source.title}]({url})" if url and url.strip() else f"{i}. {source.title}"
+
+    # 제목 추출
+    title = source.get("title", source.get("source", f"문서 {i}"))
+
+    # URL 추출 (다양한 필드명 지원), 없으면 doc_id로 Confluence URL 생성
+    url = next((source[k] for k in _CITATION_URL_KEYS if source.get(k)), "")
+    if not url and source.get("doc_id"):
+        url = f"{CONFLUENCE_BASE}{source['doc_id']}"
+
+    citation = f"{i}. [{title}]({url})" if url and url.strip() else f"{i}. {title}"
+
+    # 날짜 정보 추가
+    last_modified = source.get("last_modified", "")
+    if last_modified:
+        citation += f" (수정일: {last_modified})"
+    return citation
+
+
+# 챗봇 타입별 출처 포맷터 (타입 전용 형식이 필요하면 여기에 등록)
+_CITATION_FORMATTERS = {
+    "ae_wiki": _format_citation,
+    "glossary": _format_citation,
+    "jedec": _format_citation,
+}
+
+
+def format_source_citations(source_data: List[Union[SourceInfo, dict]], chatbot_type: str = "ae_wiki") -> str:
     """
     🎯 목적: 챗봇별 출처 정보를 클릭 가능한 하이퍼링크 형식으로 포맷팅
 
@@ -810,41 +1308,27 @@ def format_source_citations(source_data: List[dict], chatbot_type: str = "ae_wik
     if not source_data:
         return ""
 
-    citations = []
-
-    for i, source in enumerate(source_data, 1):
-        # 제목 추출
-        title = source.get("title", source.get("source", f"문서 {i}"))
+    fmt = _CITATION_FORMATTERS.get(chatbot_type, _format_citation)
+    citations = [fmt(i, source) for i, source in enumerate(source_data, 1)]
+    return "\n\n**📚 참고 자료:**\n" + "\n".join(citations)
 
-        # URL 추출 (다양한 필드명 지원)
-        url = (source.get("source_url") or
-               source.get("url") or
-               source.get("confluence_url") or
-               source.get("doc_url") or
-               source.get("link") or "")
 
-        # doc_id가 있고 URL이 없으면 Confluence URL 생성
-        if not url and source.get("doc_id"):
-            url = f"{CONFLUENCE_BASE}{source['doc_id']}"
-
-        # 날짜 정보 추출
-        last_modified = source.get("last_modified", "")
-
-        # 마크다운 링크 생성 (클릭 가능한 형식)
-        if url and url.strip():
-            # URL이 있으면 클릭 가능한 하이퍼링크로 표시
-            citation = f"{i}. [{title}]({url})"
-            if last_modified:
-                citation += f" (수정일: {last_modified})"
-        else:
-            # URL이 없으면 일반 텍스트로 표시
-            citation = f"{i}. {title}"
-            if last_modified:
-                citation += f" (수정일: {last_modified})"
+# ========================================
+# 콜드 스타트 예열 (백그라운드)
+# ========================================
+def _warmup():
+    """첫 질문 전에 LLM/RAG 커넥션 수립과 토크나이저 로드를 미리 수행"""
+    _get_token_encoding()
+    for session, api_key in ((_LLM_SESSION, "llm_api"), (_RAG_SESSION, "rag_api_common")):
+        base_url = API_CONFIG.get(api_key, {}).get("base_url")
+        if not base_url:
+            continue
+        try:
+            # 응답 코드와 무관하게 커넥션이 풀에 남아 첫 요청의 핸드셰이크를 생략
+            session.head(base_url, timeout=2)
+        except Exception as e:
+            logger.debug(f"API 예열 실패 ({api_key}): {e}")
 
-        citations.append(citation)
 
-    if citations:
-        return "\n\n**📚 참고 자료:**\n" + "\n".join(citations)
-    else:
-        return ""
+if WARMUP_ON_IMPORT:
+    threading.Thread(target=_warmup, name="api-warmup", daemon=True).start()
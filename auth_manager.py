@@ -22,6 +22,8 @@ AE WIKI 통합 챗봇 시스템 - 인증 관리 모듈 (auth_manager.py)
 - data_manager.py: 사용자 데이터 관리
 """
 
+import os
+import warnings
 import streamlit as st
 import logging
 from typing import Dict, Any, Optional, Tuple
@@ -30,19 +32,67 @@ from datetime import datetime
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 통합 사용자 관리 모듈 (함수 호출마다 import하지 않도록 모듈 로드 시 한 번만)
+try:
+    from user_manager import (
+        USERS_FILE,
+        get_all_active_users,
+        verify_user_password,
+        authenticate_user,
+        get_active_user,
+        is_admin_user
+    )
+except ImportError as e:
+    logger.error(f"사용자 관리 모듈 로드 실패: {e}")
+    USERS_FILE = ""
+    def get_all_active_users():
+        return {}
+    def verify_user_password(username, password):
+        return False
+    def authenticate_user(username, password):
+        return False, "사용자 관리 모듈을 사용할 수 없습니다", None
+    def get_active_user(username):
+        return None
+    def is_admin_user(username):
+        return False
+
 # ====================================
 # 🔐 기본 인증 시스템
 # ====================================
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_active_user(username: str, users_file_mtime: float) -> Optional[Dict]:
+    """
+    활성 사용자 프로필 조회 캐시
+
+    한 번의 페이지 렌더링 중 get_current_user() 등이 같은 사용자를 여러 번
+    조회하므로 결과를 캐시합니다. users_file_mtime이 캐시 키에 포함되어
+    사용자 파일이 변경되면 자동으로 다시 조회합니다. 비밀번호 해시는 캐시하지 않습니다.
+    """
+    user_info = get_active_user(username)
+    if not user_info:
+        return None
+    return {key: value for key, value in user_info.items() if key != "password"}
+
+def _get_active_user_profile(username: str) -> Optional[Dict]:
+    """캐시를 거쳐 활성 사용자 프로필 조회"""
+    try:
+        users_file_mtime = os.path.getmtime(USERS_FILE)
+    except OSError:
+        users_file_mtime = 0.0
+    return _cached_active_user(username, users_file_mtime)
+
 def get_users_from_secrets():
     """
     통합 사용자 관리 시스템에서 사용자 정보 로드
 
+    user_manager의 mtime 기반 캐시를 그대로 사용하므로 파일이 바뀌지 않았다면
+    재파싱 없이 반환되며, 파일이 변경되면 즉시 최신 데이터가 반환됩니다.
+
     Returns:
-        Dict: 사용자 정보 딕셔너리
+        Dict: 사용자 정보 딕셔너리 (캐시와 공유되므로 읽기 전용으로 사용)
     """
     try:
-        from user_manager import get_all_active_users
         return get_all_active_users()
     except Exception as e:
         logger.error(f"사용자 정보 로드 실패: {e}")
@@ -60,7 +110,6 @@ def verify_password(username: str, password: str) -> bool:
         bool: 인증 성공 여부
     """
     try:
-        from user_manager import verify_user_password
         return verify_user_password(username, password)
     except Exception as e:
         logger.error(f"비밀번호 확인 실패: {e}")
@@ -78,7 +127,6 @@ def simple_login(username: str, password: str) -> Tuple[bool, str, dict]:
         tuple: (성공여부, 메시지, 사용자정보)
     """
     try:
-        from user_manager import authenticate_user
         success, message, user_data = authenticate_user(username, password)
         if success and user_data:
             # 호환성을 위해 필요한 필드들 매핑
@@ -101,6 +149,19 @@ def simple_login(username: str, password: str) -> Tuple[bool, str, dict]:
 # 📊 세션 상태 관리
 # ====================================
 
+def _auth_snapshot() -> Tuple[bool, Optional[str]]:
+    """
+    로그인 플래그와 auth_user를 한 번에 조회
+
+    st.session_state 접근은 프록시를 거치므로 여러 함수에서 같은 키를 반복 조회하지 않도록
+    필요한 값을 한 번에 읽어 반환합니다.
+
+    Returns:
+        tuple: (logged_in 플래그, auth_user)
+    """
+    state = st.session_state
+    return state.get("logged_in") is True, state.get("auth_user")
+
 def is_logged_in() -> bool:
     """
     간단한 인증 시스템 기반 로그인 상태 확인
@@ -113,10 +174,8 @@ def is_logged_in() -> bool:
             - False: 미인증 상태 (로그인 필요)
     """
     # 간단한 세션 상태 확인
-    return (
-        st.session_state.get("logged_in") == True and
-        st.session_state.get("auth_user") is not None
-    )
+    logged_in, auth_user = _auth_snapshot()
+    return logged_in and auth_user is not None
 
 def setup_session_after_login(username: str, name: str):
     """
@@ -146,8 +205,7 @@ def setup_session_after_login(username: str, name: str):
 
     try:
         # 통합 사용자 관리 시스템에서 추가 사용자 정보 로드
-        from user_manager import get_active_user
-        user_info = get_active_user(username)
+        user_info = _get_active_user_profile(username)
         if user_info:
             st.session_state["auth_knox_id"] = user_info.get("knox_id", username)
             st.session_state["auth_department"] = user_info.get("department", "기타")
@@ -185,25 +243,38 @@ def logout_user() -> None:
 
     logger.info("로그아웃 - 모든 세션 정리 완료")
 
+# 사용 중단 경고를 이미 출력한 호환성 함수 이름
+_DEPRECATION_WARNED = set()
+
+def _warn_deprecated(name: str) -> None:
+    """호환성 함수 사용 중단 경고 (함수별로 한 번만)"""
+    if name not in _DEPRECATION_WARNED:
+        _DEPRECATION_WARNED.add(name)
+        warnings.warn(
+            f"{name}()는 더 이상 필요하지 않으며 향후 제거될 예정입니다.",
+            DeprecationWarning,
+            stacklevel=3
+        )
+
 def initialize_session_state() -> None:
     """
-    세션 상태 초기화 (호환성 함수)
+    세션 상태 초기화 (호환성 함수, 사용 중단)
 
     순수 인증 시스템에서는 별도의 초기화가 필요하지 않습니다.
     기존 코드와의 호환성을 위해 유지되는 함수입니다.
     """
-    # 순수 인증 시스템에서는 별도 세션 초기화 불필요
-    pass
+    _warn_deprecated("initialize_session_state")
 
 def restore_login_from_storage() -> bool:
     """
-    브라우저 저장소에서 로그인 정보 복원 (호환성 함수)
+    브라우저 저장소에서 로그인 정보 복원 (호환성 함수, 사용 중단)
 
     순수 인증 시스템에서는 세션 기반 인증을 사용하므로
     별도의 브라우저 저장소 복원이 필요하지 않습니다.
 
     기존 코드 호환성을 위해 유지하되, 항상 False를 반환합니다.
     """
+    _warn_deprecated("restore_login_from_storage")
     return False  # 순수 인증 시스템에서는 불필요
 
 # ====================================
@@ -262,19 +333,15 @@ def get_current_user() -> Optional[Dict]:
     Returns:
         Optional[Dict]: 사용자 프로필 정보 또는 None (미로그인)
     """
-    if not is_logged_in():
+    logged_in, auth_user = _auth_snapshot()
+    if not logged_in or not auth_user:
         return None
 
-    auth_user = st.session_state.get("auth_user")
     auth_name = st.session_state.get("auth_name")
 
-    if not auth_user:
-        return None
-
     # 통합 사용자 관리 시스템에서 사용자 정보 조회
     try:
-        from user_manager import get_active_user
-        user_info = get_active_user(auth_user)
+        user_info = _get_active_user_profile(auth_user)
         if user_info:
             return {
                 "user_id": user_info.get('user_id', auth_user),
@@ -352,12 +419,11 @@ def check_admin() -> bool:
     Returns:
         bool: 관리자 권한 여부
     """
-    if not is_logged_in():
+    logged_in, username = _auth_snapshot()
+    if not logged_in or username is None:
         return False
 
     try:
-        from user_manager import is_admin_user
-        username = get_user_id()
         return is_admin_user(username)
     except Exception as e:
         logger.error(f"관리자 권한 확인 실패: {e}")
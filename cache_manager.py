@@ -0,0 +1,116 @@
+"""
+=================================================================
+🗃️ AE WIKI - 응답 캐시 모듈 (cache_manager.py)
+=================================================================
+
+📋 파일 역할:
+- 챗봇 응답(RAG + LLM 결과)을 프로세스 메모리에 TTL/LRU 방식으로 캐싱
+- 동일하거나 표기만 다른 질문(대소문자, 유니코드 표기, 공백 차이)에 대해
+  RAG/LLM 네트워크 왕복을 생략
+
+🔗 주요 컴포넌트:
+- TTLCache: 스레드 안전한 TTL + LRU 캐시
+- normalize_query: 질문 정규화 (캐시 키 생성용)
+- history_fingerprint: 대화 윈도우 해시
+
+🔄 연동 관계:
+- utils.py: get_chatbot_response() 에서 응답 캐시 조회/저장
+"""
+
+import re
+import time
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+# 정규화 시 축약할 연속 공백 패턴
+_SPACE_RE = re.compile(r"\s+")
+
+# 캐시 미스 판별용 센티널
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    🎯 TTL + LRU 캐시
+
+    - maxsize 초과 시 가장 오래 사용되지 않은 항목부터 제거
+    - ttl(초)이 지난 항목은 조회 시점에 만료 처리
+    - Streamlit 다중 세션(스레드)에서 공유되므로 RLock으로 보호
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """캐시 조회 (만료된 항목은 제거 후 미스 처리)"""
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING or item[0] <= now:
+                if item is not _MISSING:
+                    del self._data[key]
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return item[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """캐시 저장 (용량 초과 시 LRU 항목 제거)"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """캐시 전체 비우기"""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> Dict[str, Any]:
+        """캐시 통계 (관리/디버깅용)"""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+            }
+
+
+def normalize_query(text: str) -> str:
+    """
+    질문 정규화: 유니코드 NFKC 정규화, 소문자화, 연속 공백 축약
+
+    문장부호는 의미를 바꿀 수 있으므로("C++" / "C#", "2.5%") 그대로 유지합니다.
+    캐시는 사용자 간에 공유되므로 서로 다른 질문이 같은 키가 되지 않도록 합니다.
+    """
+    if not isinstance(text, str):
+        return ""
+    text = unicodedata.normalize("NFKC", text).lower()
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def history_fingerprint(chat_history: Optional[List[Dict]], window: int = 20) -> str:
+    """최근 대화 윈도우의 해시 (대화 맥락이 다르면 캐시를 공유하지 않도록)"""
+    if not chat_history:
+        return ""
+    h = hashlib.sha256()
+    for msg in chat_history[-window:]:
+        h.update(str(msg.get("role", "")).encode("utf-8"))
+        h.update(b"\x1f")
+        h.update(str(msg.get("content", "")).encode("utf-8"))
+        h.update(b"\x1e")
+    return h.hexdigest()
@@ -16,11 +16,11 @@
 
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 
 from auth_manager import get_current_user, get_user_id, get_username
-from data_manager import save_data
+from data_manager import save_data, save_logs, append_chat_history, append_search_log, now_str
 
 logger = logging.getLogger(__name__)
 
@@ -37,8 +37,8 @@ def save_chat_history(data: Dict, user_message: str, bot_response: str, chatbot_
     🔄 처리 흐름:
     1. 사용자 정보 확인
     2. 채팅 기록 구조화
-    3. 슬라이딩 윈도우 적용 (최대 500개 대화)
-    4. 데이터 저장
+    3. 슬라이딩 윈도우 적용 (최대 CHAT_HISTORY_MAX개 대화)
+    4. 데이터 배치 저장 (save_logs)
     """
 
     try:
@@ -54,7 +54,7 @@ def save_chat_history(data: Dict, user_message: str, bot_response: str, chatbot_
         # STEP 2: 채팅 기록 구조화
         chat_entry = {
             "id": f"chat_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": now_str(),
             "user_id": user_id,
             "username": username,
             "chatbot_type": chatbot_type,
@@ -64,22 +64,11 @@ def save_chat_history(data: Dict, user_message: str, bot_response: str, chatbot_
             "response_length": len(bot_response)
         }
 
-        # STEP 3: 채팅 기록을 데이터에 추가
-        if "chat_history" not in data:
-            data["chat_history"] = []
-
-        data["chat_history"].append(chat_entry)
-
-        # STEP 4: 슬라이딩 윈도우 적용 (최대 500개 대화 유지)
-        # 메모리 효율성을 위해 오래된 채팅 기록 자동 삭제
-        max_chat_history = 500
-        if len(data["chat_history"]) > max_chat_history:
-            # 최신 500개만 유지
-            data["chat_history"] = data["chat_history"][-max_chat_history:]
-            logger.info(f"채팅 기록 슬라이딩 윈도우 적용: {max_chat_history}개로 제한")
+        # STEP 3~4: 채팅 기록 추가 (deque 슬라이딩 윈도우 - 초과 시 가장 오래된 기록 자동 삭제)
+        append_chat_history(data, chat_entry)
 
-        # STEP 5: 데이터 저장
-        save_data(data)
+        # STEP 5: 데이터 저장 (배치 저장 - 일정 개수/시간마다 파일에 기록)
+        save_logs(data)
         logger.info(f"채팅 기록 저장 완료: {chatbot_type} - {username}")
 
     except Exception as e:
@@ -115,7 +104,7 @@ def log_search(data: Dict, search_term: str, category_filter: str, results_count
         # STEP 2: 검색 로그 엔트리 생성
         search_entry = {
             "id": f"search_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": now_str(),
             "user_id": user_id,
             "username": username,
             "search_term": search_term,
@@ -124,11 +113,8 @@ def log_search(data: Dict, search_term: str, category_filter: str, results_count
             "search_length": len(search_term)
         }
 
-        # STEP 3: 검색 로그를 데이터에 추가
-        if "search_logs" not in data:
-            data["search_logs"] = []
-
-        data["search_logs"].append(search_entry)
+        # STEP 3: 검색 로그를 데이터에 추가 (슬라이딩 윈도우 - 최대 SEARCH_LOGS_MAX개, 초과분은 deque에서 자동 제거)
+        append_search_log(data, search_entry)
 
         # STEP 4: 검색 통계 업데이트
         if "search_stats" not in data:
@@ -140,28 +126,22 @@ def log_search(data: Dict, search_term: str, category_filter: str, results_count
             }
 
         stats = data["search_stats"]
+        if not isinstance(stats["unique_users"], set):
+            # 파일에서 로드한 경우 리스트로 저장되어 있으므로 set으로 복원
+            stats["unique_users"] = set(stats["unique_users"])
         stats["total_searches"] += 1
         stats["unique_users"].add(username)
 
         # 인기 검색어 추적
-        if search_term in stats["popular_terms"]:
-            stats["popular_terms"][search_term] += 1
-        else:
-            stats["popular_terms"][search_term] = 1
+        popular_terms = stats["popular_terms"]
+        popular_terms[search_term] = popular_terms.get(search_term, 0) + 1
 
         # 카테고리 사용 추적
-        if category_filter in stats["category_usage"]:
-            stats["category_usage"][category_filter] += 1
-        else:
-            stats["category_usage"][category_filter] = 1
-
-        # STEP 5: 슬라이딩 윈도우 적용 (최대 200개 검색 로그 유지)
-        max_search_logs = 200
-        if len(data["search_logs"]) > max_search_logs:
-            data["search_logs"] = data["search_logs"][-max_search_logs:]
+        category_usage = stats["category_usage"]
+        category_usage[category_filter] = category_usage.get(category_filter, 0) + 1
 
-        # STEP 6: 데이터 저장
-        save_data(data)
+        # STEP 5: 데이터 저장 (배치 저장 - 일정 개수/시간마다 파일에 기록)
+        save_logs(data)
         logger.info(f"검색 로그 기록 완료: '{search_term}' by {username}")
 
     except Exception as e:
@@ -304,17 +284,17 @@ def get_search_analytics(data: Dict) -> Dict[str, Any]:
             category = log.get("category_filter", "전체")
             category_counts[category] = category_counts.get(category, 0) + 1
 
-        # 검색 트렌드 (최근 7일)
-        from datetime import datetime, timedelta
+        # 검색 트렌드 (최근 7일, 오래된 순) - 날짜 목록을 먼저 만들고 로그는 한 번만 순회
         today = datetime.now()
-        trends = []
+        dates = [(today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(6, -1, -1)]
+        date_counts = dict.fromkeys(dates, 0)
 
-        for i in range(7):
-            date = (today - timedelta(days=i)).strftime("%Y-%m-%d")
-            count = sum(1 for log in search_logs if log.get("timestamp", "").startswith(date))
-            trends.append({"date": date, "count": count})
+        for log in search_logs:
+            date = log.get("timestamp", "")[:10]  # "YYYY-MM-DD HH:MM:SS"의 날짜 부분
+            if date in date_counts:
+                date_counts[date] += 1
 
-        trends.reverse()  # 오래된 순으로 정렬
+        trends = [{"date": date, "count": date_counts[date]} for date in dates]
 
         return {
             "total_searches": total_searches,
@@ -344,8 +324,6 @@ def cleanup_old_logs(data: Dict, days_to_keep: int = 30) -> None:
     """
 
     try:
-        from datetime import datetime, timedelta
-
         cutoff_date = (datetime.now() - timedelta(days=days_to_keep)).strftime("%Y-%m-%d")
 
         # 채팅 기록 정리
@@ -399,7 +377,7 @@ def export_chat_history(data: Dict, user_id: str = None, format: str = "json") -
             chat_data = data.get("chat_history", [])
 
         if format.lower() == "json":
-            return json.dumps(chat_data, ensure_ascii=False, indent=2)
+            return json.dumps(list(chat_data), ensure_ascii=False, indent=2)
 
         elif format.lower() == "csv":
             import csv
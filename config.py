@@ -10,6 +10,7 @@ AE WIKI 통합 챗봇 시스템 - 확장 가능한 중앙집중식 설정 관리
 """
 
 import os
+from functools import lru_cache
 
 # 📱 Streamlit 애플리케이션 기본 설정
 APP_CONFIG = {
@@ -26,6 +27,7 @@ os.makedirs(DATA_FOLDER, exist_ok=True)
 
 DATA_CONFIG = {
     "data_file": os.path.join(DATA_FOLDER, "knowledge_data.json"),
+    "logs_file": os.path.join(DATA_FOLDER, "knowledge_logs.json"),
     "users_file": os.path.join(DATA_FOLDER, "users_data.json"),
     "admin_password": "admin123",
     "learning_requests_file": os.path.join(DATA_FOLDER, "learning_requests.json"),
@@ -51,6 +53,10 @@ API_CONFIG = {
         "base_url": "http://apigw-stg.samsungds.net:8000/gpt-oss/1/gpt-oss-120b/v1/chat/completions",
         "credential_key": "credential:TICKET-4cede4fc-91e2-4d58-825a-4f84236e8674:ST0000102728-STG:a2iVmGXASSOqfrbyxApcHwRI-6YwWMQGS4GrVCrDbgyA:-1:YTJpVm1HWEFTU09xZnJieXhBcGNid1JsLTZZd1dNUUdTNEdyVkNyRGJneUE=:signature=qKzfxDYmm2QcQYhKbrx1PgwlVB0955IcUoJuL6yDFZBaAtwiTtwSqrYIW5IVQDV38suAkfO86T9X1fjTPf7rCj-xkdVmrqVk02NPbT08LeJ9F_5a7tXOF4A==",
         "model": "openai/gpt-oss-120b",
+        "max_tokens": 6000,           # 답변 생성용 최대 토큰 (컨텍스트 예산에서 예약)
+        "context_window": 32768,      # 요청당 사용할 컨텍스트 토큰 상한 (대화 기록 패킹 기준)
+        "connect_timeout": 5,         # TCP 연결 수립 제한 시간 (초)
+        "timeout": 30,                # 응답 대기 제한 시간 (초)
         "headers": {
             "Send-System-Name": "AE_WIKI",
             "User-Id": "minguk.kim",
@@ -69,6 +75,7 @@ API_CONFIG = {
         "num_candidates": 1000,
         "num_result_doc": 5,
         "fields_exclude": ["v_merge_title_content"],
+        "connect_timeout": 5,
         "timeout": 45
     }
 }
@@ -82,7 +89,10 @@ TEST_CONFIG = {
 MISC_CONFIG = {
     "api_timeout": 30,
     "max_chat_history": 20,
+    "response_cache_size": 256,       # 챗봇 응답 캐시 최대 항목 수
+    "response_cache_ttl": 600,        # 챗봇 응답 캐시 유효 시간 (초)
     "typing_effect_enabled": True,
+    "max_typing_text_length": 2000,   # 이보다 긴 응답은 타이핑 효과 없이 바로 표시
     "theme": "dark",
     "colors": {
         "primary": "#667eea",
@@ -360,6 +370,8 @@ def get_available_indices():
     """사용 가능한 모든 인덱스 목록 반환"""
     return list(CHATBOT_INDICES.keys())
 
+# 인덱스 설정은 프로세스 내에서 정적이므로 조회 결과를 캐싱 (add_new_index 시 초기화)
+@lru_cache(maxsize=32)
 def get_index_config(index_id):
     """특정 인덱스의 설정 반환"""
     return CHATBOT_INDICES.get(index_id, {})
@@ -368,10 +380,12 @@ def get_index_display_name(index_id):
     """인덱스의 표시명 반환"""
     return CHATBOT_INDICES.get(index_id, {}).get("display_name", index_id)
 
+@lru_cache(maxsize=32)
 def get_index_system_prompt(index_id):
     """인덱스의 시스템 프롬프트 반환"""
     return CHATBOT_INDICES.get(index_id, {}).get("system_prompt", "당신은 도움이 되는 AI 어시스턴트입니다.")
 
+@lru_cache(maxsize=32)
 def get_index_rag_name(index_id):
     """인덱스의 RAG 인덱스명 반환"""
     return CHATBOT_INDICES.get(index_id, {}).get("index_name", "")
@@ -379,6 +393,9 @@ def get_index_rag_name(index_id):
 def add_new_index(index_id, config):
     """새로운 인덱스 동적 추가 (런타임에서 확장 가능)"""
     CHATBOT_INDICES[index_id] = config
+    get_index_config.cache_clear()
+    get_index_system_prompt.cache_clear()
+    get_index_rag_name.cache_clear()
 
 # 🎨 응답 형식 템플릿
 RESPONSE_FORMAT_TEMPLATE = """질문: {user_message}
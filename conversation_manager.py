@@ -32,12 +32,20 @@
 import json
 import os
 import time
+import uuid
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from collections import deque
 import streamlit as st
 import logging
 
+from config import DATA_CONFIG
+
+try:
+    from config import MISC_CONFIG
+except ImportError:
+    MISC_CONFIG = {}
+
 logger = logging.getLogger(__name__)
 
 class ConversationManager:
@@ -147,6 +155,8 @@ class ConversationManager:
     def _sync_to_storage(self):
         """메모리의 대화들을 저장소에 동기화"""
         try:
+            now_iso = datetime.now().isoformat()
+
             # 현재 저장소 데이터 로드
             if os.path.exists(self.storage_file):
                 with open(self.storage_file, 'r', encoding='utf-8') as f:
@@ -154,7 +164,7 @@ class ConversationManager:
             else:
                 data = {
                     "version": "1.0",
-                    "created_at": datetime.now().isoformat(),
+                    "created_at": now_iso,
                     "conversations": {},
                     "metadata": {}
                 }
@@ -164,7 +174,7 @@ class ConversationManager:
             for user_id, conversations in self._conversations.items():
                 data["conversations"][user_id] = list(conversations)
             
-            data["last_updated"] = datetime.now().isoformat()
+            data["last_updated"] = now_iso
             data["metadata"]["window_size"] = self.window_size
             
             self._save_to_storage(data)
@@ -302,7 +312,6 @@ class ConversationManager:
     
     def _generate_conversation_id(self) -> str:
         """고유한 대화 ID 생성"""
-        import uuid
         return f"conv_{int(time.time())}_{str(uuid.uuid4())[:8]}"
     
     def _auto_cleanup_if_needed(self):
@@ -370,15 +379,9 @@ class ConversationManager:
 def get_conversation_manager() -> ConversationManager:
     """전역 대화 관리자 인스턴스 반환 (싱글톤 패턴)"""
     if 'conversation_manager' not in st.session_state:
-        try:
-            from config import MISC_CONFIG
-            window_size = MISC_CONFIG.get("conversation_window_size", 5)
-            cleanup_hours = MISC_CONFIG.get("auto_cleanup_hours", 24)
-        except ImportError:
-            window_size = 5
-            cleanup_hours = 24
+        window_size = MISC_CONFIG.get("conversation_window_size", 5)
+        cleanup_hours = MISC_CONFIG.get("auto_cleanup_hours", 24)
         
-        from config import DATA_CONFIG
         st.session_state.conversation_manager = ConversationManager(
             window_size=window_size,  # 설정에서 읽은 윈도우 크기
             storage_file=DATA_CONFIG["user_conversations_file"],
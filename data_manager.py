@@ -23,13 +23,38 @@ AE WIKI 통합 챗봇 시스템 - 데이터 관리 모듈 (data_manager.py)
 
 import os
 import json
+import mmap
+import time
+import atexit
 import logging
-from typing import Dict, Any, List
+import tempfile
+import threading
+from collections import deque
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# JSON 백엔드 선택 (orjson이 설치되어 있으면 사용, 없으면 표준 json)
+try:
+    import orjson  # 선택적 의존성: 더 빠른 JSON 인코딩/디코딩
+
+    def _dumps(obj: Any, indent: Optional[int] = None) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2  # orjson은 2칸 들여쓰기만 지원
+        return orjson.dumps(obj, default=_json_default, option=option)
+
+    _loads = orjson.loads
+    _LOADS_ACCEPTS_BUFFER = True  # memoryview(mmap) 직접 파싱 가능
+except ImportError:
+    def _dumps(obj: Any, indent: Optional[int] = None) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=indent, default=_json_default).encode('utf-8')
+
+    _loads = json.loads
+    _LOADS_ACCEPTS_BUFFER = False  # 표준 json은 bytes/str만 지원
+
 # 설정 파일에서 데이터 경로 로드
 try:
     from config import DATA_CONFIG
@@ -42,13 +67,264 @@ except ImportError:
 
     DATA_CONFIG = {
         "data_file": os.path.join(DATA_FOLDER, "knowledge_data.json"),
+        "logs_file": os.path.join(DATA_FOLDER, "knowledge_logs.json"),
         "users_file": os.path.join(DATA_FOLDER, "users_data.json"),
     }
 
+# 누적형 로그 필드 - 메인 파일과 분리하여 별도 파일(logs_file)에 저장
+# 포인트 지급 등 작은 변경 시 수백 건의 대화/검색 기록을 매번 다시 쓰지 않도록 함
+LOG_FIELDS = ("chat_history", "admin_chat_history", "search_logs")
+
+# 채팅 기록 슬라이딩 윈도우 크기 - 메모리에서는 deque(maxlen)로 유지하여 초과분을 O(1)로 제거
+CHAT_HISTORY_MAX = 1000
+
+# 검색 로그 슬라이딩 윈도우 크기
+SEARCH_LOGS_MAX = 200
+
+# 마지막으로 디스크에 기록된 로그 필드 시그니처 (변경 감지용)
+_LOGS_SIGNATURE: Dict[str, Any] = {}
+
+# 읽기 전용 데이터 스냅샷 캐시 (데이터/로그 파일 stat 기준, save_data() 시 무효화)
+_DATA_SNAPSHOT: Dict[str, Any] = {"key": None, "data": None}
+
+# 로그 배치 저장 설정 - 대화/검색 로그 추가 시 매번 전체 파일을 다시 쓰지 않고 모아서 저장
+LOG_BATCH_MAX = 32         # 이 개수만큼 쌓이면 즉시 저장
+LOG_BATCH_INTERVAL = 2.0   # 마지막 저장 후 이 시간(초)이 지났으면 다음 로그 추가 시 저장
+
+class _LogBatcher:
+    """
+    ⏱️ 로그 추가 배치 저장 도우미
+
+    append_chat_history() / append_search_log()로 추가된 로그 항목 자체를 모아 두었다가
+    개수/시간 조건을 만족할 때 로그 파일(logs_file)에 병합하여 기록합니다.
+
+    - 세션의 data 딕셔너리를 보관하지 않으므로, 다른 세션이 저장한 질문/답변/포인트 변경을
+      오래된 스냅샷으로 덮어쓰지 않습니다. (메인 데이터 파일은 절대 쓰지 않음)
+    - 여러 세션의 로그가 하나의 대기열에 쌓이므로 먼저 추가된 세션의 로그도 유실되지 않습니다.
+    - 남은 로그는 load_data() 또는 프로세스 종료 시 기록됩니다.
+    """
+
+    def __init__(self, max_batch: int = LOG_BATCH_MAX, interval: float = LOG_BATCH_INTERVAL):
+        self.max_batch = max_batch
+        self.interval = interval
+        self.lock = threading.RLock()
+        self._pending: List[tuple] = []  # 아직 기록하지 않은 (필드, 항목, 최대 개수)
+        self._last_flush = time.monotonic()
+
+    def record(self, field: str, entry: Dict[str, Any], maxlen: Optional[int]) -> None:
+        """로그 항목 대기열에 추가 (저장은 tick()/flush()에서)"""
+        with self.lock:
+            self._pending.append((field, entry, maxlen))
+
+    def tick(self) -> None:
+        """개수/시간 조건 충족 시 대기 중인 로그 기록"""
+        with self.lock:
+            if len(self._pending) >= self.max_batch or time.monotonic() - self._last_flush >= self.interval:
+                self.flush()
+
+    def flush(self) -> None:
+        """대기 중인 로그를 현재 로그 파일 내용에 병합하여 즉시 기록"""
+        global _LOGS_SIGNATURE
+
+        with self.lock:
+            if not self._pending:
+                return
+            pending = self._pending
+            self._pending = []
+            try:
+                with _WRITE_LOCK:
+                    logs_data = _read_current_logs()
+                    # save_data()로 이미 기록된 항목은 다시 추가하지 않도록 필드별 기존 키 집합 구성
+                    written = {field: {_entry_key(r) for r in records} for field, records in logs_data.items()}
+                    for field, entry, maxlen in pending:
+                        key = _entry_key(entry)
+                        if key in written[field]:
+                            continue
+                        written[field].add(key)
+                        records = logs_data[field]
+                        records.append(entry)
+                        if maxlen is not None and len(records) > maxlen:
+                            del records[:len(records) - maxlen]
+                    _atomic_write_json(_get_logs_file(), logs_data)
+                    _LOGS_SIGNATURE = _logs_signature(logs_data)
+                self._last_flush = time.monotonic()
+            except Exception as e:
+                # 기록 실패 시 다음 기회에 다시 시도하도록 대기열 복원
+                self._pending = pending + self._pending
+                logger.warning(f"로그 배치 저장 보류: {e}")
+
+_log_batcher = _LogBatcher()
+atexit.register(_log_batcher.flush)  # 프로세스 종료 시 남은 로그 기록
+
+def save_logs(data: Optional[Dict[str, Any]] = None) -> None:
+    """
+    로그 필드(LOG_FIELDS)만 추가된 경우의 배치 저장
+
+    chat_manager.save_chat_history(), log_search() 등 누적형 로그 추가에 사용합니다.
+    기록 대상은 append_chat_history() / append_search_log()로 대기열에 들어간 항목뿐이며,
+    LOG_BATCH_MAX개가 쌓이거나 마지막 저장 후 LOG_BATCH_INTERVAL초가 지나면 로그 파일에만 기록됩니다.
+    (data 인자는 기존 호출 호환용으로 사용하지 않음)
+    """
+    _log_batcher.tick()
+
+def flush_logs() -> None:
+    """대기 중인 로그 배치를 즉시 기록"""
+    _log_batcher.flush()
+
+# ====================================
+# ⏱️ 타임스탬프
+# ====================================
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# (초 단위 epoch, 포맷된 문자열) - 튜플 교체는 원자적이므로 별도 락 불필요
+_NOW_STR_CACHE = (-1, "")
+
+def now_str() -> str:
+    """
+    현재 시각 문자열 (TIMESTAMP_FORMAT)
+
+    초 단위 포맷이므로 같은 초 안의 호출은 이전 strftime 결과를 재사용합니다.
+    (질문 등록 + 포인트 적립 + 로그 기록처럼 한 동작에서 여러 번 호출되는 경우)
+    """
+    global _NOW_STR_CACHE
+    second = int(time.time())
+    cached_second, cached = _NOW_STR_CACHE
+    if cached_second != second:
+        cached = datetime.fromtimestamp(second).strftime(TIMESTAMP_FORMAT)
+        _NOW_STR_CACHE = (second, cached)
+    return cached
+
 # ====================================
 # 📁 메인 데이터베이스 관리
 # ====================================
 
+def _json_default(obj: Any) -> Any:
+    """표준 JSON 타입이 아닌 컨테이너 직렬화 (deque → list, set → 정렬된 list)"""
+    if isinstance(obj, deque):
+        return list(obj)
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=str)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _append_bounded(data: Dict[str, Any], field: str, entry: Dict[str, Any], maxlen: int) -> None:
+    """data[field]를 deque(maxlen)로 유지하며 항목 추가 (초과분은 O(1)로 자동 제거)"""
+    records = data.get(field)
+    if not isinstance(records, deque) or records.maxlen != maxlen:
+        records = deque(records or [], maxlen=maxlen)
+        data[field] = records
+    records.append(entry)
+
+def append_chat_history(data: Dict[str, Any], entry: Dict[str, Any]) -> None:
+    """
+    채팅 기록 추가 (슬라이딩 윈도우)
+
+    data["chat_history"]를 처음 추가할 때 deque(maxlen=CHAT_HISTORY_MAX)로 변환하여,
+    이후 추가 시 가장 오래된 기록이 자동으로 제거되도록 합니다.
+    파일 저장 시에는 리스트로 직렬화됩니다. 항목은 로그 배치 대기열에도 등록됩니다. (save_logs())
+    """
+    _append_bounded(data, "chat_history", entry, CHAT_HISTORY_MAX)
+    _log_batcher.record("chat_history", entry, CHAT_HISTORY_MAX)
+
+def append_search_log(data: Dict[str, Any], entry: Dict[str, Any]) -> None:
+    """검색 로그 추가 (슬라이딩 윈도우, 최대 SEARCH_LOGS_MAX개 유지, 로그 배치 대기열에도 등록)"""
+    _append_bounded(data, "search_logs", entry, SEARCH_LOGS_MAX)
+    _log_batcher.record("search_logs", entry, SEARCH_LOGS_MAX)
+
+# 파일 쓰기 직렬화 락 - Streamlit 세션(스레드)들이 같은 파일을 동시에 교체하지 않도록 보호
+_WRITE_LOCK = threading.RLock()
+
+def _atomic_write_json(path: str, data: Any, indent: Optional[int] = None) -> None:
+    """
+    JSON 파일 원자적 쓰기
+
+    같은 디렉터리의 고유한 임시 파일(mkstemp)에 기록한 뒤 os.replace로 교체하므로,
+    직렬화 오류나 쓰기 도중 프로세스 종료 시에도 기존 파일이 잘린 상태로 남지 않습니다.
+    직렬화 + 쓰기 + 교체는 _WRITE_LOCK 안에서 수행되어 동시 저장이 서로의 임시 파일을 건드리지 않습니다.
+
+    Raises:
+        IOError, TypeError: 파일 쓰기 또는 직렬화 실패 시 (임시 파일은 정리 후 전파)
+    """
+    with _WRITE_LOCK:
+        payload = _dumps(data, indent)  # 직렬화 실패 시 임시 파일을 만들지 않음
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path) or ".", prefix=os.path.basename(path) + ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            # mkstemp는 0600으로 생성하므로 기존 파일 권한(없으면 0644)을 유지
+            try:
+                mode = os.stat(path).st_mode & 0o777
+            except FileNotFoundError:
+                mode = 0o644
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+def _read_json_file(path: str) -> Any:
+    """
+    JSON 파일 파싱 (orjson 사용 시 mmap으로 중간 bytes 복사 없이 파싱)
+
+    Raises:
+        FileNotFoundError: 파일이 없을 때
+        json.JSONDecodeError: JSON 파싱 오류 시
+    """
+    with open(path, 'rb') as f:
+        if _LOADS_ACCEPTS_BUFFER and os.fstat(f.fileno()).st_size > 0:  # 빈 파일은 mmap 불가
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:  # mmap 닫기 전에 버퍼 해제
+                    return _loads(view)
+        return _loads(f.read())
+
+def _get_logs_file() -> str:
+    """로그 파일 경로 (설정에 없으면 메인 데이터 파일 옆에 생성)"""
+    return DATA_CONFIG.get(
+        "logs_file",
+        os.path.join(os.path.dirname(DATA_CONFIG["data_file"]), "knowledge_logs.json")
+    )
+
+def _entry_key(entry: Any) -> Any:
+    """로그 항목 식별자 (id → timestamp 순으로 사용)"""
+    if isinstance(entry, dict):
+        return entry.get("id") or entry.get("timestamp")
+    return repr(entry)
+
+def _logs_signature(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    로그 필드 변경 감지용 시그니처 생성
+
+    로그는 뒤에 추가되고 슬라이딩 윈도우로 앞이 잘리는 형태이므로
+    (길이, 첫 항목, 마지막 항목)만 비교하면 전체 비교 없이 변경 여부를 판단할 수 있습니다.
+    """
+    signature = {}
+    for field in LOG_FIELDS:
+        entries = data.get(field) or []
+        if entries:
+            signature[field] = (len(entries), _entry_key(entries[0]), _entry_key(entries[-1]))
+        else:
+            signature[field] = (0, None, None)
+    return signature
+
+def _read_current_logs() -> Dict[str, Any]:
+    """
+    디스크에 기록된 현재 로그 필드 조회 (로그 배치 병합용)
+
+    로그 파일이 아직 없는 레거시 구조에서는 메인 데이터 파일의 로그 필드를 읽기만 합니다.
+    """
+    logs_file = _get_logs_file()
+    try:
+        source = _read_json_file(logs_file)
+    except FileNotFoundError:
+        try:
+            source = _read_json_file(DATA_CONFIG["data_file"])
+        except FileNotFoundError:
+            source = {}
+    return {field: list(source.get(field) or []) for field in LOG_FIELDS}
+
 def initialize_data() -> Dict[str, Any]:
     """
     메인 데이터 저장소 초기화
@@ -123,15 +399,27 @@ def save_data(data: Dict[str, Any]) -> None:
     - 모든 데이터 변경 작업 후 자동으로 호출되어 일관성 보장
 
     부작용:
-    - knowledge_data.json 파일을 완전히 덮어씀 (원자적 쓰기)
+    - knowledge_data.json 파일을 원자적으로 교체 (로그 필드 제외)
+    - 로그 필드(LOG_FIELDS)는 변경된 경우에만 logs_file에 기록
     - 파일 쓰기 오류 시 IOError 예외 발생 (상위로 전파)
 
     Args:
         data: 저장할 데이터 구조 (JSON 직렬화 가능한 타입)
     """
+    global _LOGS_SIGNATURE
+
     data_file = DATA_CONFIG["data_file"]
-    with open(data_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    _DATA_SNAPSHOT["key"] = None  # 스냅샷 캐시 무효화 (같은 mtime 내 재기록 대비)
+    main_data = {key: value for key, value in data.items() if key not in LOG_FIELDS}
+    _atomic_write_json(data_file, main_data, indent=2)
+
+    # 로그는 변경이 있을 때만 다시 기록 (포인트 등 작은 변경 시 로그 재작성 생략)
+    logs_file = _get_logs_file()
+    signature = _logs_signature(data)
+    if signature != _LOGS_SIGNATURE or not os.path.exists(logs_file):
+        logs_data = {field: data.get(field, []) for field in LOG_FIELDS}
+        _atomic_write_json(logs_file, logs_data)
+        _LOGS_SIGNATURE = signature
 
 def load_data() -> Dict[str, Any]:
     """
@@ -147,6 +435,8 @@ def load_data() -> Dict[str, Any]:
     부작용:
     - 파일 읽기 오류 시 FileNotFoundError 예외 발생
     - 스키마 업데이트 시 자동으로 save_data() 호출
+    - 배치 대기 중인 로그(save_logs)를 먼저 기록
+    - logs_file이 있으면 로그 필드를 병합 (없으면 메인 파일의 기존 로그 사용)
 
     Returns:
         Dict[str, Any]: 로드된 데이터 구조
@@ -155,11 +445,24 @@ def load_data() -> Dict[str, Any]:
         FileNotFoundError: 데이터 파일이 존재하지 않을 때
         json.JSONDecodeError: JSON 파싱 오류 시
     """
+    global _LOGS_SIGNATURE
+
     data_file = DATA_CONFIG["data_file"]
 
+    # 배치 대기 중인 로그를 먼저 기록하여 최신 로그가 포함되도록 함
+    _log_batcher.flush()
+
     try:
-        with open(data_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _read_json_file(data_file)
+
+        # 분리 저장된 로그 병합 (레거시 파일은 메인 파일에 로그가 포함되어 있음)
+        logs_file = _get_logs_file()
+        if os.path.exists(logs_file):
+            data.update(_read_json_file(logs_file))
+            _LOGS_SIGNATURE = _logs_signature(data)
+        else:
+            # 다음 save_data()에서 로그 파일이 생성되도록 시그니처 초기화
+            _LOGS_SIGNATURE = {}
 
         # 스키마 호환성 검사 및 보완
         schema_updated = False
@@ -198,6 +501,55 @@ def load_data() -> Dict[str, Any]:
         logger.error(f"JSON 파싱 오류: {e}")
         raise
 
+def _data_files_key() -> Optional[tuple]:
+    """데이터/로그 파일의 (수정 시각, 크기) - 둘 중 하나라도 바뀌면 스냅샷을 다시 읽음"""
+    key = []
+    for path in (DATA_CONFIG["data_file"], _get_logs_file()):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            if path == DATA_CONFIG["data_file"]:
+                return None
+            key.append(None)
+            continue
+        key.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(key)
+
+def get_data_version() -> Optional[tuple]:
+    """
+    데이터 버전 토큰 조회 (st.cache_data 등 파생 결과 캐시의 키용)
+
+    데이터/로그 파일의 (수정 시각, 크기)로 구성되며, 파일이 바뀌면 값이 달라집니다.
+    """
+    return _data_files_key()
+
+def load_data_snapshot() -> Dict[str, Any]:
+    """
+    읽기 전용 데이터 스냅샷 조회
+
+    대시보드처럼 한 번의 렌더링에서 여러 위젯이 데이터를 조회만 하는 경우,
+    파일이 바뀌지 않았으면 이전에 파싱한 데이터를 그대로 반환하여
+    위젯마다 JSON 파일을 다시 읽고 파싱하지 않도록 합니다.
+
+    주의:
+    - 반환된 데이터는 여러 세션이 공유하므로 수정하면 안 됩니다.
+      데이터를 변경/저장하는 경우에는 initialize_data()를 사용하세요.
+
+    Returns:
+        Dict[str, Any]: 최신 파일 내용과 일치하는 데이터
+    """
+    _log_batcher.flush()  # 대기 중인 로그가 있으면 먼저 기록하여 스냅샷에 포함
+
+    key = _data_files_key()
+    if key is not None and _DATA_SNAPSHOT["key"] == key:
+        return _DATA_SNAPSHOT["data"]
+
+    data = initialize_data()
+    # initialize_data() 중 스키마 보완 저장이 있었을 수 있으므로 키를 다시 계산
+    _DATA_SNAPSHOT["data"] = data
+    _DATA_SNAPSHOT["key"] = _data_files_key()
+    return data
+
 # ====================================
 # 👥 사용자 데이터베이스 관리
 # ====================================
@@ -237,8 +589,7 @@ def save_users_data(users_data: Dict[str, Any]) -> None:
     users_file = DATA_CONFIG["users_file"]
     users_data["last_updated"] = datetime.now().isoformat()
 
-    with open(users_file, 'w', encoding='utf-8') as f:
-        json.dump(users_data, f, ensure_ascii=False, indent=2)
+    _atomic_write_json(users_file, users_data, indent=2)
 
     logger.debug(f"사용자 데이터 저장 완료: {len(users_data.get('users', {}))}명")
 
@@ -256,8 +607,7 @@ def load_users_data() -> Dict[str, Any]:
     users_file = DATA_CONFIG["users_file"]
 
     try:
-        with open(users_file, 'r', encoding='utf-8') as f:
-            users_data = json.load(f)
+        users_data = _read_json_file(users_file)
 
         # 스키마 호환성 검사
         if "users" not in users_data:
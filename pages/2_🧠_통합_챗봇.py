@@ -37,10 +37,11 @@ import time
 import logging
 from datetime import datetime
 
-from config import APP_CONFIG, CHATBOT_INDICES, get_available_indices, get_index_config
+from config import APP_CONFIG, CHATBOT_INDICES, MISC_CONFIG, get_available_indices, get_index_config
+from data_manager import save_logs, append_chat_history, now_str
 from utils import (
     initialize_data, get_chatbot_response, save_chat_history,
-    require_login, initialize_session_state, get_user_id,
+    require_login, get_user_id,
     get_username, get_current_user, get_user_chat_history
 )
 
@@ -69,16 +70,10 @@ apply_dark_theme()
 def save_chat_history_with_session(data, user_message, bot_response, chatbot_type="ae_wiki",
                                    user_id=None, session_id=None, conversation_title=None):
     """세션 정보를 포함하여 채팅 기록 저장"""
-    from data_manager import save_data
-
     try:
-        # 기본 채팅 기록 저장
-        if "chat_history" not in data:
-            data["chat_history"] = []
-
         chat_entry = {
             "id": f"chat_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": now_str(),
             "user_id": user_id or "anonymous",
             "username": get_username() or "anonymous",
             "chatbot_type": chatbot_type,
@@ -90,13 +85,10 @@ def save_chat_history_with_session(data, user_message, bot_response, chatbot_typ
             "response_length": len(bot_response)
         }
 
-        data["chat_history"].append(chat_entry)
+        # 슬라이딩 윈도우 적용 (최대 CHAT_HISTORY_MAX개 대화 유지, 초과분은 deque에서 자동 제거)
+        append_chat_history(data, chat_entry)
 
-        # 슬라이딩 윈도우 적용 (최대 1000개 대화 유지)
-        if len(data["chat_history"]) > 1000:
-            data["chat_history"] = data["chat_history"][-1000:]
-
-        save_data(data)
+        save_logs(data)  # 배치 저장 (일정 개수/시간마다 파일에 기록)
     except Exception as e:
         st.error(f"채팅 기록 저장 실패: {e}")
 
@@ -107,7 +99,7 @@ def get_user_conversation_sessions(data, user_id=None, limit=10):
         if not user_id:
             try:
                 user_id = get_user_id()
-            except:
+            except Exception:
                 pass
 
             if not user_id:
@@ -115,7 +107,7 @@ def get_user_conversation_sessions(data, user_id=None, limit=10):
                     current_user = get_current_user()
                     if current_user:
                         user_id = current_user.get("knox_id") or current_user.get("user_id") or current_user.get("username")
-                except:
+                except Exception:
                     pass
 
             if not user_id:
@@ -124,7 +116,7 @@ def get_user_conversation_sessions(data, user_id=None, limit=10):
             if not user_id:
                 try:
                     user_id = get_username()
-                except:
+                except Exception:
                     user_id = "anonymous"
 
         logger.info(f"대화 기록 조회: user_id={user_id}")
@@ -275,9 +267,6 @@ def load_conversation(session):
 # ====================================
 
 def main():
-    # 세션 상태 초기화 및 로그인 상태 복원
-    initialize_session_state()
-
     # 로그인 확인
     if not require_login():
         return
@@ -444,23 +433,26 @@ def show_chat_interface(data):
         # AI 응답 생성 및 표시
         with st.chat_message("assistant"):
             # 대화 기록을 LLM API 형식으로 변환 (role, content)
+            # LLM에는 최근 max_chat_history개만 전달되므로 전체 세션 기록을 복사하지 않음
             chat_history_for_llm = [
                 {"role": msg["role"], "content": msg["content"]}
-                for msg in st.session_state.unified_chat_messages
-                if msg["role"] in ["user", "assistant"]
+                for msg in st.session_state.unified_chat_messages[-MISC_CONFIG.get("max_chat_history", 20):]
+                if msg["role"] in ("user", "assistant")
             ]
 
-            # 선택된 인덱스를 기반으로 응답 생성
-            bot_response = get_chatbot_response(
+            # 선택된 인덱스를 기반으로 응답 생성 (스트리밍: 도착한 토큰부터 바로 표시)
+            response_placeholder = st.empty()
+            bot_response = ""
+            for chunk in get_chatbot_response(
                 prompt,
                 chat_history=chat_history_for_llm,
                 chatbot_type=index_id,  # 인덱스 ID를 챗봇 타입으로 사용
-                user_id=get_user_id()
-            )
-
-            # AI 응답 표시
-            st.markdown(bot_response,
-                        unsafe_allow_html=True)
+                user_id=get_user_id(),
+                stream=True
+            ):
+                bot_response += chunk
+                response_placeholder.markdown(bot_response,
+                                              unsafe_allow_html=True)
             response_timestamp = datetime.now().strftime("%H:%M:%S")
             st.caption(f"⏰ {response_timestamp} | 📊 {index_id}")
 
@@ -527,7 +519,7 @@ def show_chat_interface(data):
                 session_id=st.session_state.conversation_session_id,
                 conversation_title=st.session_state.conversation_title
             )
-        except:
+        except Exception:
             # Fallback to original function
             try:
                 save_chat_history(data, prompt, bot_response,
@@ -42,7 +42,7 @@ import time
 from datetime import datetime
 
 from utils import (
-    load_css_styles, require_login, get_current_user, initialize_session_state,
+    load_css_styles, require_login, get_current_user,
     initialize_data, add_user_points, award_points
 )
 from config import get_available_indices, get_index_config
@@ -78,16 +78,12 @@ def main():
     
     📞 호출 관계:
     - 호출자: Streamlit 앱 (__name__ == "__main__") 또는 페이지 네비게이션
-    - 호출 대상: initialize_session_state(), require_login(), show_wiki_learning_page()
+    - 호출 대상: require_login(), show_wiki_learning_page()
     
     ⚡ 처리 흐름:
-    세션 초기화 -> 로그인 검증 -> 학습 페이지 렌더링
+    로그인 검증 -> 학습 페이지 렌더링
     """
     
-    # STEP 1: 세션 상태 초기화
-    # Streamlit 세션에 앱 상태 설정 (로그인 정보, 페이지 설정 등)
-    initialize_session_state()
-    
     # STEP 2: 사용자 인증 확인
     # 미인증 사용자는 자동으로 로그인 페이지로 리다이렉트
     if not require_login():
@@ -447,9 +443,10 @@ def save_learning_request(chatbot_name, index_id, url_link, title, description,
         
         # STEP 2: 학습 요청 데이터 구조화
         # JSON 파일에 저장될 표준화된 데이터 구조 생성
+        now = datetime.now()  # ID와 요청 시간이 같은 시각을 가리키도록 한 번만 조회
         learning_data = {
-            "id": f"learning_{datetime.now().strftime('%Y%m%d_%H%M%S')}",  # 고유 ID (timestamp 기반)
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),     # 요청 시간
+            "id": f"learning_{now.strftime('%Y%m%d_%H%M%S')}",  # 고유 ID (timestamp 기반)
+            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),     # 요청 시간
             "user_id": user.get("user_id", ""),                           # 요청자 내부 ID
             "nickname": user.get("nickname", ""),                         # 요청자 닉네임 (관리자용)
             "chatbot_name": chatbot_name,                                  # 선택된 챗봇명
@@ -496,7 +493,7 @@ def save_learning_request(chatbot_name, index_id, url_link, title, description,
                 current_user.get("username") or "").strip()
         else:
             logger.warning("포인트 지급 스킵: 사용자 knox_id 없음 (WIKI학습)")
-        add_user_points(data, username, 100, "WIKI학습")  # 올바른 순서로 호출
+        add_user_points(data, username, 100, "WIKI학습", save=False)  # 올바른 순서로 호출
         save_data(data)  # 포인트 데이터 저장
 
         return True  # 저장 성공
@@ -509,9 +506,10 @@ def save_term_learning_request(term_name, term_definition, additional_notes):
     """용어 학습 요청 데이터 저장"""
     try:
         user = get_current_user()
+        now = datetime.now()
         term_data = {
-            "id": f"term_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "id": f"term_{now.strftime('%Y%m%d_%H%M%S')}",
+            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
             "user_id": user.get("user_id", ""),
             "nickname": user.get("nickname", ""),
             "term_name": term_name,
@@ -726,9 +724,10 @@ def save_index_request(index_name, display_name, description,
     """인덱스 추가요청 데이터 저장"""
     try:
         user = get_current_user()
+        now = datetime.now()
         index_request_data = {
-            "id": f"index_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "id": f"index_{now.strftime('%Y%m%d_%H%M%S')}",
+            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
             "user_id": user.get("user_id", ""),
             "nickname": user.get("nickname", ""),
 
@@ -771,7 +770,7 @@ def save_index_request(index_name, display_name, description,
         data = initialize_data()
         current_user = get_current_user()
         username = current_user.get("username", "Unknown") if current_user else "Anonymous"
-        add_user_points(data, username, 200, "인덱스추가요청")
+        add_user_points(data, username, 200, "인덱스추가요청", save=False)
         save_data(data)
 
         return True
@@ -43,9 +43,9 @@ from typing import List, Dict
 
 from config import CATEGORIES
 from utils import (
-    load_css_styles, require_login, get_current_user, initialize_session_state,
-    initialize_data, save_data, add_question, add_answer, search_questions,
-    get_user_id, toggle_like
+    load_css_styles, require_login, get_current_user,
+    initialize_data, add_question, add_answer, search_questions,
+    get_user_id, toggle_like, get_questions_by_id
 )
 
 # ====================================
@@ -67,9 +67,6 @@ apply_dark_theme()
 # ====================================
 
 def main():
-    # 세션 상태 초기화 및 로그인 상태 복원
-    initialize_session_state()
-    
     # 로그인 확인
     if not require_login():
         return
@@ -171,8 +168,7 @@ def show_question_tab(data: Dict):
             st.error("❌ 질문 내용을 입력해주세요.")
         else:
             # 질문 저장 (익명 옵션 포함)
-            add_question(data, title, category, content, anonymous)
-            save_data(data)
+            add_question(data, title, category, content, anonymous)  # 내부에서 저장까지 수행
             
             st.success("✅ 질문이 등록되었습니다! 곧 답변을 받아보실 수 있습니다.")
             st.balloons()
@@ -261,6 +257,13 @@ def show_search_and_answer_tab(data: Dict):
 
 def show_questions_with_answers(data: Dict, questions: List[Dict]):
     """질문과 답변을 표시하는 함수"""
+    # 렌더링 전에 한 번만 구성: 질문별 답변 목록, 좋아요 맵, 현재 사용자
+    answers_by_question = {}
+    for a in data["answers"]:
+        answers_by_question.setdefault(a["question_id"], []).append(a)
+    likes_by_answer = data.get("likes", {})
+    user_id = get_user_id()
+
     for i, question in enumerate(questions):
         # 질문별 고유 키로 세션 상태 관리
         question_key = f"question_expanded_{question['id']}"
@@ -270,7 +273,8 @@ def show_questions_with_answers(data: Dict, questions: List[Dict]):
         # border_color = "#d1d9ff"  # 미사용 변수 제거
         
         # 답변 수 계산
-        answer_count = len([a for a in data["answers"] if a["question_id"] == question["id"]])
+        question_answers = answers_by_question.get(question["id"], [])
+        answer_count = len(question_answers)
         
         # 질문 카드 디자인 (버튼이 카드 안에 포함)
         is_expanded = st.session_state.get(question_key, False)
@@ -314,16 +318,12 @@ def show_questions_with_answers(data: Dict, questions: List[Dict]):
             st.divider()
             
             # 기존 답변들 표시
-            question_answers = [a for a in data["answers"] if a["question_id"] == question["id"]]
-            
             if question_answers:
                 st.markdown(f"**💬 답변 ({len(question_answers)}개):**")
                 
                 for j, answer in enumerate(sorted(question_answers, key=lambda x: x["timestamp"], reverse=True)):
                     # 좋아요 정보
-                    like_key = f"answer_{answer['id']}"
-                    likes = data.get("likes", {}).get(like_key, [])
-                    user_id = get_user_id()
+                    likes = likes_by_answer.get(f"answer_{answer['id']}", [])
                     liked = user_id in likes
                     
                     # 심플한 답변 표시
@@ -338,8 +338,7 @@ def show_questions_with_answers(data: Dict, questions: List[Dict]):
                             key=f"like_{answer['id']}",
                             use_container_width=True
                         ):
-                            toggle_like(data, answer['id'])
-                            save_data(data)
+                            toggle_like(data, answer['id'])  # 내부에서 저장까지 수행
                             st.rerun()
                     
                     st.divider()
@@ -372,8 +371,7 @@ def show_questions_with_answers(data: Dict, questions: List[Dict]):
                     st.error("❌ 답변 내용을 입력해주세요.")
                 else:
                     # 답변 저장
-                    add_answer(data, question['id'], answer_content)
-                    save_data(data)
+                    add_answer(data, question['id'], answer_content)  # 내부에서 저장까지 수행
                     
                     st.success("✅ 답변이 등록되었습니다!")
                     
@@ -457,9 +455,10 @@ def show_my_activity_tab(data: Dict):
     if my_answers:
         st.markdown("### 💬 내가 작성한 답변")
         
+        questions_by_id = get_questions_by_id(data)
         for answer in sorted(my_answers, key=lambda x: x["timestamp"], reverse=True):
             # 해당 질문 찾기
-            question = next((q for q in data["questions"] if q["id"] == answer["question_id"]), None)
+            question = questions_by_id.get(answer["question_id"])
             
             if question:
                 with st.expander(f"Re: {question['title']} ({answer['timestamp']})", expanded=False):
@@ -10,7 +10,7 @@ import time
 from datetime import datetime
 
 from utils import (
-    load_css_styles, require_login, get_current_user, initialize_session_state
+    load_css_styles, require_login, get_current_user
 )
 
 # ====================================
@@ -32,9 +32,6 @@ apply_dark_theme()
 # ====================================
 
 def main():
-    # 세션 상태 초기화 및 로그인 상태 복원
-    initialize_session_state()
-    
     # 로그인 확인
     if not require_login():
         return
@@ -161,9 +158,10 @@ def save_voc_data(category, title, content, contact, anonymous):
     """VOC 데이터 저장"""
     try:
         user = get_current_user()
+        now = datetime.now()  # ID/타임스탬프 공용
         voc_data = {
-            "id": f"voc_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "id": f"voc_{now.strftime('%Y%m%d_%H%M%S')}",
+            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
             "user_id": "" if anonymous else user.get("user_id", ""),
             "nickname": "" if anonymous else user.get("nickname", "익명"),
             "category": category,
@@ -198,7 +196,7 @@ def save_voc_data(category, title, content, contact, anonymous):
             data = initialize_data()
             username = user.get("knox_id") or user.get("username", "")
             if username:
-                add_user_points(data, username, 50, "VOC 제출")
+                add_user_points(data, username, 50, "VOC 제출", save=False)
                 save_data(data)
 
         return True
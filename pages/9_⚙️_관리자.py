@@ -10,20 +10,25 @@ import json
 import os
 import io
 
-from config import APP_CONFIG, DATA_CONFIG, AUTH_CONFIG
+from config import APP_CONFIG, DATA_CONFIG, AUTH_CONFIG, get_available_indices, get_index_config
 from utils import (
-    initialize_data, is_logged_in, require_login,
+    initialize_data, is_logged_in, require_login, logout_user,
     get_username, load_css_styles, get_all_users, search_users,
     toggle_user_status, delete_user, update_user_info,
+    toggle_user_status_bulk, delete_user_bulk,
     get_all_user_points, adjust_user_points, set_user_points, get_point_change_history,
     cleanup_duplicate_points_data,
     get_pending_registration_requests,
     approve_registration_request,
     reject_registration_request, resolve_user_label,
-    resolve_to_knox_id
+    resolve_to_knox_id, get_questions_by_id
 )
+from data_manager import save_data as save_knowledge_data
 # 새 통합 사용자 관리 시스템 import
-from user_manager import get_pending_requests, approve_registration_request as approve_new, reject_registration_request as reject_new
+from user_manager import (
+    get_pending_requests, get_processed_requests,
+    approve_registration_request as approve_new, reject_registration_request as reject_new
+)
 
 # ====================================
 # 🎨 페이지 설정 및 스타일
@@ -39,6 +44,9 @@ st.set_page_config(
 from theme import apply_dark_theme
 apply_dark_theme()
 
+# 부서명 -> selectbox 인덱스 (회원 수정 폼마다 리스트를 두 번 스캔하지 않도록 한 번만 생성)
+_DEPARTMENT_INDEX = {dept: i for i, dept in enumerate(AUTH_CONFIG["departments"])}
+
 # ====================================
 # 🛡️ 관리자 인증 함수
 # ====================================
@@ -109,11 +117,10 @@ def show_admin_page(data):
         
         # 회원가입 신청 알림 표시
         try:
-            from user_manager import get_pending_requests
             pending_requests = get_pending_requests()
             if pending_requests:
                 st.warning(f"🔔 **회원가입 승인 대기: {len(pending_requests)}건** - '회원 승인' 탭에서 확인하세요!")
-        except:
+        except Exception:
             pass
     
     with col2:
@@ -124,7 +131,6 @@ def show_admin_page(data):
                 del st.session_state.admin_authenticated
             
             # 일반 로그인 상태도 클리어 (필요한 경우)
-            from utils import logout_user
             logout_user()
             
             # 홈페이지로 리다이렉트
@@ -245,8 +251,9 @@ def show_dashboard_overview(data):
                               key=lambda x: x["timestamp"], reverse=True)[:5]
         
         if recent_answers:
+            questions_by_id = get_questions_by_id(data)
             for a in recent_answers:
-                question = next((q for q in data["questions"] if q["id"] == a["question_id"]), None)
+                question = questions_by_id.get(a["question_id"])
                 q_title = question["title"] if question else "삭제된 질문"
                 st.markdown(f"• **{q_title}**에 답변")
                 st.markdown(f"  _{a['author']} - {a['timestamp']}_")
@@ -270,12 +277,11 @@ def show_user_management():
         if st.button("📥 회원 목록 다운로드"):
             download_user_list()
     
-    # 회원 목록 조회
-    users = search_users(search_keyword)
-    
-    # 부서 필터 적용
-    if department_filter != "전체":
-        users = [user for user in users if user.get("department") == department_filter]
+    # 회원 목록 조회 (검색어 + 부서 필터를 한 번에 적용)
+    users = search_users(
+        search_keyword,
+        department=None if department_filter == "전체" else department_filter
+    )
     
     # 회원 통계
     all_users = get_all_users()
@@ -325,10 +331,48 @@ def show_user_management():
         # 회원 카드 표시
         for i, user in enumerate(users, 1):
             show_user_card(user, i)
+        
+        # 일괄 관리 (선택한 회원을 한 번의 로드/저장으로 처리)
+        show_bulk_user_actions(users)
     
     else:
         st.info("검색 조건에 맞는 회원이 없습니다.")
 
+def show_bulk_user_actions(users):
+    """선택 회원 일괄 상태 변경/삭제"""
+    
+    with st.expander("🧰 선택 회원 일괄 관리"):
+        user_labels = {user['user_id']: f"{user['nickname']} ({user['knox_id']})" for user in users}
+        selected_ids = st.multiselect(
+            "대상 회원 선택",
+            list(user_labels),
+            format_func=user_labels.get,
+            key="bulk_selected_users"
+        )
+        
+        col_toggle, col_delete = st.columns(2)
+        
+        with col_toggle:
+            if st.button("⚡ 선택 회원 상태 변경", disabled=not selected_ids, key="bulk_toggle"):
+                results = toggle_user_status_bulk(selected_ids)
+                success_count = sum(results.values())
+                if success_count:
+                    st.success(f"✅ {success_count}명의 상태가 변경되었습니다.")
+                if success_count < len(selected_ids):
+                    st.error(f"❌ {len(selected_ids) - success_count}명의 상태 변경에 실패했습니다.")
+                st.rerun()
+        
+        with col_delete:
+            confirm_delete = st.checkbox("삭제 확인", key="bulk_delete_confirm")
+            if st.button("🗑️ 선택 회원 삭제", disabled=not (selected_ids and confirm_delete), key="bulk_delete"):
+                results = delete_user_bulk(selected_ids)
+                success_count = sum(results.values())
+                if success_count:
+                    st.success(f"✅ {success_count}명의 회원이 삭제되었습니다.")
+                if success_count < len(selected_ids):
+                    st.error(f"❌ {len(selected_ids) - success_count}명의 회원 삭제에 실패했습니다.")
+                st.rerun()
+
 def show_user_card(user, index):
     """회원 카드 표시"""
     
@@ -414,7 +458,7 @@ def show_edit_user_form(user):
             new_department = st.selectbox(
                 "소속부서",
                 AUTH_CONFIG["departments"],
-                index=AUTH_CONFIG["departments"].index(user['department']) if user['department'] in AUTH_CONFIG["departments"] else 0,
+                index=_DEPARTMENT_INDEX.get(user['department'], 0),
                 key=f"new_department_{user['user_id']}"
             )
         
@@ -597,8 +641,9 @@ def show_user_activity_logs(data):
         })
     
     # 답변 활동  
+    questions_by_id = get_questions_by_id(data)
     for a in data["answers"]:
-        question = next((q for q in data["questions"] if q["id"] == a["question_id"]), None)
+        question = questions_by_id.get(a["question_id"])
         q_title = question["title"] if question else "삭제된 질문"
         activities.append({
             "timestamp": a["timestamp"],
@@ -755,7 +800,7 @@ def get_today_count(items):
             item_date = datetime.strptime(item["timestamp"].split()[0], "%Y-%m-%d").date()
             if item_date == today:
                 count += 1
-        except:
+        except Exception:
             continue
     return count
 
@@ -768,7 +813,7 @@ def get_today_chat_count(data):
             chat_date = datetime.strptime(chat["timestamp"].split()[0], "%Y-%m-%d").date()
             if chat_date == today:
                 count += 1
-        except:
+        except Exception:
             continue
     return count
 
@@ -781,7 +826,7 @@ def get_today_search_count(data):
             search_date = datetime.strptime(search["timestamp"].split()[0], "%Y-%m-%d").date()
             if search_date == today:
                 count += 1
-        except:
+        except Exception:
             continue
     return count
 
@@ -794,7 +839,7 @@ def filter_search_logs(logs, date_filter, keyword_filter):
             log_date = datetime.strptime(log["timestamp"].split()[0], "%Y-%m-%d").date()
             if log_date != date_filter:
                 continue
-        except:
+        except Exception:
             continue
         
         # 키워드 필터
@@ -881,7 +926,7 @@ def cleanup_old_chats(data, days_old):
             chat_date = datetime.strptime(chat["timestamp"], "%Y-%m-%d %H:%M:%S")
             if chat_date >= cutoff_date:
                 recent_chats.append(chat)
-        except:
+        except Exception:
             # 날짜 파싱 실패시 유지
             recent_chats.append(chat)
     
@@ -915,7 +960,7 @@ def calculate_daily_stats(data):
             if date not in daily_stats:
                 daily_stats[date] = {"날짜": date, "질문": 0, "답변": 0}
             daily_stats[date]["질문"] += 1
-        except:
+        except Exception:
             continue
     
     # 답변 통계
@@ -925,7 +970,7 @@ def calculate_daily_stats(data):
             if date not in daily_stats:
                 daily_stats[date] = {"날짜": date, "질문": 0, "답변": 0}
             daily_stats[date]["답변"] += 1
-        except:
+        except Exception:
             continue
     
     # 최근 30일만
@@ -962,8 +1007,8 @@ def count_unique_users(data):
 def save_data(data):
     """데이터 저장"""
     try:
-        with open(DATA_CONFIG["data_file"], 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # 로그 필드 분리 저장을 위해 data_manager 경유
+        save_knowledge_data(data)
         return True
     except Exception as e:
         st.error(f"데이터 저장 실패: {str(e)}")
@@ -974,7 +1019,6 @@ def show_voc_management():
     st.markdown("### 📝 VOC (고객의 소리) 관리")
     
     try:
-        from config import DATA_CONFIG
         voc_file = DATA_CONFIG["voc_file"]
         if os.path.exists(voc_file):
             with open(voc_file, 'r', encoding='utf-8') as f:
@@ -1067,7 +1111,6 @@ def show_wiki_learning_management():
     st.markdown("### 📚 WIKI 학습 요청 관리")
     
     try:
-        from config import DATA_CONFIG
         learning_file = DATA_CONFIG["learning_requests_file"]
         if os.path.exists(learning_file):
             with open(learning_file, 'r', encoding='utf-8') as f:
@@ -1190,7 +1233,6 @@ def show_registration_approval(data):
     
     try:
         # 새 통합 시스템에서 승인 대기 중인 신청 목록 가져오기
-        from user_manager import get_pending_requests
         pending_requests = get_pending_requests()
         
         if pending_requests:
@@ -1261,7 +1303,6 @@ def show_registration_approval(data):
         # 처리된 신청 기록 (최근 10개)
         st.markdown("### 📜 최근 처리 기록")
         
-        from user_manager import get_processed_requests
         processed_requests = get_processed_requests()
         
         if processed_requests:
@@ -1367,7 +1408,6 @@ def show_points_overview(data, all_points):
         # 포인트 차트
         st.markdown("##### 📈 포인트 분포")
 
-        import pandas as pd
         df = pd.DataFrame(table_data)
 
         # 바 차트
@@ -1523,7 +1563,6 @@ def show_points_history(data):
                 "관리자": record.get("admin_user", "시스템")
             })
 
-        import pandas as pd
         df = pd.DataFrame(table_data)
         st.dataframe(df, use_container_width=True)
 
@@ -1540,7 +1579,8 @@ def show_points_history(data):
             st.metric("관련 사용자", f"{unique_users}명")
 
         with col3:
-            recent_changes = len([h for h in history if h.get("timestamp", "").startswith(datetime.now().strftime("%Y-%m-%d"))])
+            today_str = datetime.now().strftime("%Y-%m-%d")  # 루프 밖에서 한 번만 계산
+            recent_changes = sum(1 for h in history if h.get("timestamp", "").startswith(today_str))
             st.metric("오늘 변경", f"{recent_changes}회")
 
     else:
@@ -1555,19 +1595,20 @@ def show_points_data_cleanup(data):
     users_list = get_all_users()
     user_dict = {user.get("knox_id", user.get("user_id", "")): user for user in users_list}
 
-    # 중복 가능성 분석
+    # 중복 가능성 분석 (knox_id 집합 / 이름·닉네임 인덱스는 루프 밖에서 한 번만 생성)
     duplicates_found = []
-    checked_names = set()
+    knox_ids = {user.get("knox_id", "") for user in users_list}
+    name_index = {}
+    for user in users_list:
+        for key in (user.get("name", ""), user.get("nickname", "")):
+            if key:
+                name_index.setdefault(key, user)
 
     for username in all_points.keys():
         # nox_id가 아닌 경우 (레거시 이름 기반)
-        if username not in [user.get("knox_id", "") for user in users_list]:
+        if username not in knox_ids:
             # 실제 사용자 이름과 매칭되는지 확인
-            matching_user = None
-            for user in users_list:
-                if user.get("name", "") == username or user.get("nickname", "") == username:
-                    matching_user = user
-                    break
+            matching_user = name_index.get(username)
 
             if matching_user and matching_user.get("knox_id") in all_points:
                 legacy_points = all_points.get(username, 0)
@@ -1649,7 +1690,6 @@ def show_points_data_cleanup(data):
             })
 
         if preview_df:
-            import pandas as pd
             st.dataframe(pd.DataFrame(preview_df), use_container_width=True)
 
         # 정리 실행 버튼
@@ -1663,7 +1703,6 @@ def show_points_data_cleanup(data):
             if st.button("🧹 데이터 정리 실행", type="primary"):
                 try:
                     # 실제 정리 로직 실행
-                    from utils import cleanup_duplicate_points_data
 
                     # 정리 방법에 따라 처리
                     if cleanup_option == "현재 데이터 유지 (레거시 데이터 삭제)":
@@ -1712,7 +1751,6 @@ def show_index_management():
 
     # 요청 데이터 로드
     try:
-        from config import DATA_CONFIG
         learning_file = DATA_CONFIG["learning_requests_file"]
 
         if os.path.exists(learning_file):
@@ -1924,14 +1962,11 @@ def show_current_indices():
     """현재 인덱스 현황"""
     st.markdown("#### 🎯 현재 활성 인덱스")
 
-    from config import CHATBOT_INDICES, get_available_indices
-
     indices = get_available_indices()
 
     st.write(f"**총 {len(indices)}개의 인덱스가 활성화되어 있습니다.**")
 
     for index_id in indices:
-        from config import get_index_config
         config = get_index_config(index_id)
 
         with st.expander(f"{config.get('display_name', index_id)} ({index_id})"):
@@ -1969,7 +2004,6 @@ def show_index_configuration():
 def update_index_request_status(request_id, new_status):
     """인덱스 요청 상태 업데이트"""
     try:
-        from config import DATA_CONFIG
         learning_file = DATA_CONFIG["learning_requests_file"]
 
         # 데이터 로드
@@ -1996,7 +2030,6 @@ def update_index_request_status(request_id, new_status):
 def update_index_request_notes(request_id, admin_notes):
     """인덱스 요청 관리자 메모 업데이트"""
     try:
-        from config import DATA_CONFIG
         learning_file = DATA_CONFIG["learning_requests_file"]
 
         # 데이터 로드
@@ -18,14 +18,120 @@
 
 import json
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Tuple, Iterable
 
 from auth_manager import get_current_user, get_user_id, get_username
-from data_manager import save_data, load_users_data, save_users_data
+from data_manager import save_data, load_users_data, save_users_data, now_str
 
 logger = logging.getLogger(__name__)
 
+# user_manager 모듈 캐시 (bcrypt 등 의존성 문제를 호출 시점의 try/except에서 처리하도록 지연 로드)
+_USER_MGR = None
+
+def _um():
+    """user_manager 모듈 반환 (최초 호출 시 한 번만 import)"""
+    global _USER_MGR
+    if _USER_MGR is None:
+        import user_manager
+        _USER_MGR = user_manager
+    return _USER_MGR
+
+# utils 모듈 캐시 (utils가 이 모듈을 import하므로 순환 import를 피해 최초 호출 시 한 번만 로드)
+_UTILS = None
+
+def _utils():
+    """utils 모듈 반환 (포인트 적립/사용자 조회용, 최초 호출 시 한 번만 import)"""
+    global _UTILS
+    if _UTILS is None:
+        import utils
+        _UTILS = utils
+    return _UTILS
+
+# 답변 랭킹 캐시 (페이지가 리런마다 데이터를 다시 로드하므로 모듈 단위로 유지)
+_ANSWER_COUNTS_CACHE: Dict[str, Any] = {"signature": None, "counts": Counter()}
+
+def _answers_signature(answers: List[Dict]) -> Tuple[int, str]:
+    """답변 목록 변경 감지용 시그니처 (답변 수 + 마지막 답변 ID, 추가/삭제 시 항상 달라짐)"""
+    return len(answers), answers[-1].get("id", "") if answers else ""
+
+def _is_ranked_author(author: str) -> bool:
+    """랭킹 집계 대상 작성자 여부 (익명/알 수 없음 제외)"""
+    return author != "알 수 없음" and author != "익명"
+
+def _update_answer_counts(signature_before: Tuple[int, str], answers: List[Dict],
+                          added: List[Dict] = (), removed: List[Dict] = ()) -> None:
+    """
+    답변 추가/삭제 시 작성자별 답변 수 캐시를 증분 갱신
+
+    변경 전 시그니처가 캐시와 일치할 때만 갱신하며, 그렇지 않으면
+    다음 get_answer_ranking() 호출에서 전체 재집계됩니다.
+    """
+    if _ANSWER_COUNTS_CACHE["signature"] != signature_before:
+        return
+    counts = _ANSWER_COUNTS_CACHE["counts"]
+    for answer in added:
+        author = answer.get("author", "알 수 없음")
+        if _is_ranked_author(author):
+            counts[author] += 1
+    for answer in removed:
+        author = answer.get("author", "알 수 없음")
+        if _is_ranked_author(author):
+            counts[author] -= 1
+            if counts[author] <= 0:
+                del counts[author]
+    _ANSWER_COUNTS_CACHE["signature"] = _answers_signature(answers)
+
+# 질문 검색 인덱스 (카테고리 → 위치, 단어 → 위치 집합; 질문 목록이 바뀌면 재구성)
+_QUESTION_INDEX: Dict[str, Any] = {"signature": None, "by_category": {}, "by_word": {}}
+
+def _questions_signature(questions: List[Dict]) -> Tuple[int, str, str]:
+    """질문 목록 변경 감지용 시그니처 (질문 수 + 처음/마지막 질문 ID)"""
+    if not questions:
+        return 0, "", ""
+    return len(questions), questions[0].get("id", ""), questions[-1].get("id", "")
+
+def _question_index(questions: List[Dict]) -> Dict[str, Any]:
+    """질문 검색 인덱스 조회 (목록이 바뀌었으면 한 번 재구성)"""
+    signature = _questions_signature(questions)
+    if _QUESTION_INDEX["signature"] != signature:
+        by_category: Dict[str, List[int]] = {}
+        by_word: Dict[str, set] = {}
+        for pos, q in enumerate(questions):
+            by_category.setdefault(q.get("category", ""), []).append(pos)
+            title_cf = q.get("_title_cf") or q.get("title", "").casefold()
+            content_cf = q.get("_content_cf") or q.get("content", "").casefold()
+            for word in set(title_cf.split()) | set(content_cf.split()):
+                by_word.setdefault(word, set()).add(pos)
+        _QUESTION_INDEX.update(signature=signature, by_category=by_category, by_word=by_word)
+    return _QUESTION_INDEX
+
+def _candidate_positions(questions: List[Dict], search_term: str, category_filter: str) -> Optional[set]:
+    """
+    인덱스로 검색 후보 위치 추리기 (None이면 전체가 후보)
+
+    공백이 없는 검색어 조각은 반드시 한 단어 안에 포함되므로, 단어 사전에서
+    조각을 포함하는 단어들의 위치만 모으면 됩니다. 최종 부분 문자열 검사는
+    호출측에서 후보에 대해서만 수행합니다.
+    """
+    index = _question_index(questions)
+    candidates = None
+
+    if category_filter and category_filter != "전체":
+        candidates = set(index["by_category"].get(category_filter, ()))
+
+    for token in search_term.split():
+        matched = set()
+        for word, positions in index["by_word"].items():
+            if token in word:
+                matched |= positions
+        candidates = matched if candidates is None else candidates & matched
+        if not candidates:
+            break
+
+    return candidates
+
 def search_questions(data: Dict, search_term: str = "", category_filter: str = "전체") -> List[Dict]:
     """
     🎯 목적: 질문 검색 및 필터링
@@ -41,27 +147,32 @@ def search_questions(data: Dict, search_term: str = "", category_filter: str = "
 
     try:
         questions = data.get("questions", [])
-
-        # 검색어 필터링
         if search_term:
-            search_term = search_term.lower()
-            questions = [
-                q for q in questions
-                if search_term in q.get("title", "").lower() or
-                   search_term in q.get("content", "").lower()
-            ]
+            search_term = search_term.casefold()
 
-        # 카테고리 필터링
-        if category_filter and category_filter != "전체":
-            questions = [
-                q for q in questions
-                if q.get("category", "") == category_filter
-            ]
+        # 필터가 없으면 인덱스 조회/재구성 없이 정렬만 수행
+        if not search_term and (not category_filter or category_filter == "전체"):
+            return sorted(questions, key=lambda x: x.get("timestamp", ""), reverse=True)
 
-        # 최신순 정렬
-        questions.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+        # 인덱스로 후보만 남기기 (아래 필터는 후보에 대해서만 실행)
+        candidates = _candidate_positions(questions, search_term, category_filter)
+        if candidates is not None:
+            questions = [questions[pos] for pos in sorted(candidates)]
 
-        return questions
+        # 카테고리/검색어 필터를 한 번의 순회로 적용
+        # (카테고리는 단순 비교이므로 먼저 검사, 검색어는 등록 시 미리 계산한 casefold 필드 사용)
+        category = category_filter if category_filter and category_filter != "전체" else None
+        questions = [
+            q for q in questions
+            if (category is None or q.get("category", "") == category) and (
+                not search_term or
+                search_term in (q.get("_title_cf") or q.get("title", "").casefold()) or
+                search_term in (q.get("_content_cf") or q.get("content", "").casefold())
+            )
+        ]
+
+        # 최신순 정렬 (원본 목록 순서를 바꾸면 인덱스 위치가 어긋나므로 새 리스트로)
+        return sorted(questions, key=lambda x: x.get("timestamp", ""), reverse=True)
 
     except Exception as e:
         logger.error(f"질문 검색 중 오류 발생: {e}")
@@ -100,10 +211,12 @@ def add_question(data: Dict, title: str, category: str, content: str, anonymous:
             "content": content,
             "author": "익명" if anonymous else user.get("nickname", "알 수 없음"),
             "author_id": user.get("user_id", ""),
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": now_str(),
             "anonymous": anonymous,
             "views": 0,
-            "tags": []  # 향후 확장용
+            "tags": [],  # 향후 확장용
+            "_title_cf": title.casefold(),  # 검색용 (대소문자 무시 비교)
+            "_content_cf": content.casefold()
         }
 
         # 데이터에 추가
@@ -114,10 +227,9 @@ def add_question(data: Dict, title: str, category: str, content: str, anonymous:
 
         # 포인트 적립 (익명이 아닌 경우만)
         if not anonymous:
-            from utils import add_user_points
             username = user.get("knox_id") or user.get("username", "")
             if username:
-                add_user_points(data, username, 100, "질문 작성")
+                _utils().add_user_points(data, username, 100, "질문 작성", save=False)
                 logger.info(f"포인트 적립: {username} +100P (질문 작성)")
 
         # 데이터 저장
@@ -160,7 +272,7 @@ def add_answer(data: Dict, question_id: str, content: str) -> str:
             "content": content,
             "author": user.get("nickname", "알 수 없음"),
             "author_id": user.get("user_id", ""),
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": now_str(),
             "likes": 0,
             "helpful": False  # 채택 여부 (향후 기능)
         }
@@ -169,13 +281,14 @@ def add_answer(data: Dict, question_id: str, content: str) -> str:
         if "answers" not in data:
             data["answers"] = []
 
+        signature_before = _answers_signature(data["answers"])
         data["answers"].append(answer_data)
+        _update_answer_counts(signature_before, data["answers"], added=[answer_data])
 
         # 포인트 적립
-        from utils import add_user_points
         username = user.get("knox_id") or user.get("username", "")
         if username:
-            add_user_points(data, username, 100, "답변 작성")
+            _utils().add_user_points(data, username, 100, "답변 작성", save=False)
             logger.info(f"포인트 적립: {username} +100P (답변 작성)")
 
         # 데이터 저장
@@ -212,19 +325,21 @@ def toggle_like(data: Dict, answer_id: str) -> bool:
         if "likes" not in data:
             data["likes"] = {}
 
+        # 좋아요 목록은 메모리에서 set으로 관리 (파일에는 정렬된 리스트로 저장됨)
         like_key = f"answer_{answer_id}"
-        if like_key not in data["likes"]:
-            data["likes"][like_key] = []
+        likes = data["likes"].get(like_key)
+        if not isinstance(likes, set):
+            likes = set(likes or ())
+            data["likes"][like_key] = likes
 
         # 좋아요 토글
-        if username in data["likes"][like_key]:
+        liked = username not in likes
+        if not liked:
             # 좋아요 제거
-            data["likes"][like_key].remove(username)
-            liked = False
+            likes.discard(username)
         else:
             # 좋아요 추가
-            data["likes"][like_key].append(username)
-            liked = True
+            likes.add(username)
 
             # 좋아요 추가 시 포인트 적립 (답변 작성자에게)
             # 답변 작성자 찾기
@@ -232,14 +347,12 @@ def toggle_like(data: Dict, answer_id: str) -> bool:
             if answer:
                 answer_author_id = answer.get("author_id", "")
                 # 답변 작성자의 username(knox_id) 찾기
-                from utils import get_all_users
-                users = get_all_users()
+                users = _utils().get_all_users()
                 answer_author = next((u for u in users if u.get("user_id") == answer_author_id), None)
                 if answer_author:
                     answer_author_username = answer_author.get("knox_id") or answer_author.get("username", "")
                     if answer_author_username:
-                        from utils import add_user_points
-                        add_user_points(data, answer_author_username, 10, "답변 좋아요 받음")
+                        _utils().add_user_points(data, answer_author_username, 10, "답변 좋아요 받음", save=False)
                         logger.info(f"포인트 적립: {answer_author_username} +10P (좋아요 받음)")
 
         # 데이터 저장
@@ -260,48 +373,63 @@ def delete_question(data: Dict, question_id: str) -> None:
     - data (Dict): 메인 데이터 저장소
     - question_id (str): 삭제할 질문 ID
     """
+    delete_questions_bulk(data, [question_id])
+
+def delete_questions_bulk(data: Dict, question_ids: Iterable[str]) -> None:
+    """
+    🎯 목적: 여러 질문 일괄 삭제
+
+    삭제할 ID 개수와 무관하게 질문/답변 목록을 각각 한 번만 순회하고,
+    파일도 한 번만 저장합니다.
+
+    📊 입력:
+    - data (Dict): 메인 데이터 저장소
+    - question_ids (Iterable[str]): 삭제할 질문 ID 목록
+    """
 
     try:
+        ids = set(question_ids)
+        if not ids:
+            return
+
         # 질문 삭제
         if "questions" in data:
             data["questions"] = [
                 q for q in data["questions"]
-                if q.get("id") != question_id
+                if q.get("id") not in ids
             ]
 
-        # 관련 답변 삭제
+        # 관련 답변 삭제 (한 번의 순회로 남길 답변/삭제할 답변 분리)
+        removed_answers = []
         if "answers" in data:
-            data["answers"] = [
-                a for a in data["answers"]
-                if a.get("question_id") != question_id
-            ]
-
-        # 관련 좋아요 삭제
-        if "likes" in data:
-            # 해당 질문의 답변들의 좋아요 삭제
-            keys_to_remove = [
-                key for key in data["likes"].keys()
-                if key.startswith("answer_") and
-                any(a.get("question_id") == question_id for a in data.get("answers", [])
-                    if key == f"answer_{a.get('id')}")
-            ]
-            for key in keys_to_remove:
-                del data["likes"][key]
+            signature_before = _answers_signature(data["answers"])
+            kept_answers = []
+            for a in data["answers"]:
+                (removed_answers if a.get("question_id") in ids else kept_answers).append(a)
+            data["answers"] = kept_answers
+            _update_answer_counts(signature_before, kept_answers, removed=removed_answers)
+
+        # 관련 좋아요 삭제 (삭제된 답변의 키만 직접 제거)
+        likes = data.get("likes")
+        if likes:
+            for a in removed_answers:
+                likes.pop(f"answer_{a.get('id')}", None)
 
         # 데이터 저장
         save_data(data)
 
-        logger.info(f"질문 삭제 완료: {question_id}")
+        logger.info(f"질문 삭제 완료: {len(ids)}건 ({', '.join(sorted(ids))})")
 
     except Exception as e:
         logger.error(f"질문 삭제 중 오류 발생: {e}")
 
-def get_answer_ranking(data: Dict) -> List[tuple]:
+def get_answer_ranking(data: Dict, limit: Optional[int] = None) -> List[tuple]:
     """
     🎯 목적: 답변 기반 사용자 랭킹 조회
 
     📊 입력:
     - data (Dict): 메인 데이터 저장소
+    - limit (Optional[int]): 상위 limit명만 반환 (None이면 전체)
 
     📤 출력:
     - List[tuple]: (사용자명, 답변수) 순으로 정렬된 리스트
@@ -309,21 +437,38 @@ def get_answer_ranking(data: Dict) -> List[tuple]:
 
     try:
         answers = data.get("answers", [])
-        user_counts = {}
+        signature = _answers_signature(answers)
 
-        for answer in answers:
-            author = answer.get("author", "알 수 없음")
-            if author != "알 수 없음" and author != "익명":
-                user_counts[author] = user_counts.get(author, 0) + 1
+        # 답변 목록이 바뀌지 않았으면 이전 집계 재사용
+        if _ANSWER_COUNTS_CACHE["signature"] == signature:
+            user_counts = _ANSWER_COUNTS_CACHE["counts"]
+        else:
+            user_counts = Counter(
+                author for author in (a.get("author", "알 수 없음") for a in answers)
+                if _is_ranked_author(author)
+            )
+            _ANSWER_COUNTS_CACHE["signature"] = signature
+            _ANSWER_COUNTS_CACHE["counts"] = user_counts
 
-        # 답변 수 기준 내림차순 정렬
-        ranking = sorted(user_counts.items(), key=lambda x: x[1], reverse=True)
-        return ranking
+        # 답변 수 기준 내림차순 (limit 지정 시 힙으로 상위만 선택)
+        return user_counts.most_common(limit)
 
     except Exception as e:
         logger.error(f"답변 랭킹 조회 중 오류 발생: {e}")
         return []
 
+def get_questions_by_id(data: Dict) -> Dict[str, Dict]:
+    """
+    질문 ID → 질문 조회용 딕셔너리 구성
+
+    답변마다 질문 목록을 선형 탐색(next(...))하지 않도록 한 번만 만들어 재사용합니다.
+    ID가 중복된 경우 목록의 앞쪽 질문을 사용합니다. (기존 next() 탐색과 동일)
+    """
+    questions_by_id: Dict[str, Dict] = {}
+    for q in data.get("questions", []):
+        questions_by_id.setdefault(q["id"], q)
+    return questions_by_id
+
 def get_question_statistics(data: Dict) -> Dict[str, Any]:
     """
     🎯 목적: 질문 통계 조회
@@ -356,10 +501,11 @@ def get_question_statistics(data: Dict) -> Dict[str, Any]:
             "multiple_answers": 0
         }
 
+        # 질문별 답변 수는 답변을 한 번만 순회해 집계 (질문마다 전체 답변을 스캔하지 않음)
+        answers_per_question = Counter(a.get("question_id") for a in answers)
+
         for question in questions:
-            question_id = question.get("id", "")
-            question_answers = [a for a in answers if a.get("question_id") == question_id]
-            answer_count = len(question_answers)
+            answer_count = answers_per_question.get(question.get("id", ""), 0)
 
             if answer_count == 0:
                 answer_distribution["no_answer"] += 1
@@ -418,10 +564,8 @@ def submit_registration_request(username: str, name: str, department: str, passw
 
     try:
         # user_manager.py의 add_registration_request 함수 사용
-        from user_manager import add_registration_request
-
         # knox_id = username으로 전달 (Knox ID)
-        success, message = add_registration_request(
+        success, message = _um().add_registration_request(
             knox_id=username,
             name=name,
             department=department,
@@ -447,8 +591,7 @@ def get_pending_registration_requests(data: Dict) -> List[Dict]:
     """
 
     try:
-        from user_manager import get_pending_requests
-        return get_pending_requests()
+        return _um().get_pending_requests()
 
     except Exception as e:
         logger.error(f"대기 중인 등록 요청 조회 중 오류 발생: {e}")
@@ -468,8 +611,7 @@ def approve_registration_request(data: Dict, request_id: str, admin_username: st
     """
 
     try:
-        from user_manager import approve_registration_request as approve_req
-        success, message = approve_req(request_id, admin_username)
+        success, message = _um().approve_registration_request(request_id, admin_username)
 
         logger.info(f"등록 요청 승인: request_id={request_id} by {admin_username} - {message}")
         return success, message
@@ -493,8 +635,7 @@ def reject_registration_request(data: Dict, request_id: str, admin_username: str
     """
 
     try:
-        from user_manager import reject_registration_request as reject_req
-        success, message = reject_req(request_id, admin_username, reason)
+        success, message = _um().reject_registration_request(request_id, admin_username, reason)
 
         logger.info(f"등록 요청 거부: request_id={request_id} by {admin_username} - {message}")
         return success, message
@@ -515,8 +656,6 @@ def get_qa_activity_summary(data: Dict) -> Dict[str, Any]:
     """
 
     try:
-        from datetime import datetime, timedelta
-
         questions = data.get("questions", [])
         answers = data.get("answers", [])
         today = datetime.now()
@@ -554,12 +693,10 @@ def get_qa_activity_summary(data: Dict) -> Dict[str, Any]:
                 stats["this_month"]["answers"] += 1
 
         # 추가 지표
-        stats["unanswered_questions"] = len([
-            q for q in questions
-            if not any(a.get("question_id") == q.get("id") for a in answers)
-        ])
+        answered_ids = {a.get("question_id") for a in answers}  # 답변이 달린 질문 ID 집합
+        stats["unanswered_questions"] = sum(1 for q in questions if q.get("id") not in answered_ids)
 
-        stats["most_active_users"] = get_answer_ranking(data)[:5]
+        stats["most_active_users"] = get_answer_ranking(data, limit=5)
 
         return stats
 
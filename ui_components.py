@@ -15,12 +15,29 @@
 """
 
 import streamlit as st
-import time
+import uuid
 import logging
 from typing import Any, Optional
 
+from config import MISC_CONFIG
+
 logger = logging.getLogger(__name__)
 
+# 타이핑 효과 설정 - 브라우저 CSS 애니메이션으로 처리 (서버 스레드는 대기하지 않음)
+TYPING_MAX_FRAMES = 30                                                 # 최대 애니메이션 단계 수
+TYPING_MAX_DURATION = 4.0                                              # 최대 애니메이션 시간 (초)
+TYPING_MAX_TEXT_LENGTH = MISC_CONFIG.get("max_typing_text_length", 2000)  # 초과 시 효과 없이 바로 표시
+
+# 위에서 아래로 단계적으로 드러나는 타이핑 애니메이션 (여러 줄 마크다운에도 적용 가능)
+# st.container(key=...)가 붙이는 st-key-<key> 클래스를 대상으로 하므로 본문은 일반 마크다운으로 렌더링됨
+_TYPING_CSS = (
+    "<style>"
+    "@keyframes aeTyping {{ from {{ clip-path: inset(0 0 100% 0); }} to {{ clip-path: inset(0 0 0 0); }} }}"
+    ".st-key-{key} {{ animation: aeTyping {duration:.2f}s steps({steps}, end) both; }}"
+    "</style>"
+)
+
+
 def display_typing_effect(text: str, container, delay: float = None) -> None:
     """
     🎯 목적: 타이핑 효과로 텍스트를 순차적으로 표시
@@ -28,41 +45,38 @@ def display_typing_effect(text: str, container, delay: float = None) -> None:
     📊 입력:
     - text (str): 표시할 텍스트
     - container: Streamlit 컨테이너 객체
-    - delay (float): 문자당 지연 시간 (초)
+    - delay (float): 문자당 애니메이션 시간 (초, 전체 최대 TYPING_MAX_DURATION)
 
     🔄 처리 흐름:
     1. 기본 지연 시간 설정
-    2. 문자별 순차 표시
-    3. 실시간 UI 업데이트
+    2. 전체 텍스트를 한 번에 렌더링
+    3. CSS 키프레임 애니메이션으로 단계적 표시 (서버 대기 없음)
     """
 
     if delay is None:
         delay = 0.05  # 기본 지연 시간: 50ms
 
-    # 빈 문자열로 시작
-    displayed_text = ""
-
-    # 각 문자를 순차적으로 추가하며 표시
-    for char in text:
-        displayed_text += char
-        container.markdown(displayed_text)
-        time.sleep(delay)
-
-def load_css_styles() -> str:
-    """
-    🎯 목적: AE WIKI 전용 CSS 스타일 로드
-
-    📤 출력:
-    - str: CSS 스타일 문자열
-
-    🎨 스타일 포함 요소:
-    - 다크 테마 기본 설정
-    - 버튼 및 입력 요소 스타일
-    - 그라데이션 및 애니메이션
-    - 반응형 레이아웃
-    """
-
-    return """
+    # 효과가 꺼져 있거나 너무 긴 텍스트는 한 번에 표시
+    if not MISC_CONFIG.get("typing_effect_enabled", True) or len(text) > TYPING_MAX_TEXT_LENGTH:
+        container.markdown(text)
+        return
+
+    # 전체 텍스트를 한 번만 보내고 표시 애니메이션은 브라우저에 맡김 (time.sleep/재렌더링 없음)
+    steps = max(1, min(len(text.split()), TYPING_MAX_FRAMES))
+    duration = min(delay * len(text), TYPING_MAX_DURATION)
+    key = f"ae-typing-{uuid.uuid4().hex}"
+    try:
+        with container:  # st.empty() 자리표시자도 요소 하나(box)만 차지하도록 컨테이너 안에 생성
+            box = st.container(key=key)  # Streamlit 1.39+: st-key-<key> 클래스 부여
+    except TypeError:
+        # key 인자를 지원하지 않는 버전은 효과 없이 바로 표시
+        container.markdown(text)
+        return
+    box.markdown(_TYPING_CSS.format(key=key, duration=duration, steps=steps), unsafe_allow_html=True)
+    box.markdown(text)  # 본문은 이스케이프 없이 일반 마크다운으로 렌더링 (코드 블록 등 그대로 표시)
+
+# AE WIKI 전용 CSS (런타임 치환 값이 없으므로 모듈 로드 시 한 번만 생성)
+_CSS_STYLES = """
     <style>
     /* ===== AE WIKI 전용 CSS 스타일 ===== */
 
@@ -492,6 +506,22 @@ def load_css_styles() -> str:
     </style>
     """
 
+def load_css_styles() -> str:
+    """
+    🎯 목적: AE WIKI 전용 CSS 스타일 로드
+
+    📤 출력:
+    - str: CSS 스타일 문자열
+
+    🎨 스타일 포함 요소:
+    - 다크 테마 기본 설정
+    - 버튼 및 입력 요소 스타일
+    - 그라데이션 및 애니메이션
+    - 반응형 레이아웃
+    """
+
+    return _CSS_STYLES
+
 def create_metric_card(title: str, value: str, delta: str = None, delta_color: str = "normal") -> str:
     """
     🎯 목적: 메트릭 카드 HTML 생성
@@ -24,6 +24,10 @@
 
 import json  # JSON 파일 읽기/쓰기용
 import os  # 파일 시스템 접근용
+import atexit  # 종료 시 지연 저장 데이터 기록용
+import threading  # 지연 저장 타이머용
+import shutil  # 백업 파일 복사용 (하드링크 미지원 시)
+import mmap  # 파일 메모리 매핑 (orjson 사용 시 복사 없이 파싱)
 import bcrypt  # 비밀번호 해싱 암호화용
 import uuid  # 고유 사용자 ID 생성용
 from datetime import datetime  # 시간 정보 기록용
@@ -32,10 +36,182 @@ import logging  # 로깅 시스템용
 
 logger = logging.getLogger(__name__)  # 로거 인스턴스 생성
 
+# JSON 직렬화 백엔드 선택 (orjson이 설치되어 있으면 사용, 없으면 표준 json)
+try:
+    import orjson  # 선택적 의존성: 더 빠른 JSON 인코딩/디코딩
+
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)  # UTF-8 바이트로 직렬화
+
+    _loads = orjson.loads  # 바이트 입력을 직접 파싱
+    _LOADS_ACCEPTS_BUFFER = True  # memoryview(mmap) 직접 파싱 가능
+except ImportError:
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')  # 한글 유지, 들여쓰기 2칸
+
+    _loads = json.loads  # 표준 json도 UTF-8 바이트 입력 지원
+    _LOADS_ACCEPTS_BUFFER = False  # 표준 json은 bytes/str만 지원
+
+def _read_json_file(path: str) -> Any:
+    """
+    JSON 파일 파싱 (orjson 사용 시 mmap으로 중간 bytes 복사 없이 파싱)
+
+    Raises:
+        FileNotFoundError: 파일이 없을 때
+        ValueError: JSON 파싱 오류 시
+    """
+    with open(path, 'rb') as f:
+        if _LOADS_ACCEPTS_BUFFER and os.fstat(f.fileno()).st_size > 0:  # 빈 파일은 mmap 불가
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:  # mmap 닫기 전에 버퍼 해제
+                    return _loads(view)
+        return _loads(f.read())
+
 # config.py에서 파일 경로 가져오기
 from config import DATA_CONFIG
 USERS_FILE = DATA_CONFIG["users_management_file"]  # 사용자 데이터 저장 파일 경로
 
+# 저장 시 유지할 백업 파일 수 (users_management.json.1.bak ~ .3.bak)
+_BACKUP_COUNT = 3
+
+# 파싱된 사용자 데이터 캐시 (파일 mtime/크기가 바뀌면 자동 무효화)
+_USERS_CACHE = {"mtime": None, "size": None, "data": None}
+
+class _PendingWriter:
+    """
+    ⏱️ 사용자 데이터 지연 저장 도우미
+
+    짧은 시간(delay초) 안에 들어온 여러 저장 요청을 마지막 스냅샷 한 번의
+    파일 쓰기로 합칩니다. 마지막 로그인 시간처럼 유실되어도 치명적이지 않은
+    변경에만 사용합니다.
+    """
+
+    def __init__(self, delay: float = 0.5):
+        self.delay = delay  # 저장 지연 시간 (초)
+        self.lock = threading.RLock()  # 스냅샷/타이머 보호용 잠금
+        self._data = None  # 아직 파일에 쓰지 않은 최신 스냅샷
+        self._timer = None  # 예약된 저장 타이머
+
+    def pending(self) -> Optional[Dict[str, Any]]:
+        """아직 기록되지 않은 스냅샷 반환 (없으면 None)"""
+        return self._data
+
+    def mark_dirty(self, data: Dict[str, Any]) -> None:
+        """저장할 스냅샷 등록 (타이머가 없으면 delay초 후 저장 예약)"""
+        with self.lock:
+            self._data = data  # 최신 스냅샷으로 교체
+            if self._timer is None:  # 예약된 저장이 없으면 새로 예약
+                self._timer = threading.Timer(self.delay, self.flush_now)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush_now(self) -> bool:
+        """대기 중인 스냅샷을 즉시 파일에 기록"""
+        with self.lock:
+            if self._timer is not None:  # 예약된 타이머 취소
+                self._timer.cancel()
+                self._timer = None
+            data, self._data = self._data, None
+            if data is None:  # 기록할 데이터 없음
+                return True
+            return _write_users_file(data)
+
+_pending_writer = _PendingWriter()
+atexit.register(_pending_writer.flush_now)  # 프로세스 종료 시 남은 변경사항 기록
+
+def _backup_path(index: int) -> str:
+    """index번째 백업 파일 경로 (1이 가장 최근)"""
+    return f"{USERS_FILE}.{index}.bak"
+
+def _load_users_file() -> Dict[str, Any]:
+    """
+    사용자 파일 파싱 (손상 시 최근 백업부터 차례로 복구 시도)
+
+    Raises:
+        FileNotFoundError: 사용자 파일이 없을 때
+        ValueError: 원본과 모든 백업이 손상되었을 때
+    """
+    try:
+        return _read_json_file(USERS_FILE)  # JSON 데이터 파싱
+    except ValueError as e:  # JSON 파싱 실패 (파일 손상)
+        logger.error(f"사용자 데이터 파일 손상: {e}")  # 에러 로깅
+        for index in range(1, _BACKUP_COUNT + 1):  # 최근 백업부터 확인
+            try:
+                data = _read_json_file(_backup_path(index))
+                logger.warning(f"백업 파일에서 사용자 데이터 복구: {_backup_path(index)}")
+                return data
+            except (OSError, ValueError):  # 백업이 없거나 손상된 경우 다음 백업 확인
+                continue
+        raise
+
+def _read_users_data() -> Dict[str, Any]:
+    """
+    📖 캐시된 사용자 관리 데이터 조회 (읽기 전용)
+
+    파일의 mtime/크기가 마지막으로 읽은 시점과 같으면 다시 파싱하지 않고
+    캐시를 그대로 반환합니다. 반환값은 캐시와 공유되므로 수정하면 안 되며,
+    수정 후 저장이 필요한 경우 load_users_data()를 사용합니다.
+    """
+    pending = _pending_writer.pending()  # 지연 저장 대기 중인 최신 스냅샷 우선
+    if pending is not None:
+        return pending
+
+    stat = os.stat(USERS_FILE)  # 파일 상태 조회 (없으면 FileNotFoundError)
+    if stat.st_mtime_ns == _USERS_CACHE["mtime"] and stat.st_size == _USERS_CACHE["size"]:
+        return _USERS_CACHE["data"]  # 파일 변경 없음 - 캐시 반환
+
+    data = _load_users_file()  # JSON 데이터 파싱 (손상 시 백업에서 복구)
+
+    _USERS_CACHE.update(mtime=stat.st_mtime_ns, size=stat.st_size, data=data)  # 캐시 갱신
+    return data
+
+# 대기 중인 회원가입 신청의 knox_id 인덱스 (source 데이터 객체가 바뀌면 재구성)
+_PENDING_INDEX = {"source": None, "knox_ids": frozenset()}
+
+def _get_pending_knox_ids(data: Dict[str, Any]) -> frozenset:
+    """대기 중(pending)인 신청의 knox_id 집합 조회 (캐시된 데이터 기준으로 한 번만 구성)"""
+    if _PENDING_INDEX["source"] is not data:  # 데이터가 새로 로드되었으면 재구성
+        _PENDING_INDEX["knox_ids"] = frozenset(
+            req.get("knox_id") for req in data.get("registration_requests", [])
+            if req.get("status") == "pending"
+        )
+        _PENDING_INDEX["source"] = data
+    return _PENDING_INDEX["knox_ids"]
+
+# 기존 시스템(knowledge_data.json) approved_users의 knox_id 집합 캐시 (파일 mtime 기준)
+_LEGACY_APPROVED_CACHE = {"mtime": None, "knox_ids": frozenset()}
+
+def _get_legacy_approved_ids() -> frozenset:
+    """
+    기존 시스템 승인 사용자 knox_id 집합 조회
+
+    중복 가입 확인 때마다 knowledge_data.json 전체를 파싱하지 않도록
+    파일 수정 시각이 바뀐 경우에만 다시 읽습니다.
+    """
+    data_file = DATA_CONFIG["data_file"]
+    try:
+        mtime = os.stat(data_file).st_mtime_ns  # 파일이 없으면 OSError
+    except OSError:
+        return frozenset()
+
+    if mtime != _LEGACY_APPROVED_CACHE["mtime"]:  # 파일이 변경된 경우에만 재구성
+        main_data = _read_json_file(data_file)
+        _LEGACY_APPROVED_CACHE["knox_ids"] = frozenset(main_data.get("approved_users", {}))
+        _LEGACY_APPROVED_CACHE["mtime"] = mtime
+    return _LEGACY_APPROVED_CACHE["knox_ids"]
+
+def _find_pending_request(data: Dict[str, Any], request_id: str) -> Optional[Dict[str, Any]]:
+    """
+    대기 중(pending)인 신청을 ID로 조회
+
+    신청은 항상 목록 끝에 추가되고 처리된 신청은 앞쪽에 쌓이므로,
+    뒤에서부터 찾으면 처리 이력이 길어져도 최근 신청까지만 확인하면 됩니다.
+    """
+    for req in reversed(data.get("registration_requests", [])):  # 최신 신청부터 역순 조회
+        if req.get("id") == request_id:  # ID는 uuid4이므로 일치하는 신청은 하나뿐
+            return req if req.get("status") == "pending" else None
+    return None
+
 def load_users_data() -> Dict[str, Any]:
     """
     🔄 사용자 관리 데이터 로드 함수
@@ -51,6 +227,8 @@ def load_users_data() -> Dict[str, Any]:
             - login_attempts: 로그인 시도 기록
             - metadata: 시스템 메타데이터
     """
+    _pending_writer.flush_now()  # 지연 저장 대기분을 먼저 기록하여 최신 상태로 로드
+
     if not os.path.exists(USERS_FILE):  # 파일이 존재하지 않으면
         return {  # 기본 구조 반환
             "active_users": {},  # 빈 활성 사용자 딕셔너리
@@ -65,13 +243,47 @@ def load_users_data() -> Dict[str, Any]:
         }
     
     try:
-        with open(USERS_FILE, 'r', encoding='utf-8') as f:  # UTF-8 인코딩으로 파일 열기
-            return json.load(f)  # JSON 데이터 파싱하여 반환
+        # 수정 후 저장하는 호출측을 위해 캐시와 공유하지 않는 새 객체로 파싱
+        # (deepcopy보다 재파싱이 더 빠름)
+        return _load_users_file()  # JSON 데이터 파싱하여 반환 (손상 시 백업에서 복구)
     except Exception as e:  # 파일 읽기 실패 시
         logger.error(f"사용자 데이터 로드 실패: {e}")  # 에러 로깅
         return {"active_users": {}, "registration_requests": [], "sessions": {}, "login_attempts": {}}  # 기본 구조 반환
 
-def save_users_data(data: Dict[str, Any]) -> bool:
+def _rotate_backups() -> None:
+    """백업 파일 회전 (.1 → .2 → .3) 후 현재 파일을 .1 백업으로 보관"""
+    for index in range(_BACKUP_COUNT - 1, 0, -1):  # 오래된 백업부터 한 칸씩 밀기
+        if os.path.exists(_backup_path(index)):
+            os.replace(_backup_path(index), _backup_path(index + 1))
+
+    if os.path.exists(USERS_FILE):  # 현재 파일을 최신 백업으로 보관 (원본은 그대로 유지)
+        try:
+            os.link(USERS_FILE, _backup_path(1))  # 하드링크 (복사 비용 없음)
+        except OSError:  # 하드링크 미지원 파일 시스템
+            shutil.copy2(USERS_FILE, _backup_path(1))
+
+def _write_users_file(data: Dict[str, Any]) -> bool:
+    """
+    사용자 관리 데이터를 파일에 즉시 기록 (원자적 쓰기)
+
+    임시 파일에 기록하고 fsync한 뒤 os.replace로 교체하므로, 쓰기 도중
+    프로세스가 종료되어도 기존 파일이 손상되지 않습니다.
+    """
+    tmp_file = USERS_FILE + ".tmp"  # 임시 파일 경로
+    try:
+        with open(tmp_file, 'wb') as f:  # UTF-8 바이트를 그대로 쓰기
+            f.write(_dumps(data))  # JSON 형태로 데이터 저장 (한글 지원, 들여쓰기 2칸)
+            f.flush()
+            os.fsync(f.fileno())  # 디스크에 완전히 기록된 후 교체
+        _rotate_backups()  # 교체 전 현재 파일 백업
+        os.replace(tmp_file, USERS_FILE)  # 원자적 교체
+        _USERS_CACHE["mtime"] = None  # 읽기 캐시 무효화 (같은 mtime 내 재저장 대비)
+        return True  # 저장 성공
+    except Exception as e:  # 저장 실패 시
+        logger.error(f"사용자 데이터 저장 실패: {e}")  # 에러 로깅
+        return False  # 저장 실패
+
+def save_users_data(data: Dict[str, Any], immediate: bool = True) -> bool:
     """
     💾 사용자 관리 데이터 저장 함수
     
@@ -85,19 +297,25 @@ def save_users_data(data: Dict[str, Any]) -> bool:
             - sessions: 세션 정보
             - login_attempts: 로그인 시도 기록
             - metadata: 시스템 메타데이터
+        immediate (bool): True면 즉시 기록, False면 지연 저장 (짧은 시간 내 저장 요청을 합침)
     
     Returns:
         bool: 저장 성공 여부 (True: 성공, False: 실패)
     """
     try:
         data["metadata"]["last_updated"] = datetime.now().isoformat()  # 마지막 업데이트 시간 갱신
-        with open(USERS_FILE, 'w', encoding='utf-8') as f:  # UTF-8 인코딩으로 파일 쓰기
-            json.dump(data, f, ensure_ascii=False, indent=2)  # JSON 형태로 데이터 저장 (한글 지원, 들여쓰기 2칸)
-        return True  # 저장 성공
-    except Exception as e:  # 저장 실패 시
+    except Exception as e:  # 메타데이터 구조가 없는 경우
         logger.error(f"사용자 데이터 저장 실패: {e}")  # 에러 로깅
         return False  # 저장 실패
 
+    if not immediate:  # 지연 저장 요청
+        _pending_writer.mark_dirty(data)
+        return True
+
+    with _pending_writer.lock:  # 대기 중인 지연 저장이 이후에 덮어쓰지 않도록 함께 처리
+        _pending_writer.flush_now()
+        return _write_users_file(data)
+
 def get_active_user(username: str) -> Optional[Dict[str, Any]]:
     """
     👤 활성 사용자 정보 조회 함수
@@ -119,7 +337,13 @@ def get_active_user(username: str) -> Optional[Dict[str, Any]]:
             - created_at: 계정 생성일
             - last_login: 마지막 로그인
     """
-    data = load_users_data()  # 사용자 데이터 로드
+    try:
+        data = _read_users_data()  # 캐시된 사용자 데이터 조회 (복사 없이 읽기 전용)
+    except FileNotFoundError:  # 사용자 파일이 아직 없으면
+        return None
+    except Exception as e:  # 파일 읽기 실패 시
+        logger.error(f"사용자 데이터 로드 실패: {e}")  # 에러 로깅
+        return None
     return data.get("active_users", {}).get(username)  # 해당 사용자명의 정보 반환 (없으면 None)
 
 def verify_user_password(username: str, password: str) -> bool:
@@ -186,7 +410,7 @@ def authenticate_user(username: str, password: str) -> Tuple[bool, str, Optional
     # 마지막 로그인 시간 업데이트
     data = load_users_data()  # 현재 데이터 로드
     data["active_users"][username]["last_login"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # 로그인 시간 갱신
-    save_users_data(data)  # 업데이트된 데이터 저장
+    save_users_data(data, immediate=False)  # 로그인 시간은 지연 저장 (연속 로그인 시 쓰기 합침)
     
     return True, "로그인 성공", user  # 인증 성공 및 사용자 정보 반환
 
@@ -202,7 +426,13 @@ def get_all_active_users() -> Dict[str, Dict[str, Any]]:
             - 키: 사용자명 (NOX ID)
             - 값: 사용자 정보 딕셔너리 (user_id, name, department, role 등)
     """
-    data = load_users_data()  # 사용자 데이터 로드
+    try:
+        data = _read_users_data()  # 캐시된 사용자 데이터 조회 (복사 없이 읽기 전용)
+    except FileNotFoundError:  # 사용자 파일이 아직 없으면
+        return {}
+    except Exception as e:  # 파일 읽기 실패 시
+        logger.error(f"사용자 데이터 로드 실패: {e}")  # 에러 로깅
+        return {}
     return data.get("active_users", {})  # 활성 사용자 딕셔너리 반환 (없으면 빈 딕셔너리)
 
 def add_registration_request(knox_id: str, name: str, department: str, password: str) -> Tuple[bool, str]:
@@ -223,29 +453,28 @@ def add_registration_request(knox_id: str, name: str, department: str, password:
             - 성공 시: (True, "신청 완료 메시지")
             - 실패 시: (False, "오류 메시지")
     """
-    data = load_users_data()  # 현재 사용자 데이터 로드
+    try:
+        cached = _read_users_data()  # 중복 확인은 캐시된 데이터로 (재파싱 없이)
+    except FileNotFoundError:  # 사용자 파일이 아직 없으면
+        cached = {}
+    except Exception as e:  # 파일 읽기 실패 시
+        logger.error(f"사용자 데이터 로드 실패: {e}")  # 에러 로깅
+        cached = {}
     
     # 중복 확인 - users_management.json의 active_users
-    if knox_id in data.get("active_users", {}):  # 이미 활성 사용자로 등록된 경우
+    if knox_id in cached.get("active_users", {}):  # 이미 활성 사용자로 등록된 경우
         return False, "이미 가입된 사용자입니다"  # 중복 가입 거부
     
     # 중복 확인 - knowledge_data.json의 approved_users (기존 시스템과의 호환성)
     try:
-        import json  # JSON 처리를 위한 임포트
-        from config import DATA_CONFIG  # 설정 파일에서 데이터 경로 가져오기
-        
-        if os.path.exists(DATA_CONFIG["data_file"]):  # 기존 데이터 파일이 존재하면
-            with open(DATA_CONFIG["data_file"], 'r', encoding='utf-8') as f:  # 파일 읽기
-                main_data = json.load(f)  # JSON 데이터 로드
-                if knox_id in main_data.get("approved_users", {}):  # 기존 승인 사용자에 존재하면
-                    return False, "이미 가입된 사용자입니다"  # 중복 가입 거부
+        if knox_id in _get_legacy_approved_ids():  # 기존 승인 사용자에 존재하면 (캐시된 집합 조회)
+            return False, "이미 가입된 사용자입니다"  # 중복 가입 거부
     except Exception as e:  # 기존 데이터 확인 중 오류 발생 시
         logger.warning(f"approved_users 확인 중 오류: {e}")  # 경고 로깅 (치명적이지 않음)
     
-    # 대기 중인 신청 확인
-    for req in data.get("registration_requests", []):  # 모든 신청 목록 확인
-        if req.get("knox_id") == knox_id and req.get("status") == "pending":  # 동일 ID로 대기 중인 신청이 있으면
-            return False, "이미 가입 신청이 진행 중입니다"  # 중복 신청 거부
+    # 대기 중인 신청 확인 (knox_id 인덱스로 O(1) 조회)
+    if knox_id in _get_pending_knox_ids(cached):  # 동일 ID로 대기 중인 신청이 있으면
+        return False, "이미 가입 신청이 진행 중입니다"  # 중복 신청 거부
     
     # 비밀번호 해싱
     try:
@@ -254,7 +483,8 @@ def add_registration_request(knox_id: str, name: str, department: str, password:
     except Exception as e:  # 해싱 실패 시
         return False, f"비밀번호 처리 실패: {e}"  # 해싱 오류 메시지
     
-    # 신청 추가
+    # 신청 추가 (중복 확인을 통과한 경우에만 수정용 데이터 로드)
+    data = load_users_data()  # 현재 사용자 데이터 로드
     request_id = str(uuid.uuid4())  # 고유한 신청 ID 생성
     new_request = {  # 새 신청 정보 구성
         "id": request_id,  # 고유 신청 ID
@@ -327,17 +557,15 @@ def approve_registration_request(request_id: str, admin_username: str) -> Tuple[
     """
     data = load_users_data()  # 현재 사용자 데이터 로드
     
-    # 신청 찾기
-    request_to_approve = None  # 승인할 신청 객체 초기화
-    for req in data.get("registration_requests", []):  # 모든 등록 신청 순회
-        if req.get("id") == request_id and req.get("status") == "pending":  # 해당 ID이고 대기중인 신청이면
-            request_to_approve = req  # 승인할 신청 설정
-            break  # 찾았으면 루프 종료
+    # 신청 찾기 (최신 신청부터 역순 조회)
+    request_to_approve = _find_pending_request(data, request_id)  # 승인할 대기 중 신청
     
     if not request_to_approve:  # 승인할 신청을 찾지 못한 경우
         return False, "승인할 신청을 찾을 수 없습니다"  # 실패 메시지
     
     # 활성 사용자로 추가
+    now = datetime.now()  # 처리 시각은 한 번만 조회 (생성/승인/처리 시간 일관성 유지)
+    now_str = now.strftime("%Y-%m-%d %H:%M:%S")  # 계정 생성/승인 시간 문자열
     user_id = str(uuid.uuid4())  # 새로운 사용자 고유 ID 생성
     new_user = {  # 새 사용자 정보 구성
         "user_id": user_id,  # 고유 사용자 ID
@@ -348,9 +576,9 @@ def approve_registration_request(request_id: str, admin_username: str) -> Tuple[
         "password": request_to_approve["password_hash"],  # 해시된 비밀번호
         "is_active": True,  # 활성 상태로 설정
         "role": "user",  # 일반 사용자 권한
-        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),  # 계정 생성 시간
+        "created_at": now_str,  # 계정 생성 시간
         "last_login": None,  # 마지막 로그인 (아직 없음)
-        "approved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),  # 승인 시간
+        "approved_at": now_str,  # 승인 시간
         "approved_by": admin_username  # 승인한 관리자
     }
     
@@ -358,7 +586,7 @@ def approve_registration_request(request_id: str, admin_username: str) -> Tuple[
     
     # 신청 상태 업데이트
     request_to_approve["status"] = "approved"  # 상태를 승인으로 변경
-    request_to_approve["processed_at"] = datetime.now().isoformat()  # 처리 시간 기록
+    request_to_approve["processed_at"] = now.isoformat()  # 처리 시간 기록
     request_to_approve["processed_by"] = admin_username  # 처리한 관리자 기록
     
     if save_users_data(data):  # 데이터 저장 성공 시
@@ -385,12 +613,8 @@ def reject_registration_request(request_id: str, admin_username: str, reason: st
     """
     data = load_users_data()  # 현재 사용자 데이터 로드
     
-    # 신청 찾기
-    request_to_reject = None  # 거부할 신청 객체 초기화
-    for req in data.get("registration_requests", []):  # 모든 등록 신청 순회
-        if req.get("id") == request_id and req.get("status") == "pending":  # 해당 ID이고 대기중인 신청이면
-            request_to_reject = req  # 거부할 신청 설정
-            break  # 찾았으면 루프 종료
+    # 신청 찾기 (최신 신청부터 역순 조회)
+    request_to_reject = _find_pending_request(data, request_id)  # 거부할 대기 중 신청
     
     if not request_to_reject:  # 거부할 신청을 찾지 못한 경우
         return False, "거부할 신청을 찾을 수 없습니다"  # 실패 메시지
@@ -21,13 +21,22 @@ from utils import function_name  # 기존 방식 유지
 """
 
 import os
+import re
 import sys
+import heapq
+from operator import itemgetter
+from functools import lru_cache
+from datetime import datetime
 import logging
+from typing import Dict, List, Optional
 import streamlit as st
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# Knox ID 허용 문자 패턴 (ASCII 영문자, 숫자, _, -, . / 영문자나 숫자가 최소 1개) - fullmatch로 사용
+_KNOX_ID_RE = re.compile(r"(?=.*[A-Za-z0-9])[A-Za-z0-9_.\-]+")
+
 # ====================================
 # 📁 데이터 관리 모듈
 # ====================================
@@ -36,6 +45,8 @@ try:
         initialize_data,
         save_data,
         load_data,
+        load_data_snapshot,
+        get_data_version,
         initialize_users_data,
         save_users_data,
         load_users_data
@@ -50,6 +61,10 @@ except ImportError as e:
         pass
     def load_data():
         return {}
+    def load_data_snapshot():
+        return {}
+    def get_data_version():
+        return None
     def initialize_users_data():
         return {}
     def save_users_data(data):
@@ -102,6 +117,7 @@ except ImportError as e:
 try:
     from api_manager import (
         call_llm_api,
+        call_llm_api_stream,
         call_rag_api_with_chatbot_type,
         format_source_citations
     )
@@ -110,6 +126,8 @@ except ImportError as e:
     logger.error(f"API 관리 모듈 로드 실패: {e}")
     def call_llm_api(*args, **kwargs):
         return "API 관리 모듈을 로드할 수 없습니다."
+    def call_llm_api_stream(*args, **kwargs):
+        yield "API 관리 모듈을 로드할 수 없습니다."
     def call_rag_api_with_chatbot_type(*args, **kwargs):
         return {"documents": [], "source_info": []}
     def format_source_citations(*args, **kwargs):
@@ -144,8 +162,6 @@ except ImportError as e:
         - user_id: Knox ID 권장 (없으면 자동 추정)
         - chatbot_type: ae_wiki / glossary / jedec / tripmate / lab ...
         """
-        from datetime import datetime
-
         # Knox ID가 없으면 시스템에서 추정
         try:
             from utils import get_username
@@ -222,6 +238,8 @@ try:
         add_answer,
         toggle_like,
         delete_question,
+        delete_questions_bulk,
+        get_questions_by_id,
         get_answer_ranking,
         get_question_statistics,
         submit_registration_request,
@@ -239,59 +257,154 @@ except ImportError as e:
         return ""
     def add_answer(*args, **kwargs):
         return ""
+    def get_questions_by_id(*args, **kwargs):
+        return {}
 
 # ====================================
 # 🔧 설정 모듈
 # ====================================
 try:
-    from config import API_CONFIG, CHATBOT_INDICES, get_index_config, DATA_CONFIG
+    from config import API_CONFIG, AUTH_CONFIG, CHATBOT_INDICES, get_index_config, DATA_CONFIG, MISC_CONFIG
     logger.info("설정 모듈 로드 완료")
 except ImportError as e:
     logger.error(f"설정 모듈 로드 실패: {e}")
     API_CONFIG = {}
+    AUTH_CONFIG = {}
     CHATBOT_INDICES = {}
     DATA_CONFIG = {}
+    MISC_CONFIG = {}
     def get_index_config(index_id):
         return {}
 
+# ====================================
+# 🗃️ 응답 캐시 모듈
+# ====================================
+from cache_manager import TTLCache, normalize_query, history_fingerprint
+
+# 챗봇 응답 캐시 (세션 간 공유, 동일/유사 질문의 RAG+LLM 왕복 생략)
+_RESPONSE_CACHE = TTLCache(
+    maxsize=MISC_CONFIG.get("response_cache_size", 256),
+    ttl=MISC_CONFIG.get("response_cache_ttl", 600)
+)
+
+
+# 유효성 검사 기준값 (검사 호출마다 설정 딕셔너리를 조회하지 않도록 한 번만 읽음)
+_KNOX_ID_MIN = AUTH_CONFIG.get("username_min_length", 3)
+_NICKNAME_MIN = AUTH_CONFIG.get("nickname_min_length", 2)
+
+# ====================================
+# 👥 사용자 관리 모듈 (users_management.json)
+# ====================================
+try:
+    from user_manager import (
+        load_users_data as load_user_mgr_data,
+        save_users_data as save_user_mgr_data,
+        get_all_active_users
+    )
+    logger.info("사용자 관리 모듈 로드 완료")
+except ImportError as e:
+    logger.error(f"사용자 관리 모듈 로드 실패: {e}")
+    def load_user_mgr_data():
+        return {}
+    def save_user_mgr_data(data):
+        return False
+    def get_all_active_users():
+        return {}
+
 # ====================================
 # 🔧 헬퍼 함수들
 # ====================================
+# 인덱스 설정은 프로세스 내에서 정적이므로 챗봇 타입별 조회 결과를 캐싱
+@lru_cache(maxsize=16)
 def get_index_system_prompt(chatbot_type: str) -> str:
     """인덱스별 시스템 프롬프트 반환"""
     try:
         config = get_index_config(chatbot_type)
         return config.get("system_prompt", "당신은 전문 AI 어시스턴트입니다.")
-    except:
+    except Exception:
         return "당신은 전문 AI 어시스턴트입니다."
 
+@lru_cache(maxsize=16)
 def get_index_rag_name(chatbot_type: str) -> str:
     """인덱스별 RAG 인덱스명 반환"""
     try:
         config = get_index_config(chatbot_type)
         return config.get("index_name", f"rp-{chatbot_type}")
-    except:
+    except Exception:
         return f"rp-{chatbot_type}"
 
-def get_chatbot_response(user_message: str, chat_history=None, user_id=None, system_prompt=None, chatbot_type="ae_wiki") -> str:
-    """통합 챗봇 응답 생성"""
+def _prepare_llm_kwargs(user_message: str, chat_history, user_id, system_prompt, chatbot_type) -> dict:
+    """RAG 검색 후 LLM 호출 인자 구성 (일반/스트리밍 응답 공통)"""
+    rag_result = call_rag_api_with_chatbot_type(user_message, chatbot_type)
+
+    return {
+        "user_message": user_message,
+        "retrieve_data": rag_result.get("documents", []),
+        "chat_history": chat_history,
+        "source_data": rag_result.get("source_info", []),
+        "user_id": user_id,
+        "custom_system_prompt": system_prompt,
+        "chatbot_type": chatbot_type
+    }
+
+def _stream_chatbot_response(cache_key, user_message: str, chat_history, user_id, system_prompt, chatbot_type):
+    """get_chatbot_response(stream=True)의 제너레이터 본체"""
+    cached = _RESPONSE_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info(f"챗봇 응답 캐시 적중: {chatbot_type}")
+        yield cached
+        return
+
+    try:
+        llm_kwargs = _prepare_llm_kwargs(user_message, chat_history, user_id, system_prompt, chatbot_type)
+
+        chunks = []
+        for chunk in call_llm_api_stream(**llm_kwargs):
+            chunks.append(chunk)
+            yield chunk
+
+        if chunks:
+            _RESPONSE_CACHE.set(cache_key, "".join(chunks))
+
+    except Exception as e:
+        logger.error(f"챗봇 응답 생성 중 오류: {e}")
+        yield f"죄송합니다. 시스템 오류가 발생했습니다: {str(e)}"
+
+def get_chatbot_response(user_message: str, chat_history=None, user_id=None, system_prompt=None, chatbot_type="ae_wiki", stream: bool = False):
+    """
+    통합 챗봇 응답 생성 (정규화된 질문 + 대화 윈도우 기준 응답 캐시 사용)
+
+    stream=True이면 답변 조각을 yield하는 제너레이터를 반환하고,
+    기본값(False)이면 완성된 답변 문자열을 반환합니다.
+    """
+    # 페이지에서 현재 질문을 이미 chat_history 끝에 추가해 전달하므로 지문 계산에서 제외
+    history_window = chat_history
+    if chat_history and chat_history[-1].get("role") == "user" and chat_history[-1].get("content") == user_message:
+        history_window = chat_history[:-1]
+
+    cache_key = (
+        chatbot_type,
+        system_prompt or "",
+        normalize_query(user_message),
+        history_fingerprint(history_window)
+    )
+
+    if stream:
+        return _stream_chatbot_response(cache_key, user_message, chat_history, user_id, system_prompt, chatbot_type)
+
+    cached = _RESPONSE_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info(f"챗봇 응답 캐시 적중: {chatbot_type}")
+        return cached
+
     try:
-        # RAG 검색
-        rag_result = call_rag_api_with_chatbot_type(user_message, chatbot_type)
-        retrieve_data = rag_result.get("documents", [])
-        source_data = rag_result.get("source_info", [])
-
-        # LLM 응답 생성
-        response = call_llm_api(
-            user_message=user_message,
-            retrieve_data=retrieve_data,
-            chat_history=chat_history,
-            source_data=source_data,
-            user_id=user_id,
-            custom_system_prompt=system_prompt,
-            chatbot_type=chatbot_type
-        )
+        # RAG 검색 후 LLM 응답 생성
+        llm_kwargs = _prepare_llm_kwargs(user_message, chat_history, user_id, system_prompt, chatbot_type)
+        response = call_llm_api(**llm_kwargs)
 
+        # 정상 응답만 캐싱 (오류 응답은 재시도 가능하도록 저장하지 않음)
+        if isinstance(response, str) and response:
+            _RESPONSE_CACHE.set(cache_key, response)
         return response
 
     except Exception as e:
@@ -301,14 +414,25 @@ def get_chatbot_response(user_message: str, chat_history=None, user_id=None, sys
 # ====================================
 # 🔧 포인트 시스템 관리
 # ====================================
+
+# 랭킹 상위 k명 선택 시 heapq.nlargest로 전환하는 기준 (k < n * 임계값)
+_TOPK_HEAP_THRESHOLD = 0.5
+
+# 포인트 변경 기록 슬라이딩 윈도우 크기 (메인 데이터 파일이 무한히 커지지 않도록 최근 기록만 유지)
+POINT_HISTORY_MAX = 500
+
+# 포인트 변경 기록의 사용자별 인덱스 (메모리 전용 - data에 넣으면 save_data()로 파일에 저장되므로 분리)
+# history는 인덱스를 만든 기록 리스트 자체를 참조하여 다른 리스트와 혼동하지 않도록 함
+_POINT_HISTORY_INDEX: Dict[str, object] = {"history": None, "length": 0, "index": {}}
+
 def award_points(points: int, activity: str) -> bool:
     """어디서 호출하든 안전하게 포인트 지급"""
-    data = initialize_data()        # data 스코프 문제 방지
     key = get_points_key()           # Unknown 방지
 
     if not key:
         return False
 
+    data = initialize_data()        # 키가 있을 때만 데이터 로드 (불필요한 JSON 파싱 방지)
     add_user_points(data, key, points, activity)  # 내부에서 save_data()까지 함
     return True
 
@@ -327,16 +451,19 @@ def get_points_key() -> str:
            st.session_state.get("auth_user") or "").strip()
     return key
 
-def add_user_points(data, username: str, points: int, activity_type: str) -> None:
-    """사용자 포인트 추가"""
-    try:
-        if "user_points" not in data:
-            data["user_points"] = {}
+def add_user_points(data, username: str, points: int, activity_type: str, save: bool = True) -> None:
+    """
+    사용자 포인트 추가
 
-        current_points = data["user_points"].get(username, 0)
-        data["user_points"][username] = current_points + points
+    호출 측에서 곧바로 save_data()를 수행하는 경우 save=False로 전달하여
+    동일 요청 내 중복 파일 쓰기를 피합니다.
+    """
+    try:
+        user_points = data.setdefault("user_points", {})
+        user_points[username] = user_points.get(username, 0) + points
 
-        save_data(data)
+        if save:
+            save_data(data)
         logger.info(f"포인트 추가: {username} +{points} ({activity_type})")
 
     except Exception as e:
@@ -344,24 +471,28 @@ def add_user_points(data, username: str, points: int, activity_type: str) -> Non
 
 def get_user_points(data, username: str) -> int:
     """사용자 포인트 조회"""
-    try:
-        return data.get("user_points", {}).get(username, 0)
-    except Exception as e:
-        logger.error(f"포인트 조회 실패: {e}")
-        return 0
+    user_points = data.get("user_points")
+    return user_points.get(username, 0) if user_points else 0
 
 def get_current_user_points(data) -> int:
-    key = get_points_key()
-    return data.get("user_points", {}).get(key, 0)
+    user_points = data.get("user_points")
+    return user_points.get(get_points_key(), 0) if user_points else 0
 
 def set_user_points(data, username: str, new_points: int, admin_user: str = None) -> bool:
     """사용자 포인트 설정 (관리자 기능)"""
     try:
-        if "user_points" not in data:
-            data["user_points"] = {}
-
-        old_points = data["user_points"].get(username, 0)
-        data["user_points"][username] = new_points
+        user_points = data.setdefault("user_points", {})
+        old_points = user_points.get(username, 0)
+        user_points[username] = new_points
+
+        append_point_history(data, {
+            "timestamp": datetime.now().isoformat(),
+            "username": username,
+            "old_points": old_points,
+            "new_points": new_points,
+            "reason": "포인트 설정",
+            "admin_user": admin_user
+        })
 
         save_data(data)
         logger.info(f"포인트 설정: {username} {old_points} -> {new_points} (by {admin_user})")
@@ -374,12 +505,20 @@ def set_user_points(data, username: str, new_points: int, admin_user: str = None
 def adjust_user_points(data, username: str, point_change: int, reason: str = "", admin_user: str = None) -> bool:
     """사용자 포인트 조정 (관리자 기능)"""
     try:
-        if "user_points" not in data:
-            data["user_points"] = {}
-
-        old_points = data["user_points"].get(username, 0)
+        user_points = data.setdefault("user_points", {})
+        old_points = user_points.get(username, 0)
         new_points = max(0, old_points + point_change)  # 음수 방지
-        data["user_points"][username] = new_points
+        user_points[username] = new_points
+
+        append_point_history(data, {
+            "timestamp": datetime.now().isoformat(),
+            "username": username,
+            "old_points": old_points,
+            "new_points": new_points,
+            "point_change": point_change,
+            "reason": reason or "수동 조정",
+            "admin_user": admin_user
+        })
 
         save_data(data)
         logger.info(f"포인트 조정: {username} {old_points} -> {new_points} ({point_change:+d}) (by {admin_user})")
@@ -389,12 +528,15 @@ def adjust_user_points(data, username: str, point_change: int, reason: str = "",
         logger.error(f"포인트 조정 실패: {e}")
         return False
 
-def get_user_points_ranking(data) -> list:
-    """사용자 포인트 랭킹 조회"""
+def get_user_points_ranking(data, limit: Optional[int] = None) -> list:
+    """사용자 포인트 랭킹 조회 (limit 지정 시 상위 limit명만 반환)"""
     try:
-        user_points = data.get("user_points", {})
-        ranking = sorted(user_points.items(), key=lambda x: x[1], reverse=True)
-        return ranking
+        items = data.get("user_points", {}).items()
+
+        # 상위 일부만 필요할 때만 힙 선택, 그 외에는 전체 정렬이 더 빠름
+        if limit is None or limit >= len(items) * _TOPK_HEAP_THRESHOLD:
+            return sorted(items, key=itemgetter(1), reverse=True)[:limit]
+        return heapq.nlargest(limit, items, key=itemgetter(1))
     except Exception as e:
         logger.error(f"포인트 랭킹 조회 실패: {e}")
         return []
@@ -407,18 +549,56 @@ def get_all_user_points(data) -> dict:
         logger.error(f"전체 사용자 포인트 조회 실패: {e}")
         return {}
 
+def _rebuild_point_history_index(history: list) -> Dict[str, List[int]]:
+    """포인트 변경 기록의 사용자별 인덱스 재구성 ({username: [history 인덱스]})"""
+    index = {}
+    for i, entry in enumerate(history):
+        index.setdefault(entry.get("username", ""), []).append(i)
+    _POINT_HISTORY_INDEX.update(history=history, length=len(history), index=index)
+    return index
+
+def _get_point_history_index(data) -> Dict[str, List[int]]:
+    """사용자별 인덱스 조회 (다른 기록 리스트이거나 길이가 바뀌었으면 지연 재구성)"""
+    history = data.get("point_change_history", [])
+    if _POINT_HISTORY_INDEX["history"] is not history or _POINT_HISTORY_INDEX["length"] != len(history):
+        return _rebuild_point_history_index(history)
+    return _POINT_HISTORY_INDEX["index"]
+
+def append_point_history(data, entry: dict) -> None:
+    """
+    포인트 변경 기록 추가 (저장은 호출측에서)
+
+    최근 POINT_HISTORY_MAX개만 유지하며, 사용자별 인덱스는 앞부분이 잘리지 않은 경우에만 증분 갱신합니다.
+    """
+    data.pop("_point_history_by_user", None)  # 이전 버전에서 data에 저장하던 인덱스 제거
+    history = data.setdefault("point_change_history", [])
+    index = _get_point_history_index(data)
+    index.setdefault(entry.get("username", ""), []).append(len(history))
+    history.append(entry)
+    if _POINT_HISTORY_INDEX["history"] is history:
+        _POINT_HISTORY_INDEX["length"] = len(history)
+
+    if len(history) > POINT_HISTORY_MAX:
+        del history[:len(history) - POINT_HISTORY_MAX]
+        _rebuild_point_history_index(history)  # 위치가 당겨졌으므로 재구성
+
 def get_point_change_history(data, username: str = None, limit: int = 50) -> list:
     """포인트 변경 기록 조회"""
     try:
         history = data.get("point_change_history", [])
 
-        # 특정 사용자 필터링
+        # 특정 사용자 필터링 (전체 스캔 대신 사용자별 인덱스 사용)
         if username:
-            history = [h for h in history if h.get("username") == username]
+            idxs = _get_point_history_index(data).get(username, [])
+            history = [history[i] for i in idxs]
 
-        # 최신순 정렬 및 제한
-        history = sorted(history, key=lambda x: x.get("timestamp", ""), reverse=True)
-        return history[:limit]
+        # 최신순 상위 limit개만 선택 (전체 정렬 불필요)
+        # set/adjust_user_points가 항상 timestamp를 기록하므로 C 구현 itemgetter를 키로 사용
+        try:
+            return heapq.nlargest(limit, history, key=itemgetter("timestamp"))
+        except KeyError:
+            # timestamp가 없는 레거시 기록이 섞인 경우
+            return heapq.nlargest(limit, history, key=lambda x: x.get("timestamp", ""))
     except Exception as e:
         logger.error(f"포인트 변경 기록 조회 실패: {e}")
         return []
@@ -426,23 +606,25 @@ def get_point_change_history(data, username: str = None, limit: int = 50) -> lis
 def cleanup_duplicate_points_data(data, method: str = "keep_current") -> bool:
     """중복 포인트 데이터 정리"""
     try:
-        from datetime import datetime
-
         user_points = data.get("user_points", {})
         users_list = get_all_users()
-        user_dict = {user.get("knox_id", user.get("user_id", "")): user for user in users_list}
+
+        # 루프 밖에서 한 번만 조회용 인덱스 구성 (knox_id 집합, 이름/닉네임 -> 사용자)
+        # 역순으로 덮어써서 기존과 같이 "먼저 나온 사용자/이름 키 우선" 규칙 유지
+        knox_ids = {user.get("knox_id", "") for user in users_list}
+        name_index = {
+            key: user
+            for user in reversed(users_list)
+            for key in (user.get("nickname", ""), user.get("name", ""))
+        }
 
         # 중복 데이터 찾기
         duplicates_found = []
         for username in list(user_points.keys()):
             # knox_id가 아닌 경우 (레거시 이름 기반)
-            if username not in [user.get("knox_id", "") for user in users_list]:
+            if username not in knox_ids:
                 # 실제 사용자 이름과 매칭되는지 확인
-                matching_user = None
-                for user in users_list:
-                    if user.get("name", "") == username or user.get("nickname", "") == username:
-                        matching_user = user
-                        break
+                matching_user = name_index.get(username)
 
                 if matching_user and matching_user.get("knox_id") in user_points:
                     legacy_key = username
@@ -492,11 +674,11 @@ def cleanup_duplicate_points_data(data, method: str = "keep_current") -> bool:
 # ====================================
 def validate_knox_id(knox_id: str):
     """Knox ID 유효성 검사"""
-    if not knox_id or len(knox_id.strip()) == 0:
+    if not knox_id or not knox_id.strip():
         return False, "Knox ID를 입력해주세요."
-    if len(knox_id) < 3:
-        return False, "Knox ID는 최소 3자 이상이어야 합니다."
-    if not knox_id.replace("_", "").replace("-", "").replace(".", "").isalnum():
+    if len(knox_id) < _KNOX_ID_MIN:
+        return False, f"Knox ID는 최소 {_KNOX_ID_MIN}자 이상이어야 합니다."
+    if not _KNOX_ID_RE.fullmatch(knox_id):
         return False, "Knox ID는 영문자, 숫자, _, -, . 만 사용 가능합니다."
     return True, "유효한 Knox ID입니다."
 
@@ -504,8 +686,8 @@ def validate_nickname(nickname: str):
     """닉네임 유효성 검사"""
     if not nickname or len(nickname.strip()) == 0:
         return False, "닉네임을 입력해주세요."
-    if len(nickname) < 2:
-        return False, "닉네임은 최소 2자 이상이어야 합니다."
+    if len(nickname) < _NICKNAME_MIN:
+        return False, f"닉네임은 최소 {_NICKNAME_MIN}자 이상이어야 합니다."
     if len(nickname) > 20:
         return False, "닉네임은 최대 20자까지 가능합니다."
     return True, "유효한 닉네임입니다."
@@ -518,128 +700,194 @@ def validate_department(department: str):
         return False, "부서명은 최소 2자 이상이어야 합니다."
     return True, "유효한 부서명입니다."
 
+def _users_file_mtime() -> float:
+    """users_management.json 수정 시각 (캐시 키용, 파일이 없으면 0)"""
+    try:
+        return os.path.getmtime(DATA_CONFIG["users_management_file"])
+    except (OSError, KeyError):
+        return 0.0
+
+def _normalize_user(knox_id: str, user_data: dict) -> dict:
+    """active_users 항목을 리스트 형식 사용자 정보로 변환 (하위 호환 필드 + 검색용 문자열)"""
+    nickname = user_data.get("nickname", user_data.get("name", "")) or ""
+    department = user_data.get("department", "") or ""
+    return {
+        "user_id": user_data.get("user_id", ""),
+        "knox_id": knox_id,
+        "username": knox_id,  # 호환성
+        "nickname": nickname,
+        "name": user_data.get("name", ""),
+        "department": department,
+        "is_active": user_data.get("is_active", True),
+        "created_at": user_data.get("created_at", ""),
+        "last_login": user_data.get("last_login", ""),
+        # 검색용 소문자 문자열 (필드 경계 넘김 매칭 방지를 위해 \x1f로 구분)
+        "_search_blob": f"{knox_id}\x1f{nickname}\x1f{department}".lower()
+    }
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _get_all_users_cached(users_file_mtime: float) -> list:
+    """
+    사용자 목록 캐시 (한 번의 rerun 동안 users_management.json 재로딩 방지)
+
+    users_file_mtime을 캐시 키로 사용하므로 파일이 변경되면 자동으로 새로 로드됩니다.
+    """
+    # user_manager.py는 딕셔너리를 반환하므로 한 번의 순회로 리스트 변환
+    return [
+        _normalize_user(knox_id, user_data)
+        for knox_id, user_data in get_all_active_users().items()
+    ]
+
 def get_all_users():
-    """모든 사용자 조회 (user_manager.py의 active_users 사용)"""
+    """모든 사용자 조회 (user_manager.py의 active_users 사용, 캐시 적용)"""
     try:
-        from user_manager import get_all_active_users
-
-        # user_manager.py는 딕셔너리를 반환하므로 리스트로 변환
-        active_users_dict = get_all_active_users()
-
-        # 딕셔너리의 값들을 리스트로 변환
-        users_list = []
-        for knox_id, user_data in active_users_dict.items():
-            # 리스트 형식으로 변환 (하위 호환성을 위해)
-            user_dict = {
-                "user_id": user_data.get("user_id", ""),
-                "knox_id": knox_id,
-                "username": knox_id,  # 호환성
-                "nickname": user_data.get("nickname", user_data.get("name", "")),
-                "name": user_data.get("name", ""),
-                "department": user_data.get("department", ""),
-                "is_active": user_data.get("is_active", True),
-                "created_at": user_data.get("created_at", ""),
-                "last_login": user_data.get("last_login", "")
-            }
-            users_list.append(user_dict)
-
-        return users_list
+        return _get_all_users_cached(_users_file_mtime())
 
     except Exception as e:
         logger.error(f"사용자 목록 조회 실패: {e}")
         return []
 
-def search_users(keyword: str = ""):
-    """사용자 검색"""
+def search_users(keyword: str = "", department: Optional[str] = None):
+    """사용자 검색 (department 지정 시 부서 필터까지 한 번의 순회로 적용)"""
     try:
         users = get_all_users()
-        if not keyword:
+        if not keyword and not department:
             return users
 
         keyword = keyword.lower()
-        filtered_users = []
-
-        for user in users:
-            if (keyword in user.get("username", "").lower() or
-                keyword in user.get("nickname", "").lower() or
-                keyword in user.get("knox_id", "").lower() or
-                keyword in user.get("department", "").lower()):
-                filtered_users.append(user)
-
-        return filtered_users
+        return [
+            user for user in users
+            if keyword in user.get("_search_blob", "")
+            and (not department or user.get("department") == department)
+        ]
     except Exception as e:
         logger.error(f"사용자 검색 실패: {e}")
         return []
 
-def toggle_user_status(user_id: str) -> bool:
-    """사용자 상태 토글 (user_manager.py 사용)"""
-    try:
-        from user_manager import load_users_data as load_user_mgr_data, save_users_data as save_user_mgr_data
+# user_id -> knox_id 역방향 인덱스 캐시 (users_management.json 수정 시각 기준으로 재구성)
+_USER_ID_INDEX_CACHE = {"mtime": None, "index": {}}
+
+def _index_user_ids(active_users: Dict[str, Dict]) -> Dict[str, str]:
+    """active_users에서 user_id -> knox_id 역방향 인덱스 생성 (중복 시 첫 항목 우선)"""
+    knox_by_user_id = {}
+    for knox_id, user_data in active_users.items():
+        knox_by_user_id.setdefault(user_data.get("user_id"), knox_id)
+    return knox_by_user_id
 
+def _find_knox_id(active_users: Dict[str, Dict], user_id: str) -> Optional[str]:
+    """
+    user_id로 knox_id 조회
+
+    캐시된 역방향 인덱스로 O(1) 조회하고, 인덱스가 현재 데이터와 맞지 않으면
+    (파일 변경, 같은 요청 내 삭제 등) active_users에서 다시 구성합니다.
+    """
+    mtime = _users_file_mtime()
+    if _USER_ID_INDEX_CACHE["mtime"] != mtime:
+        _USER_ID_INDEX_CACHE["index"] = _index_user_ids(active_users)
+        _USER_ID_INDEX_CACHE["mtime"] = mtime
+
+    knox_id = _USER_ID_INDEX_CACHE["index"].get(user_id)
+    if knox_id is None or active_users.get(knox_id, {}).get("user_id") != user_id:
+        _USER_ID_INDEX_CACHE["index"] = _index_user_ids(active_users)
+        knox_id = _USER_ID_INDEX_CACHE["index"].get(user_id)
+    return knox_id
+
+def toggle_user_status_bulk(user_ids: List[str]) -> Dict[str, bool]:
+    """
+    여러 사용자 상태 일괄 토글 (user_manager.py 사용)
+
+    users_management.json을 한 번만 읽고 한 번만 저장합니다.
+
+    Returns:
+        Dict[str, bool]: user_id별 처리 성공 여부
+    """
+    results = {user_id: False for user_id in user_ids}
+    try:
         users_data = load_user_mgr_data()
         active_users = users_data.get("active_users", {})
 
-        # user_id로 사용자 찾기
-        for knox_id, user_data in active_users.items():
-            if user_data.get("user_id") == user_id:
-                # is_active 상태 토글
-                current_status = user_data.get("is_active", True)
-                user_data["is_active"] = not current_status
-                save_user_mgr_data(users_data)
-                logger.info(f"사용자 상태 토글: {knox_id} -> {user_data['is_active']}")
-                return True
-
-        logger.warning(f"사용자를 찾을 수 없음: user_id={user_id}")
-        return False
+        for user_id in user_ids:
+            knox_id = _find_knox_id(active_users, user_id)
+            if knox_id is None:
+                logger.warning(f"사용자를 찾을 수 없음: user_id={user_id}")
+                continue
+
+            # is_active 상태 토글
+            user_data = active_users[knox_id]
+            user_data["is_active"] = not user_data.get("is_active", True)
+            results[user_id] = True
+            logger.info(f"사용자 상태 토글: {knox_id} -> {user_data['is_active']}")
+
+        if any(results.values()):
+            if not save_user_mgr_data(users_data):
+                return {user_id: False for user_id in user_ids}
+            _get_all_users_cached.clear()
+
+        return results
 
     except Exception as e:
         logger.error(f"사용자 상태 토글 실패: {e}")
-        return False
+        return {user_id: False for user_id in user_ids}
 
-def delete_user(user_id: str) -> bool:
-    """사용자 삭제 (user_manager.py 사용)"""
-    try:
-        from user_manager import load_users_data as load_user_mgr_data, save_users_data as save_user_mgr_data
+def toggle_user_status(user_id: str) -> bool:
+    """사용자 상태 토글 (user_manager.py 사용)"""
+    return toggle_user_status_bulk([user_id])[user_id]
+
+def delete_user_bulk(user_ids: List[str]) -> Dict[str, bool]:
+    """
+    여러 사용자 일괄 삭제 (user_manager.py 사용)
 
+    users_management.json을 한 번만 읽고 한 번만 저장합니다.
+
+    Returns:
+        Dict[str, bool]: user_id별 삭제 성공 여부
+    """
+    results = {user_id: False for user_id in user_ids}
+    try:
         users_data = load_user_mgr_data()
         active_users = users_data.get("active_users", {})
 
-        # user_id로 사용자 찾아서 삭제
-        knox_id_to_delete = None
-        for knox_id, user_data in active_users.items():
-            if user_data.get("user_id") == user_id:
-                knox_id_to_delete = knox_id
-                break
+        for user_id in user_ids:
+            knox_id_to_delete = _find_knox_id(active_users, user_id)
+            if knox_id_to_delete is None:
+                logger.warning(f"삭제할 사용자를 찾을 수 없음: user_id={user_id}")
+                continue
 
-        if knox_id_to_delete:
             del active_users[knox_id_to_delete]
-            save_user_mgr_data(users_data)
+            results[user_id] = True
             logger.info(f"사용자 삭제: {knox_id_to_delete}")
-            return True
 
-        logger.warning(f"삭제할 사용자를 찾을 수 없음: user_id={user_id}")
-        return False
+        if any(results.values()):
+            if not save_user_mgr_data(users_data):
+                return {user_id: False for user_id in user_ids}
+            _get_all_users_cached.clear()
+
+        return results
 
     except Exception as e:
         logger.error(f"사용자 삭제 실패: {e}")
-        return False
+        return {user_id: False for user_id in user_ids}
+
+def delete_user(user_id: str) -> bool:
+    """사용자 삭제 (user_manager.py 사용)"""
+    return delete_user_bulk([user_id])[user_id]
 
 def update_user_info(user_id: str, nickname: str, department: str):
     """사용자 정보 수정 (user_manager.py 사용)"""
     try:
-        from user_manager import load_users_data as load_user_mgr_data, save_users_data as save_user_mgr_data
-
         users_data = load_user_mgr_data()
         active_users = users_data.get("active_users", {})
 
         # user_id로 사용자 찾아서 수정
-        for knox_id, user_data in active_users.items():
-            if user_data.get("user_id") == user_id:
-                user_data["nickname"] = nickname
-                user_data["department"] = department
-                save_user_mgr_data(users_data)
-                logger.info(f"사용자 정보 수정: {knox_id} - {nickname}, {department}")
-                return True, "사용자 정보가 수정되었습니다."
+        knox_id = _find_knox_id(active_users, user_id)
+        if knox_id is not None:
+            user_data = active_users[knox_id]
+            user_data["nickname"] = nickname
+            user_data["department"] = department
+            save_user_mgr_data(users_data)
+            _get_all_users_cached.clear()
+            logger.info(f"사용자 정보 수정: {knox_id} - {nickname}, {department}")
+            return True, "사용자 정보가 수정되었습니다."
 
         logger.warning(f"수정할 사용자를 찾을 수 없음: user_id={user_id}")
         return False, "사용자를 찾을 수 없습니다."
@@ -663,7 +911,6 @@ def resolve_user_label(user_key: str) -> str:
     화면 표시용 닉네임(없으면 실명, 없으면 원래 키)으로 변환한다.
     """
     try:
-        from utils import get_all_users  # self-import 회피
         users = get_all_users()
     except Exception:
         return user_key or "Unknown"
@@ -682,7 +929,6 @@ def resolve_to_knox_id(user_key: str) -> str:
     일치하는 사용자가 없으면 원래 값을 그대로 반환한다.
     """
     try:
-        from utils import get_all_users
         users = get_all_users()
     except Exception:
         return user_key or "Unknown"
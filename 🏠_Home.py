@@ -30,13 +30,15 @@
 
 # 실행 방법: streamlit run 🏠_Home.py
 
+from html import escape
+
 import streamlit as st
 
 from config import APP_CONFIG
 from utils import (
-    load_css_styles, require_login, get_current_user, logout_user, initialize_session_state,
-    initialize_data, get_user_points_ranking, check_session_validity,
-    resolve_user_label
+    load_css_styles, require_login, get_current_user, logout_user,
+    load_data_snapshot, get_data_version, get_user_points_ranking, check_session_validity,
+    resolve_user_label, get_questions_by_id
 )
 
 # ====================================
@@ -54,8 +56,11 @@ st.set_page_config(
 from theme import apply_dark_theme
 apply_dark_theme()
 
-# 전역 애니메이션 및 시각적 개선 CSS
-st.markdown("""
+# 부분 리런 데코레이터 (Streamlit 1.37+ st.fragment, 1.33~1.36 st.experimental_fragment, 그 이전은 일반 함수)
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# 전역 애니메이션 및 시각적 개선 CSS (모듈 로드 시 한 번만 생성하는 상수, 인라인으로 주입)
+_HOME_CSS = """
 <style>
 /* 페이지 로딩 애니메이션 */
 @keyframes fadeInUp {
@@ -236,19 +241,21 @@ div[style*="background: linear-gradient"]:hover {
     right: -5px;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_HOME_CSS, unsafe_allow_html=True)
 
 # ====================================
 # 🚀 빠른 액션 버튼 시스템
 # ====================================
 
-def show_quick_actions():
+def show_quick_actions(user, data):
     """
     🎯 목적: 사용자가 자주 사용하는 6개 기능에 원클릭으로 접근할 수 있는 대시보드 제공
     
     📊 입력: 
-    - st.session_state의 사용자 로그인 정보
-    - data (questions, answers, likes 등 활동 데이터)
+    - user (Dict): 현재 로그인 사용자 정보 (없으면 None)
+    - data (Dict): 대시보드 공용 데이터 스냅샷 (questions, answers, likes 등 활동 데이터)
     
     📤 출력:
     - 6개의 그라데이션 카드 UI (2행 3열)
@@ -260,7 +267,7 @@ def show_quick_actions():
     
     📞 호출 관계:
     - 호출자: show_home_dashboard() -> show_quick_actions()
-    - 호출 대상: get_current_user(), initialize_data()
+    - 호출 대상: 없음 (user/data는 main()에서 한 번 조회하여 전달)
     
     🎨 UI 이벤트:
     - '질문 작성하기' 버튼 -> pages/6_📚_AE Help Desk.py
@@ -275,12 +282,7 @@ def show_quick_actions():
     """
     st.markdown("## ⚡ 빠른 액션")
     
-    # STEP 1: 사용자 인증 및 데이터 로딩
-    # 현재 로그인된 사용자 정보와 전체 시스템 데이터를 가져옴
-    user = get_current_user()  # utils.py에서 세션 상태 기반으로 사용자 정보 반환
-    data = initialize_data()   # 모든 질문, 답변, 좋아요 데이터 로딩 (JSON 파일들)
-    
-    # 로그인된 사용자만 빠른 액션 버튼을 볼 수 있음
+    # STEP 1: 로그인된 사용자만 빠른 액션 버튼을 볼 수 있음
     if user:
         # STEP 2: 개인 식별 정보 추출
         user_id = user['user_id']      # 내부 사용자 ID (데이터 필터링용)
@@ -289,15 +291,18 @@ def show_quick_actions():
         # STEP 3: 개인 활동 통계 계산
         # 내가 작성한 질문들만 필터링 (author_id로 구분)
         my_questions = [q for q in data["questions"] if q.get("author_id") == user_id]
-        # 내가 작성한 답변들만 필터링
-        my_answers = [a for a in data["answers"] if a.get("author_id") == user_id]
-        
+        my_question_ids = {q["id"] for q in my_questions}
+
+        # 답변 목록을 한 번만 순회하며 내가 작성한 답변과 내 질문에 달린 답변 수를 함께 계산
         # TODO: 실제 "새" 답변을 구분하는 로직 필요 (현재는 전체 답변 수만 계산)
         # 향후 timestamp 기반으로 마지막 확인 시점 이후 답변만 카운트 필요
+        my_answers = []
         new_answers_count = 0
-        for question in my_questions:
-            question_answers = [a for a in data["answers"] if a["question_id"] == question["id"]]
-            new_answers_count += len(question_answers)
+        for answer in data["answers"]:
+            if answer.get("author_id") == user_id:
+                my_answers.append(answer)
+            if answer.get("question_id") in my_question_ids:
+                new_answers_count += 1
         
         # STEP 4: UI 레이아웃 구성 - 2행 3열 그리드
         # 첫 번째 행: 3개 카드
@@ -377,13 +382,110 @@ def show_quick_actions():
 # 📡 최근 활동 피드 시스템
 # ====================================
 
-def show_recent_activity_feed():
+@st.cache_data(ttl=60, show_spinner=False)
+def _build_activities(user_id: str, data_version, _data) -> list:
+    """
+    최근 활동 목록 구성 (최신순 최대 8개)
+
+    리런마다 질문/답변 전체를 다시 훑지 않도록 (user_id, data_version) 기준으로 캐싱합니다.
+    _data는 해시 대상에서 제외되며, data_version(데이터 파일 stat)이 바뀌면 다시 계산합니다.
+    """
+    data = _data
+    activities = []
+
+    # 질문/답변을 한 번씩만 순회하여 조회용 인덱스와 내 질문/답변 목록을 함께 구성
+    questions_by_id = {}
+    my_questions = []
+    for q in data["questions"]:
+        questions_by_id.setdefault(q["id"], q)
+        if q.get("author_id") == user_id:
+            my_questions.append(q)
+
+    answers_by_qid = {}
+    my_answers = []
+    for a in data["answers"]:
+        answers_by_qid.setdefault(a["question_id"], []).append(a)
+        if a.get("author_id") == user_id:
+            my_answers.append(a)
+    
+    # 1. 내 질문에 달린 새 답변들
+    for question in my_questions[-3:]:  # 최근 3개 질문만
+        question_answers = answers_by_qid.get(question["id"], [])
+        for answer in question_answers[-2:]:  # 질문당 최근 2개 답변
+            activities.append({
+                "type": "new_answer",
+                "timestamp": answer["timestamp"],
+                "data": {
+                    "question_title": question["title"],
+                    "answer_author": answer["author"],
+                    "answer_preview": answer["content"][:100] + "..." if len(answer["content"]) > 100 else answer["content"]
+                }
+            })
+    
+    # 2. 내 답변에 받은 좋아요들  
+    for answer in my_answers[-5:]:  # 최근 5개 답변 확인
+        like_key = f"answer_{answer['id']}"
+        likes = data.get("likes", {}).get(like_key, [])
+        if likes:
+            question = questions_by_id.get(answer["question_id"])
+            if question:
+                activities.append({
+                    "type": "received_likes", 
+                    "timestamp": answer["timestamp"],
+                    "data": {
+                        "question_title": question["title"],
+                        "likes_count": len(likes),
+                        "answer_preview": answer["content"][:80] + "..." if len(answer["content"]) > 80 else answer["content"]
+                    }
+                })
+    
+    # 3. 인기 질문들 (전체 사용자 대상)
+    for question in data["questions"][-10:]:  # 최근 10개 질문 중
+        question_answers = answers_by_qid.get(question["id"], [])
+        if len(question_answers) >= 2:  # 답변이 2개 이상인 질문
+            activities.append({
+                "type": "popular_question",
+                "timestamp": question["timestamp"],
+                "data": {
+                    "question_title": question["title"],
+                    "author": question["author"],
+                    "answers_count": len(question_answers),
+                    "category": question.get("category", "일반")
+                }
+            })
+    
+    # 4. 시스템 업데이트 (가상 데이터)
+    activities.append({
+        "type": "system_update",
+        "timestamp": "2025-09-01 22:00:00",
+        "data": {
+            "title": "🆕 JEDEC SPEC 챗봇 성능 개선",
+            "description": "JEDEC 표준 문서 검색 정확도가 30% 향상되었습니다!"
+        }
+    })
+    
+    activities.append({
+        "type": "system_update", 
+        "timestamp": "2025-09-01 18:00:00",
+        "data": {
+            "title": "✨ 용어집 데이터베이스 업데이트",
+            "description": "새로운 반도체 기술 용어 150개가 추가되었습니다."
+        }
+    })
+    
+    # 시간순 정렬 (최신순)
+    activities.sort(key=lambda x: x["timestamp"], reverse=True)
+
+    return activities[:8]
+
+def show_recent_activity_feed(user, data, data_version):
     """
     🎯 목적: 사용자 개인화된 최근 활동들을 타임라인 형태로 표시하는 피드 시스템
     
     📊 입력:
-    - st.session_state의 사용자 로그인 정보
-    - data (questions.json, answers.json, likes.json 등)
+    - user (Dict): 현재 로그인 사용자 정보 (없으면 None)
+    - data (Dict): 대시보드 공용 데이터 스냅샷 (questions, answers, likes 등)
+    - data_version: get_data_version() 값 (활동 목록 캐시 키)
     
     📤 출력:
     - 4가지 타입의 활동 카드들 (2열 레이아웃)
@@ -393,7 +495,7 @@ def show_recent_activity_feed():
     
     📞 호출 관계:
     - 호출자: show_home_dashboard() -> show_recent_activity_feed()
-    - 호출 대상: get_current_user(), initialize_data(), show_activity_card()
+    - 호출 대상: _build_activities(), _activity_card_html()
     
     🎨 활동 타입별 카드 색상:
     - 💬 새 답변: 파란색 그라데이션 (#e3f2fd -> #bbdefb)
@@ -407,103 +509,39 @@ def show_recent_activity_feed():
     """
     st.markdown("## 📡 최근 활동")
     
-    user = get_current_user()
-    data = initialize_data()
-    
     if user:
         user_id = user['user_id']
         nickname = user['nickname']
         
-        # 활동 데이터 수집
-        activities = []
-        
-        # 1. 내 질문에 달린 새 답변들
-        my_questions = [q for q in data["questions"] if q.get("author_id") == user_id]
-        for question in my_questions[-3:]:  # 최근 3개 질문만
-            question_answers = [a for a in data["answers"] if a["question_id"] == question["id"]]
-            for answer in question_answers[-2:]:  # 질문당 최근 2개 답변
-                activities.append({
-                    "type": "new_answer",
-                    "timestamp": answer["timestamp"],
-                    "data": {
-                        "question_title": question["title"],
-                        "answer_author": answer["author"],
-                        "answer_preview": answer["content"][:100] + "..." if len(answer["content"]) > 100 else answer["content"]
-                    }
-                })
-        
-        # 2. 내 답변에 받은 좋아요들  
-        my_answers = [a for a in data["answers"] if a.get("author_id") == user_id]
-        for answer in my_answers[-5:]:  # 최근 5개 답변 확인
-            like_key = f"answer_{answer['id']}"
-            likes = data.get("likes", {}).get(like_key, [])
-            if likes:
-                question = next((q for q in data["questions"] if q["id"] == answer["question_id"]), None)
-                if question:
-                    activities.append({
-                        "type": "received_likes", 
-                        "timestamp": answer["timestamp"],
-                        "data": {
-                            "question_title": question["title"],
-                            "likes_count": len(likes),
-                            "answer_preview": answer["content"][:80] + "..." if len(answer["content"]) > 80 else answer["content"]
-                        }
-                    })
-        
-        # 3. 인기 질문들 (전체 사용자 대상)
-        for question in data["questions"][-10:]:  # 최근 10개 질문 중
-            question_answers = [a for a in data["answers"] if a["question_id"] == question["id"]]
-            if len(question_answers) >= 2:  # 답변이 2개 이상인 질문
-                activities.append({
-                    "type": "popular_question",
-                    "timestamp": question["timestamp"],
-                    "data": {
-                        "question_title": question["title"],
-                        "author": question["author"],
-                        "answers_count": len(question_answers),
-                        "category": question.get("category", "일반")
-                    }
-                })
-        
-        # 4. 시스템 업데이트 (가상 데이터)
-        activities.append({
-            "type": "system_update",
-            "timestamp": "2025-09-01 22:00:00",
-            "data": {
-                "title": "🆕 JEDEC SPEC 챗봇 성능 개선",
-                "description": "JEDEC 표준 문서 검색 정확도가 30% 향상되었습니다!"
-            }
-        })
-        
-        activities.append({
-            "type": "system_update", 
-            "timestamp": "2025-09-01 18:00:00",
-            "data": {
-                "title": "✨ 용어집 데이터베이스 업데이트",
-                "description": "새로운 반도체 기술 용어 150개가 추가되었습니다."
-            }
-        })
-        
-        # 시간순 정렬 (최신순)
-        activities.sort(key=lambda x: x["timestamp"], reverse=True)
+        # 활동 데이터 수집 (데이터 파일이 바뀌지 않았으면 캐시된 결과 재사용)
+        activities = _build_activities(user_id, data_version, data)
         
         # 활동 피드 표시 (최대 8개)
         if activities:
             col1, col2 = st.columns(2)
-            
-            for i, activity in enumerate(activities[:8]):
-                with col1 if i % 2 == 0 else col2:
-                    show_activity_card(activity, nickname)
+
+            # 열마다 카드 HTML을 모아 한 번의 st.markdown으로 출력 (카드별 호출 대신 열당 1회)
+            cards = [_activity_card_html(activity, nickname) for activity in activities]
+            with col1:
+                st.markdown("".join(cards[0::2]), unsafe_allow_html=True)
+            with col2:
+                st.markdown("".join(cards[1::2]), unsafe_allow_html=True)
         else:
             st.info("💡 아직 활동이 없습니다. 질문하기나 답변하기로 첫 활동을 시작해보세요!")
     
     st.divider()
 
-def show_activity_card(activity, current_nickname):
-    """개별 활동 카드 표시"""
+def _activity_card_html(activity, current_nickname) -> str:
+    """개별 활동 카드 HTML (표시하지 않는 카드는 빈 문자열)"""
+    
+    # 사용자 입력 문자열은 HTML 이스케이프 후 삽입 (unsafe_allow_html 출력이므로 태그/스크립트 주입 방지)
+    # 제목은 50자로 자른 뒤 이스케이프하여 엔티티(&amp; 등)가 중간에서 잘리지 않도록 함
+    info = activity["data"]
+    title = info.get("question_title", "")
+    short_title = escape(title[:50]) + ("..." if len(title) > 50 else "")
     
     if activity["type"] == "new_answer":
-        st.markdown(f"""
+        return f"""
         <div style="background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%); 
                    padding: 1rem; border-radius: 10px; margin-bottom: 0.8rem;
                    border-left: 4px solid #2196f3;">
@@ -512,20 +550,20 @@ def show_activity_card(activity, current_nickname):
                 <strong style="color: #1976d2;">새 답변이 달렸습니다!</strong>
             </div>
             <p style="margin: 0.3rem 0; color: #424242; font-size: 0.9rem;">
-                <strong>질문:</strong> {activity["data"]["question_title"][:50]}{"..." if len(activity["data"]["question_title"]) > 50 else ""}
+                <strong>질문:</strong> {short_title}
             </p>
             <p style="margin: 0.3rem 0; color: #666; font-size: 0.85rem;">
-                <strong>{activity["data"]["answer_author"]}</strong>님이 답변했습니다
+                <strong>{escape(info["answer_author"])}</strong>님이 답변했습니다
             </p>
             <p style="margin: 0.3rem 0; color: #757575; font-size: 0.8rem;">
-                {activity["data"]["answer_preview"]}
+                {escape(info["answer_preview"])}
             </p>
             <small style="color: #999;">{activity["timestamp"]}</small>
         </div>
-        """, unsafe_allow_html=True)
+        """
         
     elif activity["type"] == "received_likes":
-        st.markdown(f"""
+        return f"""
         <div style="background: linear-gradient(135deg, #fce4ec 0%, #f8bbd9 100%); 
                    padding: 1rem; border-radius: 10px; margin-bottom: 0.8rem;
                    border-left: 4px solid #e91e63;">
@@ -534,18 +572,18 @@ def show_activity_card(activity, current_nickname):
                 <strong style="color: #c2185b;">답변에 좋아요 {activity["data"]["likes_count"]}개!</strong>
             </div>
             <p style="margin: 0.3rem 0; color: #424242; font-size: 0.9rem;">
-                <strong>질문:</strong> {activity["data"]["question_title"][:50]}{"..." if len(activity["data"]["question_title"]) > 50 else ""}
+                <strong>질문:</strong> {short_title}
             </p>
             <p style="margin: 0.3rem 0; color: #757575; font-size: 0.8rem;">
-                "{activity["data"]["answer_preview"]}"
+                "{escape(info["answer_preview"])}"
             </p>
             <small style="color: #999;">{activity["timestamp"]}</small>
         </div>
-        """, unsafe_allow_html=True)
+        """
         
     elif activity["type"] == "popular_question":
         if activity["data"]["author"] != current_nickname:  # 내 질문이 아닌 경우만 표시
-            st.markdown(f"""
+            return f"""
             <div style="background: linear-gradient(135deg, #fff3e0 0%, #ffcc02 100%); 
                        padding: 1rem; border-radius: 10px; margin-bottom: 0.8rem;
                        border-left: 4px solid #ff9800;">
@@ -554,20 +592,20 @@ def show_activity_card(activity, current_nickname):
                     <strong style="color: #ef6c00;">인기 질문</strong>
                 </div>
                 <p style="margin: 0.3rem 0; color: #424242; font-size: 0.9rem;">
-                    <strong>{activity["data"]["question_title"]}</strong>
+                    <strong>{escape(title)}</strong>
                 </p>
                 <p style="margin: 0.3rem 0; color: #666; font-size: 0.85rem;">
-                    📂 {activity["data"]["category"]} • 👤 {activity["data"]["author"]}님
+                    📂 {escape(info["category"])} • 👤 {escape(info["author"])}님
                 </p>
                 <p style="margin: 0.3rem 0; color: #757575; font-size: 0.8rem;">
                     💬 {activity["data"]["answers_count"]}개의 답변
                 </p>
                 <small style="color: #999;">{activity["timestamp"]}</small>
             </div>
-            """, unsafe_allow_html=True)
+            """
             
     elif activity["type"] == "system_update":
-        st.markdown(f"""
+        return f"""
         <div style="background: linear-gradient(135deg, #e8f5e8 0%, #c8e6c9 100%); 
                    padding: 1rem; border-radius: 10px; margin-bottom: 0.8rem;
                    border-left: 4px solid #4caf50;">
@@ -580,59 +618,58 @@ def show_activity_card(activity, current_nickname):
             </p>
             <small style="color: #999;">{activity["timestamp"]}</small>
         </div>
-        """, unsafe_allow_html=True)
+        """
+    return ""
+
+def show_activity_card(activity, current_nickname):
+    """개별 활동 카드 표시"""
+    card_html = _activity_card_html(activity, current_nickname)
+    if card_html:
+        st.markdown(card_html, unsafe_allow_html=True)
 
 # ====================================
 # 📢 최근 소식 함수
 # ====================================
 
+# 최근 소식 패널 (정적 HTML - 세 패널을 한 번의 st.markdown으로 출력, 좁은 화면에서는 1열로 전환)
+_RECENT_NEWS_HTML = """
+<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 1rem;">
+    <div style="background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%); 
+               padding: 1.5rem; border-radius: 15px; color: white; margin-bottom: 1rem;
+               box-shadow: 0 4px 15px rgba(255, 107, 107, 0.3);">
+        <h4 style="color: white; margin-bottom: 1rem; text-align: center;">🏆 Best Contributor에 도전하세요 🏆</h4>
+        <div style="font-size: 0.95rem;">
+            <p style="margin: 0.5rem 0; text-align: center; "><strong></strong> </p>
+            <p style="margin: 0.5rem 0; text-align: center; "><strong>활동이 쌓일수록 포인트 UP!</strong></p>
+            <p style="margin: 0.5rem 0; text-align: center; "><strong></strong> </p>
+        </div>
+    </div>
+    <div style="background: linear-gradient(135deg, #74b9ff 0%, #0984e3 100%); 
+               padding: 1.5rem; border-radius: 15px; color: white; margin-bottom: 1rem;
+               box-shadow: 0 4px 15px rgba(116, 185, 255, 0.3);">
+        <h4 style="color: white; margin-bottom: 1rem; text-align: center;">🎮 미션을 완료하고 포인트를 모아보세요!</h4>
+        <div style="font-size: 0.9rem;">
+            <p style="margin: 0.4rem 0; text-align: center; ">MISSION 1: 지식 등록하기</strong> 📚 당신의 노하우를 AE PLUS에 학습시켜주세요</p>
+            <p style="margin: 0.4rem 0; text-align: center; ">MISSION 2: 질문하기</strong>💬 궁금한 점을 팀원들에게 물어보세요</p>
+            <p style="margin: 0.4rem 0; text-align: center; ">MISSION 3: 답변하기</strong>✍️ 팀원들의 질문에 답변을 남겨주세요</p>
+        </div>
+    </div>
+</div>
+<div style="background: linear-gradient(135deg, #00b894 0%, #00a085 100%); 
+           padding: 1.5rem; border-radius: 15px; color: white; margin-bottom: 1.5rem;
+           box-shadow: 0 4px 15px rgba(0, 184, 148, 0.3); text-align: center;">
+    <p style="margin: 0.5rem 0; font-size: 1.1rem;">
+        <strong>🙏 여러분의 의견이 큰 힘이 됩니다. 불편함이 있더라도 양해 부탁드리며, 피드백은 언제나 환영합니다! </strong>  
+    </p>
+</div>
+"""
+
 def show_recent_news():
     """최근 소식 및 업데이트 섹션"""
     st.markdown("## 📢 최근 소식")
     
-    # 2열 레이아웃으로 구성
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # 인기 질문 TOP 3
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%); 
-                   padding: 1.5rem; border-radius: 15px; color: white; margin-bottom: 1rem;
-                   box-shadow: 0 4px 15px rgba(255, 107, 107, 0.3);">
-            <h4 style="color: white; margin-bottom: 1rem; text-align: center;">🏆 Best Contributor에 도전하세요 🏆</h4>
-            <div style="font-size: 0.95rem;">
-                <p style="margin: 0.5rem 0; text-align: center; "><strong></strong> </p>
-                <p style="margin: 0.5rem 0; text-align: center; "><strong>활동이 쌓일수록 포인트 UP!</strong></p>
-                <p style="margin: 0.5rem 0; text-align: center; "><strong></strong> </p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        # 이번 주 업데이트
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #74b9ff 0%, #0984e3 100%); 
-                   padding: 1.5rem; border-radius: 15px; color: white; margin-bottom: 1rem;
-                   box-shadow: 0 4px 15px rgba(116, 185, 255, 0.3);">
-            <h4 style="color: white; margin-bottom: 1rem; text-align: center;">🎮 미션을 완료하고 포인트를 모아보세요!</h4>
-            <div style="font-size: 0.9rem;">
-                <p style="margin: 0.4rem 0; text-align: center; ">MISSION 1: 지식 등록하기</strong> 📚 당신의 노하우를 AE PLUS에 학습시켜주세요</p>
-                <p style="margin: 0.4rem 0; text-align: center; ">MISSION 2: 질문하기</strong>💬 궁금한 점을 팀원들에게 물어보세요</p>
-                <p style="margin: 0.4rem 0; text-align: center; ">MISSION 3: 답변하기</strong>✍️ 팀원들의 질문에 답변을 남겨주세요</p>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # 시스템 공지사항 (전체 너비)
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, #00b894 0%, #00a085 100%); 
-               padding: 1.5rem; border-radius: 15px; color: white; margin-bottom: 1.5rem;
-               box-shadow: 0 4px 15px rgba(0, 184, 148, 0.3); text-align: center;">
-        <p style="margin: 0.5rem 0; font-size: 1.1rem;">
-            <strong>🙏 여러분의 의견이 큰 힘이 됩니다. 불편함이 있더라도 양해 부탁드리며, 피드백은 언제나 환영합니다! </strong>  
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    # 인기 질문 TOP 3 / 이번 주 업데이트 (2열) + 시스템 공지사항 (전체 너비)
+    st.markdown(_RECENT_NEWS_HTML, unsafe_allow_html=True)
     
     st.divider()
 
@@ -640,35 +677,30 @@ def show_recent_news():
 # 🏆 Best Contributor 함수
 # ====================================
 
-def show_hall_of_fame():
-    """포인트 기반 Best Contributor"""
-    data = initialize_data()
-    ranking = get_user_points_ranking(data)
-    
-    if ranking:
-        st.markdown("## 🏆 Best Contributor")
-        st.markdown("<div style='margin-bottom: 1.5rem;'></div>", unsafe_allow_html=True)
-        
-        cols = st.columns(3)
-        medals = ["🥇", "🥈", "🥉"]
-        colors = ["#FFD700", "#C0C0C0", "#CD7F32"]
-        gradients = [
-            "linear-gradient(135deg, #FFD700 0%, #FFA500 100%)",
-            "linear-gradient(135deg, #C0C0C0 0%, #A0A0A0 100%)", 
-            "linear-gradient(135deg, #CD7F32 0%, #8B4513 100%)"
-        ]
-        
-        for i, (username, points) in enumerate(ranking):
-            display_name = resolve_user_label(username)
-            # ⬅️ 핵심: ID → 닉네임/실명
-            if i < 3:
-                with cols[i]:
-                    # 포인트 기반 카드 형태로 표시
-                    st.markdown(
-                        f"""
+_HALL_MEDALS = ["🥇", "🥈", "🥉"]
+_HALL_COLORS = ["#FFD700", "#C0C0C0", "#CD7F32"]
+_HALL_GRADIENTS = [
+    "linear-gradient(135deg, #FFD700 0%, #FFA500 100%)",
+    "linear-gradient(135deg, #C0C0C0 0%, #A0A0A0 100%)", 
+    "linear-gradient(135deg, #CD7F32 0%, #8B4513 100%)"
+]
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _build_hall_of_fame_cards(data_version, _data) -> list:
+    """
+    Best Contributor 상위 3명 카드 HTML 목록
+
+    랭킹 계산과 닉네임 변환(resolve_user_label)을 data_version 기준으로 캐싱하여
+    홈 화면 리런마다 다시 계산하지 않습니다. (닉네임 변경은 ttl 이내에 반영)
+    """
+    cards = []
+    for i, (username, points) in enumerate(get_user_points_ranking(_data, limit=3)):
+        display_name = escape(resolve_user_label(username))
+        # ⬅️ 핵심: ID → 닉네임/실명 (HTML 이스케이프하여 삽입)
+        cards.append(f"""
                         <div style="
-                            background: {gradients[i]};
-                            border: 3px solid {colors[i]};
+                            background: {_HALL_GRADIENTS[i]};
+                            border: 3px solid {_HALL_COLORS[i]};
                             border-radius: 15px;
                             padding: 1.5rem;
                             text-align: center;
@@ -677,7 +709,7 @@ def show_hall_of_fame():
                             transform: scale(1.02);
                             color: white;
                         ">
-                            <div style="font-size: 3rem; margin-bottom: 0.5rem;">{medals[i]}</div>
+                            <div style="font-size: 3rem; margin-bottom: 0.5rem;">{_HALL_MEDALS[i]}</div>
                             <h3 style="margin-bottom: 0.5rem; font-weight: bold;">{display_name}</h3>
                             <p style="margin: 0; font-size: 1.2rem; font-weight: 600;">
                                 {points:,} 포인트
@@ -686,9 +718,22 @@ def show_hall_of_fame():
                                 지식 공유 챔피언
                             </p>
                         </div>
-                        """, 
-                        unsafe_allow_html=True
-                    )
+                        """)
+    return cards
+
+def show_hall_of_fame(data, data_version):
+    """포인트 기반 Best Contributor"""
+    cards = _build_hall_of_fame_cards(data_version, data)
+    
+    if cards:
+        st.markdown("## 🏆 Best Contributor")
+        st.markdown("<div style='margin-bottom: 1.5rem;'></div>", unsafe_allow_html=True)
+        
+        cols = st.columns(3)
+        for col, card_html in zip(cols, cards):
+            with col:
+                # 포인트 기반 카드 형태로 표시
+                st.markdown(card_html, unsafe_allow_html=True)
     else:
         st.markdown("## 🏆 Best Contributor")
         st.info("🎯 아직 포인트를 획득한 사용자가 없습니다. 첫 번째 챔피언이 되어보세요!")
@@ -723,16 +768,12 @@ def main():
     
     📞 호출 관계:
     - 호출자: Streamlit 앱 엔트리포인트 (__name__ == "__main__")
-    - 호출 대상: initialize_session_state(), require_login(), setup_sidebar(), show_home_dashboard()
+    - 호출 대상: require_login(), get_current_user(), load_data_snapshot(), setup_sidebar(), show_home_dashboard()
     
     ⚡ 처리 흐름:
-    세션 초기화 -> 로그인 검증 -> 사이드바 설정 -> 메인 대시보드 표시
+    세션 초기화 -> 로그인 검증 -> 사용자/데이터 조회 (1회) -> 사이드바 설정 -> 메인 대시보드 표시
     """
     
-    # STEP 1: 세션 상태 초기화
-    # Streamlit의 st.session_state에 앱 전역 상태 설정 (사용자 정보, 설정값 등)
-    initialize_session_state()  # utils.py의 함수, 기본값 설정 및 상태 복원
-    
     # STEP 1.5: 세션 유효성 검사 및 자동 연장
     # 로그인된 사용자의 세션 유효기간을 확인하고 자동으로 연장
     check_session_validity()
@@ -742,21 +783,25 @@ def main():
     if not require_login():  # utils.py의 함수, False 반환 시 이미 리다이렉트 처리됨
         return  # 미인증 사용자는 여기서 종료 (로그인 페이지로 이동됨)
     
+    # STEP 2.5: 사용자 정보 및 데이터 스냅샷 조회 (한 번만 조회하여 사이드바/대시보드에 전달)
+    user = get_current_user()
+    data = load_data_snapshot()
+    data_version = get_data_version()
+    
     # STEP 3: 사이드바 UI 구성
     # 사용자 정보, 네비게이션 등
-    setup_sidebar()
+    setup_sidebar(user)
     
     # STEP 4: 메인 콘텐츠 영역 렌더링
     # 빠른 액션, 최근 활동, Best Contributor, 서비스 소개 등
-    show_home_dashboard()
+    show_home_dashboard(user, data, data_version)
 
-def setup_sidebar():
+def setup_sidebar(user):
     """공통 사이드바 설정"""
     with st.sidebar:
         # 사용자 정보 섹션
         st.markdown("### 👤 사용자 정보")
         
-        user = get_current_user()
         if user:
             # 로그인된 사용자 정보 표시
             st.success(f"👋 **{user['nickname']}**님 환영합니다!")
@@ -791,36 +836,58 @@ def setup_sidebar():
         
         st.divider()
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_user_records(user_id: str, data_version, _data) -> tuple:
+    """
+    사용자가 작성한 (질문 목록, 답변 목록)
+
+    사이드바가 그려질 때마다 전체 질문/답변을 훑지 않도록 (user_id, data_version) 기준으로 캐싱합니다.
+    """
+    my_questions = [q for q in _data["questions"] if q.get("author_id") == user_id]
+    my_answers = [a for a in _data["answers"] if a.get("author_id") == user_id]
+    return my_questions, my_answers
+
+@_fragment
 def show_user_activity_summary(user):
-    """사용자 활동 요약 표시"""
-    data = initialize_data()
+    """
+    사용자 활동 요약 표시
+
+    fragment로 실행되므로 '상세 활동 내역 보기' 버튼은 홈 대시보드 전체가 아닌 이 영역만 다시 실행합니다.
+    """
+    data = load_data_snapshot()
     user_id = user['user_id']
     
     st.markdown("**📊 나의 활동 현황**")
     
     # 활동 통계
-    my_questions = [q for q in data["questions"] if q.get("author_id") == user_id]
-    my_answers = [a for a in data["answers"] if a.get("author_id") == user_id]
-    
-    # 통계 카드
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.metric("🙋‍♂️ 내 질문", len(my_questions))
-        st.metric("💬 내 답변", len(my_answers))
-    
-    with col2:
-        # 내 답변에 받은 좋아요 수
-        total_likes = 0
-        for answer in my_answers:
-            like_key = f"answer_{answer['id']}"
-            likes = data.get("likes", {}).get(like_key, [])
-            total_likes += len(likes)
-        st.metric("❤️ 받은 좋아요", total_likes)
-        
-        # 포인트 계산
-        total_points = len(my_questions) * 100 + len(my_answers) * 100
-        st.metric("🏆 획득 포인트", total_points)
+    my_questions, my_answers = _get_user_records(user_id, get_data_version(), data)
+    likes_by_answer = data.get("likes", {})
+    
+    # 내 답변에 받은 좋아요 수 (좋아요 맵은 한 번만 조회)
+    total_likes = sum(len(likes_by_answer.get(f"answer_{a['id']}", ())) for a in my_answers)
+    
+    # 포인트 계산
+    total_points = len(my_questions) * 100 + len(my_answers) * 100
+    
+    # 통계 카드 - 2x2 그리드를 한 번의 st.markdown으로 출력 (st.columns + st.metric 4개 대신)
+    metrics = [
+        ("🙋‍♂️ 내 질문", len(my_questions)),
+        ("❤️ 받은 좋아요", total_likes),
+        ("💬 내 답변", len(my_answers)),
+        ("🏆 획득 포인트", total_points),
+    ]
+    metric_cells = "".join(
+        f"""<div style="background: rgba(255, 255, 255, 0.1); border: 1px solid rgba(255, 255, 255, 0.2);
+                    border-radius: 8px; padding: 0.75rem;">
+            <div style="font-size: 0.85rem; opacity: 0.8;">{label}</div>
+            <div style="font-size: 1.6rem; font-weight: 600;">{value:,}</div>
+        </div>"""
+        for label, value in metrics
+    )
+    st.markdown(
+        f'<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 0.5rem; margin-bottom: 1rem;">{metric_cells}</div>',
+        unsafe_allow_html=True
+    )
     
     if st.button("📋 상세 활동 내역 보기", use_container_width=True):
         st.session_state.show_detailed_activity = True
@@ -834,20 +901,29 @@ def show_user_activity_summary(user):
         if my_questions:
             st.markdown("**🙋‍♂️ 최근 질문 (최대 3개)**")
             recent_questions = sorted(my_questions, key=lambda x: x["timestamp"], reverse=True)[:3]
-            for question in recent_questions:
-                question_answers = [a for a in data["answers"] if a["question_id"] == question["id"]]
-                st.markdown(f"• {question['title']} ({len(question_answers)}개 답변) - {question['timestamp']}")
+            # 표시할 질문의 답변 수만 한 번의 순회로 집계
+            answer_counts = dict.fromkeys((q["id"] for q in recent_questions), 0)
+            for a in data["answers"]:
+                if a["question_id"] in answer_counts:
+                    answer_counts[a["question_id"]] += 1
+            st.markdown("\n\n".join(
+                f"• {question['title']} ({answer_counts[question['id']]}개 답변) - {question['timestamp']}"
+                for question in recent_questions
+            ))
         
         # 최근 답변 3개
         if my_answers:
             st.markdown("**💬 최근 답변 (최대 3개)**")
             recent_answers = sorted(my_answers, key=lambda x: x["timestamp"], reverse=True)[:3]
+            questions_by_id = get_questions_by_id(data)
+            answer_lines = []
             for answer in recent_answers:
-                question = next((q for q in data["questions"] if q["id"] == answer["question_id"]), None)
+                question = questions_by_id.get(answer["question_id"])
                 if question:
-                    like_key = f"answer_{answer['id']}"
-                    likes = data.get("likes", {}).get(like_key, [])
-                    st.markdown(f"• Re: {question['title']} (❤️{len(likes)}) - {answer['timestamp']}")
+                    likes = likes_by_answer.get(f"answer_{answer['id']}", [])
+                    answer_lines.append(f"• Re: {question['title']} (❤️{len(likes)}) - {answer['timestamp']}")
+            if answer_lines:
+                st.markdown("\n\n".join(answer_lines))
         
         if st.button("🔼 접기"):
             st.session_state.show_detailed_activity = False
@@ -895,8 +971,8 @@ def show_navigation_menu():
             else:
                 st.switch_page(item["page"])
 
-def show_home_dashboard():
-    """홈 대시보드 메인 콘텐츠"""
+def show_home_dashboard(user, data, data_version):
+    """홈 대시보드 메인 콘텐츠 (user/data/data_version은 main()에서 한 번 조회하여 전달)"""
     
     # 메인 헤더
     st.markdown("""
@@ -908,7 +984,6 @@ def show_home_dashboard():
     """, unsafe_allow_html=True)
     
     # 사용자 환영 메시지
-    user = get_current_user()
     if user:
         st.markdown(f"""
         <div style="background: linear-gradient(90deg, #667eea 0%, #764ba2 100%); 
@@ -919,16 +994,16 @@ def show_home_dashboard():
         """, unsafe_allow_html=True)
     
     # Best Contributor 섹션
-    show_hall_of_fame()
+    show_hall_of_fame(data, data_version)
     
     # 최근 소식 섹션
     show_recent_news()
     
     # 빠른 액션 버튼 섹션
-    show_quick_actions()
+    show_quick_actions(user, data)
     
     # 최근 활동 피드 섹션
-    show_recent_activity_feed()
+    show_recent_activity_feed(user, data, data_version)
     
     
     # 푸터